@@ -22,7 +22,7 @@ from __future__ import annotations
 import os
 import sys
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional
 
 # 프로젝트 루트 경로 설정
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
@@ -40,6 +40,7 @@ from backend.sermon_agent.state.sermon_state import State
 from backend.sermon_agent.nodes.query_router import query_router_node
 from backend.sermon_agent.nodes.sermon_retriever import sermon_retriever_node
 from backend.sermon_agent.nodes.answer_creator import answer_creator_node
+from backend.sermon_agent.utils.session_store import ConversationSession, get_session_store
 
 # LangSmith (선택적)
 try:
@@ -146,69 +147,23 @@ def get_graph():
 # 대화 세션 관리
 # ─────────────────────────────────────────────────────────
 
-class ConversationSession:
-    """멀티턴 대화 세션 관리."""
-
-    def __init__(self, session_id: str = "default", max_history: int = 10):
-        self.session_id = session_id
-        self.max_history = max_history
-        self.history: List[Dict[str, str]] = []  # [{"role": "user/assistant", "content": "..."}]
-        self.turn_count = 0
-        self.created_at = _now_iso()
-        self.last_rag_snippets: List[Dict] = []  # 최근 검색 결과 저장
-
-    def add_user_message(self, content: str):
-        """사용자 메시지 추가."""
-        self.history.append({"role": "user", "content": content})
-        self.turn_count += 1
-        self._trim_history()
-
-    def add_assistant_message(self, content: str):
-        """어시스턴트 응답 추가."""
-        self.history.append({"role": "assistant", "content": content})
-        self._trim_history()
-
-    def _trim_history(self):
-        """히스토리 크기 제한."""
-        if len(self.history) > self.max_history * 2:
-            self.history = self.history[-self.max_history * 2:]
-
-    def get_context_summary(self) -> str:
-        """대화 컨텍스트 요약 생성."""
-        if not self.history:
-            return ""
-
-        lines = ["[이전 대화 내용]"]
-        for msg in self.history[-6:]:  # 최근 3턴만
-            role = "사용자" if msg["role"] == "user" else "AI"
-            content = msg["content"][:200] + "..." if len(msg["content"]) > 200 else msg["content"]
-            lines.append(f"{role}: {content}")
-        lines.append("")
-
-        return "\n".join(lines)
-
-    def clear(self):
-        """대화 내역 초기화."""
-        self.history = []
-        self.turn_count = 0
-        self.last_rag_snippets = []
-
-
-# 전역 세션 저장소
-_sessions: Dict[str, ConversationSession] = {}
+# 세션은 세션 저장소(SESSION_STORE_BACKEND: memory LRU+TTL / sqlite)에 보관한다.
+# get_session으로 읽은 세션을 수정했다면 save_session으로 저장해야 반영된다.
 
 
 def get_session(session_id: str = "default") -> ConversationSession:
     """세션 가져오기 (없으면 생성)."""
-    if session_id not in _sessions:
-        _sessions[session_id] = ConversationSession(session_id)
-    return _sessions[session_id]
+    return get_session_store().load(session_id)
+
+
+def save_session(session: ConversationSession):
+    """세션 저장."""
+    get_session_store().save(session)
 
 
 def clear_session(session_id: str = "default"):
     """세션 초기화."""
-    if session_id in _sessions:
-        _sessions[session_id].clear()
+    get_session_store().delete(session_id)
 
 
 # ─────────────────────────────────────────────────────────
@@ -295,7 +250,8 @@ def run_pipeline(
     # RAG 스니펫 저장 (후속 질문 참조용)
     rag_snippets = result.get("rag_snippets", [])
     if rag_snippets:
-        session.last_rag_snippets = rag_snippets
+        session.set_rag_snippets(rag_snippets)
+    save_session(session)
 
     return {
         "answer": answer_text,
@@ -1,12 +1,21 @@
 # backend/auth/__init__.py
 """인증 모듈"""
 
-from backend.auth.utils import hash_password, verify_password, create_access_token, decode_access_token
+from backend.auth.utils import (
+    hash_password,
+    verify_password,
+    hash_password_async,
+    verify_password_async,
+    create_access_token,
+    decode_access_token,
+)
 from backend.auth.routes import router as auth_router
 
 __all__ = [
     "hash_password",
     "verify_password",
+    "hash_password_async",
+    "verify_password_async",
     "create_access_token",
     "decode_access_token",
     "auth_router",
@@ -0,0 +1,140 @@
+# backend/auth/cache.py
+# -*- coding: utf-8 -*-
+"""
+인증 캐시 (프로세스 내, uvicorn 워커마다 따로 유지)
+
+- 토큰 검증 캐시: SHA-256(토큰) → 디코딩된 claims
+    - 항목 수명은 min(AUTH_TOKEN_CACHE_TTL_SECONDS, 토큰 만료까지 남은 시간)
+    - 원본 토큰은 저장하지 않는다
+- 사용자 프로필 캐시: user_id → {id, email, role, name} (password_hash 제외)
+    - 짧은 TTL (AUTH_PROFILE_CACHE_TTL_SECONDS)
+    - 프로필 수정/가입/로그인 시 이 워커의 항목을 갱신하고, 다른 워커는 TTL이 지나면 반영
+
+둘 다 맞으면 /auth/me는 DB 왕복 없이 응답한다. 적중률은 /metrics의 auth_cache_requests_total.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from cachetools import TLRUCache, TTLCache
+
+from backend.sermon_agent.utils import metrics
+
+AUTH_TOKEN_CACHE_TTL_SECONDS = float(os.getenv("AUTH_TOKEN_CACHE_TTL_SECONDS", "300"))
+AUTH_TOKEN_CACHE_MAX_ENTRIES = int(os.getenv("AUTH_TOKEN_CACHE_MAX_ENTRIES", "10000"))
+AUTH_PROFILE_CACHE_TTL_SECONDS = float(os.getenv("AUTH_PROFILE_CACHE_TTL_SECONDS", "60"))
+AUTH_PROFILE_CACHE_MAX_ENTRIES = int(os.getenv("AUTH_PROFILE_CACHE_MAX_ENTRIES", "10000"))
+
+# 프로필 캐시에 담는 필드
+PROFILE_FIELDS = ("id", "email", "role", "name")
+
+_REQUESTS = metrics.counter("auth_cache_requests_total", "Auth cache lookups by cache and result")
+
+_lock = threading.Lock()
+
+
+def _token_ttu(_key: str, claims: Dict[str, Any], now: float) -> float:
+    # TLRUCache 타이머(monotonic) 기준 만료 시각: 설정 TTL과 토큰 exp 중 이른 쪽
+    remaining = AUTH_TOKEN_CACHE_TTL_SECONDS
+    exp = claims.get("exp")
+    if exp is not None:
+        remaining = min(remaining, float(exp) - time.time())
+    return now + remaining
+
+
+_token_cache: TLRUCache = TLRUCache(maxsize=max(AUTH_TOKEN_CACHE_MAX_ENTRIES, 1), ttu=_token_ttu)
+_profile_cache: TTLCache = TTLCache(
+    maxsize=max(AUTH_PROFILE_CACHE_MAX_ENTRIES, 1), ttl=max(AUTH_PROFILE_CACHE_TTL_SECONDS, 0)
+)
+
+
+def _count(cache: str, hit: bool) -> None:
+    _REQUESTS.inc(labels={"cache": cache, "result": "hit" if hit else "miss"})
+
+
+def token_key(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+# ─────────────────────────────────────────────────────────
+# 토큰 검증 캐시
+# ─────────────────────────────────────────────────────────
+
+
+def get_token_claims(token: str) -> Optional[Dict[str, Any]]:
+    """캐시된 claims (없거나 만료면 None)."""
+    if AUTH_TOKEN_CACHE_TTL_SECONDS <= 0:
+        return None
+    with _lock:
+        claims = _token_cache.get(token_key(token))
+    _count("token", claims is not None)
+    return claims
+
+
+def put_token_claims(token: str, claims: Dict[str, Any]) -> None:
+    """검증된 토큰의 claims 저장 (이미 만료된 토큰은 저장하지 않음)."""
+    if AUTH_TOKEN_CACHE_TTL_SECONDS <= 0:
+        return
+    exp = claims.get("exp")
+    if exp is not None and float(exp) <= time.time():
+        return
+    with _lock:
+        _token_cache[token_key(token)] = claims
+
+
+# ─────────────────────────────────────────────────────────
+# 사용자 프로필 캐시
+# ─────────────────────────────────────────────────────────
+
+
+def get_profile(user_id: int) -> Optional[Dict[str, Any]]:
+    """캐시된 사용자 프로필 (없으면 None)."""
+    if AUTH_PROFILE_CACHE_TTL_SECONDS <= 0:
+        return None
+    with _lock:
+        profile = _profile_cache.get(user_id)
+    _count("profile", profile is not None)
+    return dict(profile) if profile is not None else None
+
+
+def put_profile(user: Dict[str, Any]) -> None:
+    """사용자 행을 프로필 캐시에 저장 (PROFILE_FIELDS만, password_hash는 버림)."""
+    if AUTH_PROFILE_CACHE_TTL_SECONDS <= 0:
+        return
+    profile = {field: user.get(field) for field in PROFILE_FIELDS}
+    with _lock:
+        _profile_cache[profile["id"]] = profile
+
+
+def invalidate_profile(user_id: int) -> None:
+    """프로필 변경 시 이 워커의 캐시 항목 제거."""
+    with _lock:
+        _profile_cache.pop(user_id, None)
+
+
+def clear() -> None:
+    with _lock:
+        _token_cache.clear()
+        _profile_cache.clear()
+
+
+def get_auth_cache_stats() -> Dict[str, Any]:
+    """캐시 크기 + 적중/미적중 수."""
+    with _lock:
+        _token_cache.expire()
+        _profile_cache.expire()
+        sizes = {"token": len(_token_cache), "profile": len(_profile_cache)}
+    stats: Dict[str, Any] = {}
+    for cache, size in sizes.items():
+        hits = _REQUESTS.value({"cache": cache, "result": "hit"})
+        misses = _REQUESTS.value({"cache": cache, "result": "miss"})
+        stats[cache] = {
+            "entries": size,
+            "hits": int(hits),
+            "misses": int(misses),
+            "hit_rate": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+        }
+    return stats
@@ -0,0 +1,165 @@
+# backend/auth/db.py
+# -*- coding: utf-8 -*-
+"""
+인증 DB 접근 (psycopg3 비동기 연결 풀)
+
+- 요청마다 새로 연결하지 않고 공유 AsyncConnectionPool을 사용 (이벤트 루프를 막지 않음)
+- 쿼리는 prepared statement로 실행 (DB_PREPARE_STATEMENTS)
+- 회원가입은 users + profiles INSERT를 SQL 1회로 처리 (이메일 중복은 ON CONFLICT로 판별)
+- 풀 대기/점유 시간은 /metrics의 db_pool_*{pool="auth"}
+"""
+
+import asyncio
+import os
+from typing import Any, Dict, Optional
+
+from dotenv import load_dotenv
+from psycopg.rows import dict_row
+
+from backend.sermon_agent.utils.db_pool import (
+    DB_PREPARE_STATEMENTS,
+    InstrumentedAsyncConnectionPool,
+    create_async_pool,
+)
+
+load_dotenv()
+
+DATABASE_URL = os.getenv("DATABASE_URL")
+if DATABASE_URL and DATABASE_URL.startswith("postgresql+psycopg://"):
+    DATABASE_URL = DATABASE_URL.replace("postgresql+psycopg://", "postgresql://", 1)
+
+# 인증 쿼리를 동시에 처리할 연결 수 (짧은 쿼리라 검색 풀보다 작게)
+AUTH_DB_POOL_CONCURRENCY = int(os.getenv("AUTH_DB_POOL_CONCURRENCY", "4"))
+
+_pool: Optional[InstrumentedAsyncConnectionPool] = None
+_pool_lock = asyncio.Lock()
+
+
+# ─────────────────────────────────────────────────────────
+# SQL
+# ─────────────────────────────────────────────────────────
+
+USER_BY_EMAIL_SQL = """
+    SELECT u.id, u.email, u.password_hash, u.role, p.name
+    FROM users u
+    LEFT JOIN profiles p ON u.id = p.user_id
+    WHERE u.email = %(email)s
+"""
+
+USER_BY_ID_SQL = """
+    SELECT u.id, u.email, u.role, p.name
+    FROM users u
+    LEFT JOIN profiles p ON u.id = p.user_id
+    WHERE u.id = %(user_id)s
+"""
+
+# 이메일이 이미 있으면 행 없이 끝난다 (profiles INSERT도 건너뜀)
+CREATE_USER_SQL = """
+    WITH u AS (
+        INSERT INTO users (email, password_hash, role)
+        VALUES (%(email)s, %(password_hash)s, %(role)s)
+        ON CONFLICT (email) DO NOTHING
+        RETURNING id, email, role, created_at
+    ), p AS (
+        INSERT INTO profiles (user_id, name)
+        SELECT id, %(name)s::text FROM u WHERE %(name)s::text IS NOT NULL
+    )
+    SELECT id, email, role, created_at FROM u
+"""
+
+# 프로필 행이 없던 사용자(이름 없이 가입)는 새로 만든다
+UPDATE_PROFILE_SQL = """
+    WITH upd AS (
+        UPDATE profiles SET name = %(name)s WHERE user_id = %(user_id)s
+        RETURNING user_id
+    ), ins AS (
+        INSERT INTO profiles (user_id, name)
+        SELECT %(user_id)s, %(name)s::text
+        WHERE NOT EXISTS (SELECT 1 FROM upd) AND EXISTS (SELECT 1 FROM users WHERE id = %(user_id)s)
+        RETURNING user_id
+    )
+    SELECT u.id, u.email, u.role, %(name)s::text AS name
+    FROM users u
+    WHERE u.id = %(user_id)s
+"""
+
+
+# ─────────────────────────────────────────────────────────
+# 연결 풀
+# ─────────────────────────────────────────────────────────
+
+
+async def get_pool() -> InstrumentedAsyncConnectionPool:
+    """인증용 비동기 연결 풀 (싱글톤, 첫 호출 시 생성)."""
+    global _pool
+    if _pool is None:
+        async with _pool_lock:
+            if _pool is None:
+                if not DATABASE_URL:
+                    raise RuntimeError("DATABASE_URL not configured")
+                _pool = await create_async_pool(
+                    DATABASE_URL, name="auth", concurrency=AUTH_DB_POOL_CONCURRENCY
+                )
+    return _pool
+
+
+async def close_pool() -> None:
+    """풀 종료 (서버 종료 시)."""
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
+
+
+async def _fetch_one(sql: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    pool = await get_pool()
+    async with pool.connection() as conn:
+        async with conn.cursor(row_factory=dict_row) as cur:
+            await cur.execute(sql, params, prepare=DB_PREPARE_STATEMENTS)
+            return await cur.fetchone()
+
+
+# ─────────────────────────────────────────────────────────
+# 사용자 조회 / 생성
+# ─────────────────────────────────────────────────────────
+
+
+async def fetch_user_by_email(email: str) -> Optional[Dict[str, Any]]:
+    """이메일로 사용자 조회 (id, email, password_hash, role, name)."""
+    return await _fetch_one(USER_BY_EMAIL_SQL, {"email": email})
+
+
+async def fetch_user_by_id(user_id: int) -> Optional[Dict[str, Any]]:
+    """id로 사용자 조회 (id, email, role, name)."""
+    return await _fetch_one(USER_BY_ID_SQL, {"user_id": user_id})
+
+
+async def insert_user(
+    email: str,
+    password_hash: str,
+    role: str = "user",
+    name: Optional[str] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    사용자 + 프로필 생성.
+
+    Returns:
+        생성된 사용자 (id, email, role, created_at, name). 이메일이 이미 있으면 None.
+    """
+    user = await _fetch_one(
+        CREATE_USER_SQL,
+        {"email": email, "password_hash": password_hash, "role": role, "name": name},
+    )
+    if user is None:
+        return None
+    return {**user, "name": name}
+
+
+async def update_profile_name(user_id: int, name: Optional[str]) -> Optional[Dict[str, Any]]:
+    """
+    프로필 이름 수정.
+
+    Returns:
+        수정된 사용자 (id, email, role, name). 사용자가 없으면 None.
+    """
+    return await _fetch_one(UPDATE_PROFILE_SQL, {"user_id": user_id, "name": name})
@@ -5,41 +5,30 @@
 
 - POST /auth/signup - 회원가입
 - POST /auth/login - 로그인
-- GET /auth/me - 현재 사용자 정보
+- GET /auth/me - 현재 사용자 정보 (토큰/프로필 캐시 적중 시 DB 조회 없음)
+- PATCH /auth/me - 프로필(이름) 수정
 """
 
-import os
 from typing import Optional
 
-import psycopg2
-from psycopg2.extras import RealDictCursor
 from fastapi import APIRouter, HTTPException, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel, EmailStr
-from dotenv import load_dotenv
 
+from backend.auth import cache as auth_cache
+from backend.auth.db import fetch_user_by_email, fetch_user_by_id, insert_user, update_profile_name
 from backend.auth.utils import (
-    hash_password,
-    verify_password,
+    AUTH_HASH_RETRY_AFTER,
+    HashPoolSaturated,
+    hash_password_async,
+    verify_password_async,
     create_access_token,
     decode_access_token,
 )
 
-load_dotenv()
-
 router = APIRouter(prefix="/auth", tags=["auth"])
 security = HTTPBearer(auto_error=False)
 
-# DB 연결
-DATABASE_URL = os.getenv("DATABASE_URL")
-
-
-def get_db_connection():
-    """DB 연결 생성."""
-    if not DATABASE_URL:
-        raise HTTPException(status_code=500, detail="DATABASE_URL not configured")
-    return psycopg2.connect(DATABASE_URL, cursor_factory=RealDictCursor)
-
 
 # ─────────────────────────────────────────────────────────
 # Pydantic 모델
@@ -65,6 +54,10 @@ class AuthResponse(BaseModel):
     access_token: str
 
 
+class ProfileUpdateRequest(BaseModel):
+    name: Optional[str] = None
+
+
 class UserResponse(BaseModel):
     user_id: int
     email: str
@@ -77,60 +70,31 @@ class UserResponse(BaseModel):
 # ─────────────────────────────────────────────────────────
 
 
-def get_user_by_email(email: str) -> Optional[dict]:
+async def get_user_by_email(email: str) -> Optional[dict]:
     """이메일로 사용자 조회."""
-    conn = get_db_connection()
-    try:
-        with conn.cursor() as cur:
-            cur.execute(
-                """
-                SELECT u.id, u.email, u.password_hash, u.role, p.name
-                FROM users u
-                LEFT JOIN profiles p ON u.id = p.user_id
-                WHERE u.email = %s
-                """,
-                (email,),
-            )
-            return cur.fetchone()
-    finally:
-        conn.close()
-
-
-def create_user(email: str, password: str, name: Optional[str] = None) -> dict:
-    """새 사용자 생성."""
-    password_hash = hash_password(password)
-
-    conn = get_db_connection()
+    return await fetch_user_by_email(email)
+
+
+def _hashing_busy() -> HTTPException:
+    """bcrypt 작업 풀 포화 → 429 (클라이언트는 Retry-After 후 재시도)."""
+    return HTTPException(
+        status_code=429,
+        detail="요청이 많아 잠시 후 다시 시도해 주세요.",
+        headers={"Retry-After": str(AUTH_HASH_RETRY_AFTER)},
+    )
+
+
+async def create_user(email: str, password: str, name: Optional[str] = None) -> dict:
+    """새 사용자 생성 (이메일 중복이면 400, 해싱 풀 포화면 429)."""
     try:
-        with conn.cursor() as cur:
-            # users 테이블에 삽입
-            cur.execute(
-                """
-                INSERT INTO users (email, password_hash, role)
-                VALUES (%s, %s, %s)
-                RETURNING id, email, role, created_at
-                """,
-                (email, password_hash, "user"),
-            )
-            user = cur.fetchone()
-
-            # profiles 테이블에 삽입 (이름이 있으면)
-            if name:
-                cur.execute(
-                    """
-                    INSERT INTO profiles (user_id, name)
-                    VALUES (%s, %s)
-                    """,
-                    (user["id"], name),
-                )
-
-            conn.commit()
-            return {**user, "name": name}
-    except psycopg2.errors.UniqueViolation:
-        conn.rollback()
+        password_hash = await hash_password_async(password)
+    except HashPoolSaturated:
+        raise _hashing_busy()
+
+    user = await insert_user(email, password_hash, "user", name)
+    if user is None:
         raise HTTPException(status_code=400, detail="이미 등록된 이메일입니다.")
-    finally:
-        conn.close()
+    return user
 
 
 async def get_current_user(
@@ -140,9 +104,13 @@ async def get_current_user(
     if not credentials:
         return None
 
-    payload = decode_access_token(credentials.credentials)
-    if not payload:
-        return None
+    token = credentials.credentials
+    payload = auth_cache.get_token_claims(token)
+    if payload is None:
+        payload = decode_access_token(token)
+        if not payload:
+            return None
+        auth_cache.put_token_claims(token, payload)
 
     return {
         "user_id": int(payload["sub"]),
@@ -161,21 +129,16 @@ async def signup(payload: SignupRequest) -> AuthResponse:
     """
     회원가입 API.
 
-    - 이메일 중복 검사
-    - 비밀번호 해싱 후 저장
+    - 비밀번호 해싱 후 저장 (이메일 중복은 INSERT 시 판별, DB 왕복 1회)
     - JWT 토큰 발급
     """
-    # 이메일 중복 확인
-    existing = get_user_by_email(payload.email)
-    if existing:
-        raise HTTPException(status_code=400, detail="이미 등록된 이메일입니다.")
-
     # 비밀번호 길이 검증
     if len(payload.password) < 6:
         raise HTTPException(status_code=400, detail="비밀번호는 6자 이상이어야 합니다.")
 
-    # 사용자 생성
-    user = create_user(payload.email, payload.password, payload.name)
+    # 사용자 생성 (이메일 중복이면 400)
+    user = await create_user(payload.email, payload.password, payload.name)
+    auth_cache.put_profile(user)
 
     # JWT 토큰 생성
     token = create_access_token(user["id"], user["email"], user["role"])
@@ -199,13 +162,18 @@ async def login(payload: LoginRequest) -> AuthResponse:
     - JWT 토큰 발급
     """
     # 사용자 조회
-    user = get_user_by_email(payload.email)
+    user = await get_user_by_email(payload.email)
     if not user:
         raise HTTPException(status_code=401, detail="이메일 또는 비밀번호가 올바르지 않습니다.")
 
-    # 비밀번호 검증
-    if not verify_password(payload.password, user["password_hash"]):
+    # 비밀번호 검증 (bcrypt 작업 풀, 포화면 429)
+    try:
+        valid = await verify_password_async(payload.password, user["password_hash"])
+    except HashPoolSaturated:
+        raise _hashing_busy()
+    if not valid:
         raise HTTPException(status_code=401, detail="이메일 또는 비밀번호가 올바르지 않습니다.")
+    auth_cache.put_profile(user)
 
     # JWT 토큰 생성
     token = create_access_token(user["id"], user["email"], user["role"])
@@ -229,10 +197,40 @@ async def get_me(current_user: dict = Depends(get_current_user)) -> UserResponse
     if not current_user:
         raise HTTPException(status_code=401, detail="로그인이 필요합니다.")
 
-    # DB에서 최신 정보 조회
-    user = get_user_by_email(current_user["email"])
+    # 프로필 캐시 → 없으면 DB 조회 (짧은 TTL 동안 재사용)
+    user = auth_cache.get_profile(current_user["user_id"])
+    if user is None:
+        user = await fetch_user_by_id(current_user["user_id"])
+        if not user:
+            raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
+        auth_cache.put_profile(user)
+
+    return UserResponse(
+        user_id=user["id"],
+        email=user["email"],
+        name=user.get("name"),
+        role=user["role"],
+    )
+
+
+@router.patch("/me", response_model=UserResponse)
+async def update_me(
+    payload: ProfileUpdateRequest,
+    current_user: dict = Depends(get_current_user),
+) -> UserResponse:
+    """
+    프로필(이름) 수정.
+
+    - 수정 후 이 워커의 프로필 캐시를 새 값으로 교체
+    """
+    if not current_user:
+        raise HTTPException(status_code=401, detail="로그인이 필요합니다.")
+
+    auth_cache.invalidate_profile(current_user["user_id"])
+    user = await update_profile_name(current_user["user_id"], payload.name)
     if not user:
         raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
+    auth_cache.put_profile(user)
 
     return UserResponse(
         user_id=user["id"],
@@ -5,9 +5,18 @@
 
 - 비밀번호 해싱 (bcrypt)
 - JWT 토큰 생성/검증
+
+bcrypt는 의도적으로 느린 CPU 작업(요청당 수백 ms)이라 async 핸들러에서 직접 부르면
+같은 워커의 다른 요청(채팅 스트림 등)이 모두 멈춘다. 핸들러는 *_async 함수를 사용해
+전용 스레드풀에서 실행한다 (bcrypt는 해싱 중 GIL을 놓으므로 스레드로 병렬 처리된다).
+실행 중 + 대기 작업이 상한을 넘으면 HashPoolSaturated를 던지고, 라우트가 429로 응답한다.
 """
 
+import asyncio
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
@@ -15,6 +24,8 @@ import bcrypt
 import jwt
 from dotenv import load_dotenv
 
+from backend.sermon_agent.utils import metrics
+
 load_dotenv()
 
 # JWT 설정
@@ -22,19 +33,116 @@ JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "your-secret-key-change-in-producti
 JWT_ALGORITHM = "HS256"
 JWT_EXPIRATION_HOURS = int(os.getenv("JWT_EXPIRATION_HOURS", "24"))
 
+# bcrypt 설정
+# cost factor: 새로 만드는 해시에만 적용 (기존 해시는 저장된 cost로 검증)
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+# 해싱 전용 스레드 수 (CPU 코어 수 이하 권장)
+AUTH_HASH_WORKERS = max(int(os.getenv("AUTH_HASH_WORKERS", str(min(4, os.cpu_count() or 1)))), 1)
+# 스레드가 모두 바쁠 때 대기시킬 작업 수 (넘으면 429)
+AUTH_HASH_MAX_QUEUE = max(int(os.getenv("AUTH_HASH_MAX_QUEUE", str(AUTH_HASH_WORKERS * 8))), 0)
+# 429 응답의 Retry-After (초)
+AUTH_HASH_RETRY_AFTER = int(os.getenv("AUTH_HASH_RETRY_AFTER", "1"))
+
+_HASH_SECONDS = metrics.histogram("auth_hash_seconds", "bcrypt hash/verify time on the worker pool")
+_HASH_QUEUE_WAIT = metrics.histogram("auth_hash_queue_wait_seconds", "Time a bcrypt job waited for a worker")
+_HASH_REJECTED = metrics.counter("auth_hash_rejected_total", "bcrypt jobs rejected because the pool was saturated")
+_HASH_INFLIGHT = metrics.gauge("auth_hash_inflight", "bcrypt jobs running or queued")
+
+_hash_executor: Optional[ThreadPoolExecutor] = None
+_hash_lock = threading.Lock()
+_inflight = 0
+_HASH_INFLIGHT.add_callback(lambda: [({}, _inflight)])
+
+
+class HashPoolSaturated(Exception):
+    """bcrypt 작업 풀이 가득 참 (라우트에서 429로 변환)."""
+
 
 def hash_password(password: str) -> str:
-    """비밀번호를 bcrypt로 해싱."""
-    salt = bcrypt.gensalt()
+    """비밀번호를 bcrypt로 해싱 (블로킹, BCRYPT_ROUNDS 적용)."""
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password.encode("utf-8"), salt)
     return hashed.decode("utf-8")
 
 
 def verify_password(password: str, hashed: str) -> bool:
-    """비밀번호 검증."""
+    """비밀번호 검증 (블로킹)."""
     return bcrypt.checkpw(password.encode("utf-8"), hashed.encode("utf-8"))
 
 
+# ─────────────────────────────────────────────────────────
+# bcrypt 작업 풀
+# ─────────────────────────────────────────────────────────
+
+
+def _get_hash_executor() -> ThreadPoolExecutor:
+    global _hash_executor
+    if _hash_executor is None:
+        with _hash_lock:
+            if _hash_executor is None:
+                _hash_executor = ThreadPoolExecutor(
+                    max_workers=AUTH_HASH_WORKERS, thread_name_prefix="bcrypt"
+                )
+    return _hash_executor
+
+
+def shutdown_hash_executor() -> None:
+    """서버 종료 시 bcrypt 스레드풀 정리."""
+    global _hash_executor
+    with _hash_lock:
+        executor, _hash_executor = _hash_executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def get_hash_pool_stats() -> dict:
+    """bcrypt 작업 풀 상태 (실행 중 + 대기 작업 수, 설정값)."""
+    return {
+        "inflight": _inflight,
+        "workers": AUTH_HASH_WORKERS,
+        "max_queue": AUTH_HASH_MAX_QUEUE,
+        "rounds": BCRYPT_ROUNDS,
+        "rejected": _HASH_REJECTED.value(),
+    }
+
+
+async def _run_hash_job(op: str, fn, *args):
+    """bcrypt 작업을 전용 풀에서 실행 (포화 시 HashPoolSaturated)."""
+    global _inflight
+    executor = _get_hash_executor()
+    with _hash_lock:
+        if _inflight >= AUTH_HASH_WORKERS + AUTH_HASH_MAX_QUEUE:
+            _HASH_REJECTED.inc()
+            raise HashPoolSaturated(op)
+        _inflight += 1
+
+    submitted = time.perf_counter()
+
+    def job():
+        started = time.perf_counter()
+        _HASH_QUEUE_WAIT.observe(started - submitted)
+        try:
+            return fn(*args)
+        finally:
+            _HASH_SECONDS.observe(time.perf_counter() - started, {"op": op})
+
+    try:
+        return await asyncio.wrap_future(executor.submit(job))
+    finally:
+        with _hash_lock:
+            _inflight -= 1
+
+
+async def hash_password_async(password: str) -> str:
+    """hash_password를 bcrypt 작업 풀에서 실행."""
+    return await _run_hash_job("hash", hash_password, password)
+
+
+async def verify_password_async(password: str, hashed: str) -> bool:
+    """verify_password를 bcrypt 작업 풀에서 실행."""
+    return await _run_hash_job("verify", verify_password, password, hashed)
+
+
 def create_access_token(user_id: int, email: str, role: str = "user") -> str:
     """JWT 액세스 토큰 생성."""
     now = datetime.now(timezone.utc)
@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+ANN 인덱스 recall vs 지연 벤치마크
+
+sermon_retriever의 검색 SQL을 정확 검색(인덱스 스캔 비활성화)과
+HNSW ef_search / IVFFlat probes 값별 ANN 검색으로 실행해 recall@k와 지연을 비교한다.
+
+쿼리 벡터는 저장된 설교 임베딩에 노이즈를 섞어 생성한다 (임베딩 모델 불필요).
+
+사용법:
+    python -B backend/database/vector_index.py create hnsw      # 인덱스 먼저 생성
+    python -B backend/benchmarks/bench_ann_recall.py --top-k 5 --queries 100
+    python -B backend/benchmarks/bench_ann_recall.py --ef-search 10 20 40 80 --probes 1 5 10
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from backend.sermon_agent.nodes.sermon_retriever import SEARCH_SQL, _get_connection_pool
+
+
+def _sample_queries(conn, n: int, noise: float, seed: int = 0) -> List[np.ndarray]:
+    """저장된 임베딩 + 가우시안 노이즈로 쿼리 벡터 생성."""
+    rows = conn.execute(
+        "SELECT embedding FROM sermon_embeddings ORDER BY random() LIMIT %s", (n,)
+    ).fetchall()
+    rng = np.random.default_rng(seed)
+    queries = []
+    for (emb,) in rows:
+        v = np.asarray(emb, dtype=np.float32)
+        v = v + noise * rng.standard_normal(v.shape[0]).astype(np.float32) / np.sqrt(v.shape[0])
+        queries.append(v / np.linalg.norm(v))
+    return queries
+
+
+def _existing_methods(conn) -> List[str]:
+    rows = conn.execute(
+        "SELECT indexdef FROM pg_indexes WHERE tablename = 'sermon_embeddings'"
+    ).fetchall()
+    methods = []
+    for (definition,) in rows:
+        lowered = definition.lower()
+        if "using hnsw" in lowered:
+            methods.append("hnsw")
+        elif "using ivfflat" in lowered:
+            methods.append("ivfflat")
+    return methods
+
+
+def _run(conn, qvec: np.ndarray, top_k: int, settings: Sequence[Tuple[str, str]]) -> Tuple[List, float]:
+    """설정을 SET LOCAL로 적용한 트랜잭션 안에서 검색 1회."""
+    with conn.transaction():
+        for name, value in settings:
+            conn.execute("SELECT set_config(%s, %s, true)", (name, value))
+        start = time.perf_counter()
+        rows = conn.execute(SEARCH_SQL, {"qvec": qvec, "limit": top_k}).fetchall()
+        elapsed = time.perf_counter() - start
+    return [r[0] for r in rows], elapsed
+
+
+def _evaluate(conn, queries, exact_ids, top_k, settings) -> Tuple[float, float, float]:
+    recalls, latencies = [], []
+    for qvec, truth in zip(queries, exact_ids):
+        ids, elapsed = _run(conn, qvec, top_k, settings)
+        recalls.append(len(set(ids) & set(truth)) / max(1, len(truth)))
+        latencies.append(elapsed * 1000)
+    ordered = sorted(latencies)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return statistics.mean(recalls), statistics.median(latencies), p99
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ANN recall vs 지연 벤치마크")
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--noise", type=float, default=0.8, help="쿼리 노이즈 크기 (0=저장 벡터 그대로)")
+    parser.add_argument("--ef-search", type=int, nargs="+", default=[10, 20, 40, 80, 160])
+    parser.add_argument("--probes", type=int, nargs="+", default=[1, 2, 5, 10, 20])
+    args = parser.parse_args()
+
+    pool = _get_connection_pool()
+    with pool.connection() as conn:
+        methods = _existing_methods(conn)
+        queries = _sample_queries(conn, args.queries, args.noise)
+
+        print("=" * 64)
+        print("ANN recall vs 지연 벤치마크")
+        print("=" * 64)
+        print(f"쿼리: {len(queries)}개, top_k={args.top_k}, 인덱스: {methods or '없음'}")
+        print("(ANN 측정 시 작은 테이블에서도 인덱스를 쓰도록 enable_seqscan=off)")
+
+        exact_settings = [("enable_indexscan", "off")]
+        exact_ids = [_run(conn, qvec, args.top_k, exact_settings)[0] for qvec in queries]
+
+        print(f"\n{'설정':<24} {'recall@k':>9} {'p50(ms)':>9} {'p99(ms)':>9}")
+        print("-" * 64)
+        _, p50, p99 = _evaluate(conn, queries, exact_ids, args.top_k, exact_settings)
+        print(f"{'exact (seq scan)':<24} {1.0:>9.3f} {p50:>9.2f} {p99:>9.2f}")
+
+        if "hnsw" in methods:
+            for ef in args.ef_search:
+                settings = [("enable_seqscan", "off"), ("hnsw.ef_search", str(ef))]
+                recall, p50, p99 = _evaluate(conn, queries, exact_ids, args.top_k, settings)
+                print(f"{'hnsw ef_search=' + str(ef):<24} {recall:>9.3f} {p50:>9.2f} {p99:>9.2f}")
+
+        if "ivfflat" in methods:
+            # 두 인덱스가 함께 있으면 플래너가 하나만 고르므로 인덱스를 하나만 둔 상태에서 측정할 것
+            for probes in args.probes:
+                settings = [("enable_seqscan", "off"), ("ivfflat.probes", str(probes))]
+                recall, p50, p99 = _evaluate(conn, queries, exact_ids, args.top_k, settings)
+                print(f"{'ivfflat probes=' + str(probes):<24} {recall:>9.3f} {p50:>9.2f} {p99:>9.2f}")
+
+        print("=" * 64)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+/auth 부하 벤치마크 (login, me)
+
+벤치마크용 계정을 만든 뒤(이미 있으면 로그인) 동시 요청 수별로
+/auth/login, /auth/me 처리량(req/s)과 지연(p50/p99)을 측정한다.
+부하 중 /health 지연도 함께 측정해 이벤트 루프 블로킹 여부를 확인한다.
+
+- /auth/me: 토큰 검증 + 사용자 조회 (DB 왕복이 지배적)
+- /auth/login: 사용자 조회 + bcrypt 검증 (CPU가 지배적, 해싱 풀 포화 시 429 → "거절" 열)
+
+사용법:
+    # 1) 서버 실행
+    cd backend && uvicorn main:app --host 0.0.0.0 --port 8000
+    # 2) 벤치마크 실행
+    python -B backend/benchmarks/bench_auth_load.py --url http://localhost:8000
+    python -B backend/benchmarks/bench_auth_load.py --endpoints me --levels 1 16 64 --requests 2000
+    python -B backend/benchmarks/bench_auth_load.py --endpoints login --levels 1 8 32 128 --requests 200
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from typing import Dict, List
+
+import httpx
+
+# Windows 콘솔 UTF-8 설정
+if sys.platform == "win32":
+    import io
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", errors="replace")
+
+
+BENCH_EMAIL = "bench-auth@example.com"
+BENCH_PASSWORD = "bench-password"
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """단순 nearest-rank 백분위수."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[idx]
+
+
+async def _ensure_account(url: str, email: str, password: str) -> str:
+    """벤치마크 계정 준비 후 액세스 토큰 반환."""
+    async with httpx.AsyncClient(base_url=url, timeout=30.0) as client:
+        res = await client.post(
+            "/auth/signup", json={"email": email, "password": password, "name": "bench"}
+        )
+        if res.status_code == 400:
+            res = await client.post("/auth/login", json={"email": email, "password": password})
+        res.raise_for_status()
+        return res.json()["access_token"]
+
+
+async def _probe_health(client: httpx.AsyncClient, stop: asyncio.Event, out: List[float]):
+    """부하 중 /health 지연 측정 (100ms 간격)."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        try:
+            await client.get("/health")
+            out.append(time.perf_counter() - start)
+        except httpx.HTTPError:
+            pass
+        await asyncio.sleep(0.1)
+
+
+async def run_level(
+    url: str,
+    endpoint: str,
+    concurrency: int,
+    total: int,
+    token: str,
+    email: str,
+    password: str,
+    timeout: float,
+) -> Dict[str, float]:
+    """엔드포인트 하나 x 동시성 레벨 하나 측정."""
+    latencies: List[float] = []
+    health: List[float] = []
+    errors = 0
+    rejected = 0
+    sem = asyncio.Semaphore(concurrency)
+
+    limits = httpx.Limits(max_connections=concurrency + 2)
+    async with httpx.AsyncClient(base_url=url, timeout=timeout, limits=limits) as client:
+
+        async def request_once() -> httpx.Response:
+            if endpoint == "me":
+                return await client.get("/auth/me", headers={"Authorization": f"Bearer {token}"})
+            return await client.post("/auth/login", json={"email": email, "password": password})
+
+        stop = asyncio.Event()
+        prober = asyncio.create_task(_probe_health(client, stop, health))
+
+        async def worker():
+            nonlocal errors, rejected
+            async with sem:
+                start = time.perf_counter()
+                try:
+                    res = await request_once()
+                    if res.status_code == 429:
+                        rejected += 1
+                        return
+                    res.raise_for_status()
+                    latencies.append(time.perf_counter() - start)
+                except httpx.HTTPError:
+                    errors += 1
+
+        wall_start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(total)))
+        wall = time.perf_counter() - wall_start
+
+        stop.set()
+        await prober
+
+    return {
+        "endpoint": endpoint,
+        "concurrency": concurrency,
+        "requests": total,
+        "errors": errors,
+        "rejected": rejected,
+        "p50": percentile(latencies, 50),
+        "p99": percentile(latencies, 99),
+        "mean": statistics.mean(latencies) if latencies else 0.0,
+        "throughput": len(latencies) / wall if wall else 0.0,
+        "health_p50": percentile(health, 50),
+        "health_p99": percentile(health, 99),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="/auth 부하 벤치마크")
+    parser.add_argument("--url", default="http://localhost:8000", help="FastAPI 서버 주소")
+    parser.add_argument(
+        "--endpoints", nargs="+", choices=["login", "me"], default=["me", "login"], help="측정 대상"
+    )
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 8, 32], help="동시 요청 수")
+    parser.add_argument("--requests", type=int, default=400, help="레벨별 요청 수")
+    parser.add_argument("--email", default=BENCH_EMAIL, help="벤치마크 계정 이메일")
+    parser.add_argument("--password", default=BENCH_PASSWORD, help="벤치마크 계정 비밀번호")
+    parser.add_argument("--timeout", type=float, default=60.0, help="요청 타임아웃 (초)")
+    args = parser.parse_args()
+
+    token = asyncio.run(_ensure_account(args.url, args.email, args.password))
+
+    print("=" * 91)
+    print("/auth 부하 벤치마크")
+    print("=" * 91)
+    print(f"서버: {args.url}  계정: {args.email}")
+    print(
+        f"{'엔드포인트':>8} {'동시성':>6} {'요청':>5} {'오류':>4} {'거절':>4} {'p50(ms)':>8} {'p99(ms)':>8} "
+        f"{'req/s':>8} {'health p50(ms)':>15} {'health p99(ms)':>15}"
+    )
+    print("-" * 91)
+
+    for endpoint in args.endpoints:
+        for level in args.levels:
+            r = asyncio.run(
+                run_level(
+                    args.url, endpoint, level, args.requests,
+                    token, args.email, args.password, args.timeout,
+                )
+            )
+            print(
+                f"{r['endpoint']:>8} {r['concurrency']:>6} {r['requests']:>5} {r['errors']:>4} {r['rejected']:>4} "
+                f"{r['p50'] * 1000:>8.1f} {r['p99'] * 1000:>8.1f} {r['throughput']:>8.1f} "
+                f"{r['health_p50'] * 1000:>15.1f} {r['health_p99'] * 1000:>15.1f}"
+            )
+
+    print("=" * 91)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+설교 단위(A 방식) vs 청크 단위 검색 비교 벤치마크
+
+질문 세트는 아카이브에서 자동으로 만든다:
+    --query-source sentence  설교 본문에서 뽑은 문장 → 정답은 그 설교 (긴 설교 속 세부 내용 검색)
+    --query-source title     설교 제목 → 정답은 그 설교
+
+모드별로 벡터 검색만(BM25 제외) 수행해 다음을 비교한다.
+    - 검색 품질: recall@1, recall@k, MRR
+    - 검색 지연: p50 / p99
+    - 프롬프트 크기: 검색 결과 요약의 원본 토큰 수, 토큰 예산 패킹 후 컨텍스트 토큰 수
+
+사전 준비: python -B backend/embedding/Embedding.py --mode chunk && python -B backend/database/import_data.py
+
+사용법:
+    python -B backend/benchmarks/bench_chunk_retrieval.py --queries 100 --top-k 5
+    python -B backend/benchmarks/bench_chunk_retrieval.py --query-source title
+"""
+
+import argparse
+import os
+import random
+import re
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from backend.sermon_agent.nodes import sermon_retriever as retriever
+from backend.sermon_agent.nodes.answer_creator import (
+    ANSWER_CONTEXT_MAX_TOKENS,
+    ANSWER_CONTEXT_SNIPPET_MAX_TOKENS,
+    ANSWER_MODEL,
+)
+from backend.sermon_agent.utils.context_packer import TokenCounter, pack_sermon_context
+
+_SENTENCE_RE = re.compile(r"[^.!?\n]{20,120}[.!?]")
+
+
+def _build_queries(pool, n: int, source: str, seed: int) -> List[Tuple[str, str]]:
+    """(질문, 정답 설교 ID) 목록."""
+    with pool.connection() as conn:
+        rows = conn.execute("SELECT id, title, content_summary FROM sermons").fetchall()
+
+    rng = random.Random(seed)
+    rng.shuffle(rows)
+    queries = []
+    for sermon_id, title, summary in rows:
+        if source == "title":
+            if title:
+                queries.append((title, str(sermon_id)))
+        else:
+            sentences = _SENTENCE_RE.findall(summary or "")
+            if sentences:
+                queries.append((rng.choice(sentences).strip(), str(sermon_id)))
+        if len(queries) >= n:
+            break
+    return queries
+
+
+def _evaluate(
+    label: str,
+    search: Callable[[np.ndarray, int], List[tuple]],
+    qmat: np.ndarray,
+    queries: List[Tuple[str, str]],
+    top_k: int,
+    counter: TokenCounter,
+) -> Dict[str, float]:
+    hits1 = hitsk = 0
+    rr = 0.0
+    latencies = []
+    source_tokens = []
+    context_tokens = []
+
+    for qvec, (text, truth) in zip(qmat, queries):
+        start = time.perf_counter()
+        rows = search(qvec, top_k)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+        ids = [str(r[0]) for r in rows]
+        if truth in ids:
+            rank = ids.index(truth) + 1
+            hitsk += 1
+            hits1 += rank == 1
+            rr += 1 / rank
+
+        snippets = [
+            {"title": r[1], "date": str(r[2]), "scripture": r[3], "summary": r[4], "score": float(r[8])}
+            for r in rows
+        ]
+        source_tokens.append(sum(counter.count(s["summary"] or "") for s in snippets))
+        _, stats = pack_sermon_context(
+            snippets, text, counter, ANSWER_CONTEXT_MAX_TOKENS, ANSWER_CONTEXT_SNIPPET_MAX_TOKENS
+        )
+        context_tokens.append(stats["context_tokens"])
+
+    n = len(queries)
+    ordered = sorted(latencies)
+    return {
+        "label": label,
+        "recall@1": hits1 / n,
+        f"recall@{top_k}": hitsk / n,
+        "mrr": rr / n,
+        "p50_ms": statistics.median(latencies),
+        "p99_ms": ordered[min(n - 1, int(n * 0.99))],
+        "source_tokens": statistics.mean(source_tokens),
+        "context_tokens": statistics.mean(context_tokens),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="설교 단위 vs 청크 단위 검색 비교")
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--query-source", choices=["sentence", "title"], default="sentence")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    pool = retriever._get_connection_pool()
+    if not retriever._chunk_search_available():
+        print("sermon_chunk_embeddings가 비어 있습니다. Embedding.py --mode chunk → import_data.py 먼저 실행")
+        sys.exit(1)
+
+    queries = _build_queries(pool, args.queries, args.query_source, args.seed)
+    start = time.time()
+    qmat = retriever._embed_texts([q for q, _ in queries])
+    print(f"질문 임베딩: {len(queries)}개 ({time.time() - start:.1f}s)")
+
+    counter = TokenCounter(ANSWER_MODEL)
+    modes = [
+        ("sermon", retriever._search_sermon_rows),
+        ("chunk-max", lambda q, k: retriever._search_chunk_rows(q, k, "max")),
+        ("chunk-sum", lambda q, k: retriever._search_chunk_rows(q, k, "sum")),
+    ]
+    results = [_evaluate(label, fn, qmat, queries, args.top_k, counter) for label, fn in modes]
+
+    k_key = f"recall@{args.top_k}"
+    print("=" * 96)
+    print(f"설교 vs 청크 검색 (질문 {len(queries)}개, source={args.query_source}, top-k={args.top_k})")
+    print(f"청크: 설교당 {retriever.CHUNKS_PER_SERMON}개 전달, 후보 x{retriever.CHUNK_CANDIDATE_MULTIPLIER}")
+    print(f"토큰 수: {'tiktoken' if counter.exact else '추정치'} / 컨텍스트 예산 {ANSWER_CONTEXT_MAX_TOKENS}")
+    print("=" * 96)
+    print(
+        f"  {'모드':<10} {'R@1':>6} {k_key:>9} {'MRR':>6} {'p50(ms)':>9} {'p99(ms)':>9} "
+        f"{'원본 토큰':>10} {'컨텍스트 토큰':>12}"
+    )
+    for r in results:
+        print(
+            f"  {r['label']:<10} {r['recall@1']:>6.3f} {r[k_key]:>9.3f} {r['mrr']:>6.3f} "
+            f"{r['p50_ms']:>9.2f} {r['p99_ms']:>9.2f} {r['source_tokens']:>10.0f} {r['context_tokens']:>12.0f}"
+        )
+    print("=" * 96)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+/chat/sermon 동시 요청 벤치마크
+
+동시 채팅 수(1, 8, 32)별로 응답 지연(p50/p99)을 측정하고,
+부하 중 /health 응답 지연을 함께 측정해 이벤트 루프 블로킹 여부를 확인한다.
+
+사용법:
+    # 1) 서버 실행
+    cd backend && uvicorn main:app --host 0.0.0.0 --port 8000
+    # 2) 벤치마크 실행
+    python -B backend/benchmarks/bench_concurrency.py --url http://localhost:8000
+    python -B backend/benchmarks/bench_concurrency.py --levels 1 8 32 --rounds 2
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from typing import Dict, List
+
+import httpx
+
+# Windows 콘솔 UTF-8 설정
+if sys.platform == "win32":
+    import io
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", errors="replace")
+
+
+TEST_QUESTIONS = [
+    "하나님의 사랑에 대한 설교를 찾아줘",
+    "고난 중에 어떻게 믿음을 지킬 수 있을까?",
+    "감사하는 삶에 대한 설교가 있나요?",
+    "기도의 중요성",
+    "마태복음 25장으로 설교한 적 있나요?",
+]
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """단순 nearest-rank 백분위수."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[idx]
+
+
+async def _chat_once(client: httpx.AsyncClient, question: str, i: int) -> float:
+    start = time.perf_counter()
+    res = await client.post(
+        "/chat/sermon",
+        json={
+            "user_id": "bench",
+            "question": question,
+            "profile_mode": "research",
+            "session_id": f"bench-{i}",
+        },
+    )
+    res.raise_for_status()
+    return time.perf_counter() - start
+
+
+async def _probe_health(client: httpx.AsyncClient, stop: asyncio.Event, out: List[float]):
+    """부하 중 /health 지연 측정 (100ms 간격)."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        try:
+            await client.get("/health")
+            out.append(time.perf_counter() - start)
+        except httpx.HTTPError:
+            pass
+        await asyncio.sleep(0.1)
+
+
+async def run_level(url: str, concurrency: int, rounds: int, timeout: float) -> Dict[str, float]:
+    """동시성 레벨 하나 측정."""
+    total = concurrency * rounds
+    latencies: List[float] = []
+    health: List[float] = []
+    errors = 0
+    sem = asyncio.Semaphore(concurrency)
+
+    limits = httpx.Limits(max_connections=concurrency + 2)
+    async with httpx.AsyncClient(base_url=url, timeout=timeout, limits=limits) as client:
+        stop = asyncio.Event()
+        prober = asyncio.create_task(_probe_health(client, stop, health))
+
+        async def worker(i: int):
+            nonlocal errors
+            async with sem:
+                try:
+                    latencies.append(
+                        await _chat_once(client, TEST_QUESTIONS[i % len(TEST_QUESTIONS)], i)
+                    )
+                except httpx.HTTPError:
+                    errors += 1
+
+        wall_start = time.perf_counter()
+        await asyncio.gather(*(worker(i) for i in range(total)))
+        wall = time.perf_counter() - wall_start
+
+        stop.set()
+        await prober
+
+    return {
+        "concurrency": concurrency,
+        "requests": total,
+        "errors": errors,
+        "p50": percentile(latencies, 50),
+        "p99": percentile(latencies, 99),
+        "mean": statistics.mean(latencies) if latencies else 0.0,
+        "throughput": len(latencies) / wall if wall else 0.0,
+        "health_p50": percentile(health, 50),
+        "health_p99": percentile(health, 99),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="/chat/sermon 동시성 벤치마크")
+    parser.add_argument("--url", default="http://localhost:8000", help="FastAPI 서버 주소")
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 8, 32], help="동시 요청 수")
+    parser.add_argument("--rounds", type=int, default=2, help="레벨별 요청 수 = 동시성 x rounds")
+    parser.add_argument("--timeout", type=float, default=180.0, help="요청 타임아웃 (초)")
+    args = parser.parse_args()
+
+    print("=" * 78)
+    print("/chat/sermon 동시성 벤치마크")
+    print("=" * 78)
+    print(f"서버: {args.url}")
+    print(
+        f"{'동시성':>6} {'요청':>5} {'오류':>4} {'p50(s)':>8} {'p99(s)':>8} "
+        f"{'req/s':>7} {'health p50(ms)':>15} {'health p99(ms)':>15}"
+    )
+    print("-" * 78)
+
+    for level in args.levels:
+        r = asyncio.run(run_level(args.url, level, args.rounds, args.timeout))
+        print(
+            f"{r['concurrency']:>6} {r['requests']:>5} {r['errors']:>4} "
+            f"{r['p50']:>8.2f} {r['p99']:>8.2f} {r['throughput']:>7.2f} "
+            f"{r['health_p50'] * 1000:>15.1f} {r['health_p99'] * 1000:>15.1f}"
+        )
+
+    print("=" * 78)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+쿼리 인코더 백엔드 벤치마크 + fp32 동등성 검사 (torch / torch-int8 / onnx / onnx-int8)
+
+백엔드마다 새 프로세스(spawn)에서 모델을 로드해 다음을 측정한다.
+    - 로딩 시간, 상주 메모리(RSS: 로딩 후 / 최대)
+    - 단일 쿼리 지연 (embed_query) p50 / p99
+    - 문서 배치 처리량 (embed_documents, 설교 요약 텍스트)
+    - 동등성: 고정 질문 세트 + 문서 세트에서 torch fp32 벡터와의 코사인 유사도 (최소/평균)
+
+최소 코사인이 --min-cosine(기본 0.99)보다 낮은 백엔드가 있으면 종료 코드 1.
+
+사용법:
+    python -B backend/benchmarks/bench_encoder_backends.py
+    python -B backend/benchmarks/bench_encoder_backends.py --backends torch onnx-int8 --docs 64 --threads 4
+"""
+
+import argparse
+import json
+import multiprocessing as mp
+import os
+import resource
+import statistics
+import sys
+import time
+from typing import Any, Dict, List
+
+import numpy as np
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from dotenv import load_dotenv
+load_dotenv()
+
+MODEL_NAME = "dragonkue/bge-m3-ko"
+SERMONS_FILE = os.path.join(PROJECT_ROOT, "backend", "crawling", "output", "daedeok_sermons_2023_2026.json")
+ENCODER_CACHE_DIR = os.getenv(
+    "SERMON_ENCODER_CACHE_DIR", os.path.join(PROJECT_ROOT, "backend", ".cache", "onnx")
+)
+
+# 동등성 검사용 고정 질문 세트 (라우터/검색 로그에서 자주 나오는 유형)
+PARITY_QUERIES = [
+    "감사에 대한 설교",
+    "고난 중에 어떻게 믿음을 지킬 수 있나요?",
+    "마태복음 5장 산상수훈 설교",
+    "용서하기 어려운 사람을 어떻게 대해야 하나요",
+    "기도의 응답이 늦어질 때",
+    "부활절 설교 요약해줘",
+    "요한복음 3장 16절",
+    "가정의 회복과 부부 관계",
+    "청년들에게 주는 메시지",
+    "성령의 열매란 무엇인가",
+    "두려움과 불안을 이기는 법",
+    "교회 공동체의 사랑",
+    "시편 23편 목자 되신 하나님",
+    "십자가의 의미",
+    "물질과 헌금에 대한 말씀",
+    "새해를 맞이하는 성도의 자세",
+    "아브라함의 믿음",
+    "순종과 축복",
+    "겸손에 대한 설교가 있나요?",
+    "전도와 선교의 사명",
+    "로마서 8장 28절 합력하여 선을 이루심",
+    "광야에서 만나를 주신 하나님",
+    "이웃 사랑의 실천",
+    "인내와 소망",
+]
+
+
+def _load_docs(n: int) -> List[str]:
+    """처리량 측정용 문서 텍스트 (Embedding.py와 같은 제목 + 본문 + 요약 형식)."""
+    if n <= 0 or not os.path.exists(SERMONS_FILE):
+        return list(PARITY_QUERIES)
+    with open(SERMONS_FILE, encoding="utf-8") as f:
+        sermons = json.load(f)
+    docs = []
+    for s in sermons[:n]:
+        parts = [
+            f"제목: {s['title']}" if s.get("title") else "",
+            f"본문: {s['bible_ref']}" if s.get("bible_ref") else "",
+            s.get("content_summary") or "",
+        ]
+        docs.append("\n".join(p for p in parts if p))
+    return docs
+
+
+def _rss_mb() -> float:
+    import psutil
+
+    return psutil.Process().memory_info().rss / (1024 * 1024)
+
+
+def _run_backend(backend: str, docs: List[str], rounds: int, threads: int) -> Dict[str, Any]:
+    """자식 프로세스: 백엔드 하나 로드 + 측정."""
+    from backend.sermon_agent.utils.encoder import create_encoder
+
+    rss_start = _rss_mb()
+    start = time.perf_counter()
+    encoder = create_encoder(backend, MODEL_NAME, cache_dir=ENCODER_CACHE_DIR, threads=threads)
+    encoder.embed_query("워밍업")
+    load_s = time.perf_counter() - start
+    rss_loaded = _rss_mb()
+
+    latencies = []
+    query_vecs = []
+    for r in range(rounds):
+        for q in PARITY_QUERIES:
+            t = time.perf_counter()
+            vec = encoder.embed_query(q)
+            latencies.append((time.perf_counter() - t) * 1000)
+            if r == 0:
+                query_vecs.append(vec)
+
+    t = time.perf_counter()
+    doc_vecs = encoder.embed_documents(docs)
+    doc_s = time.perf_counter() - t
+
+    ordered = sorted(latencies)
+    return {
+        "backend": backend,
+        "load_s": load_s,
+        "rss_loaded_mb": rss_loaded - rss_start,
+        "rss_peak_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "p50_ms": statistics.median(latencies),
+        "p99_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))],
+        "docs_per_s": len(docs) / doc_s if doc_s > 0 else 0.0,
+        "query_vecs": np.asarray(query_vecs, dtype=np.float32),
+        "doc_vecs": np.asarray(doc_vecs, dtype=np.float32),
+    }
+
+
+def _cosines(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    a = a / np.maximum(np.linalg.norm(a, axis=1, keepdims=True), 1e-12)
+    b = b / np.maximum(np.linalg.norm(b, axis=1, keepdims=True), 1e-12)
+    return (a * b).sum(axis=1)
+
+
+def main():
+    from backend.sermon_agent.utils.encoder import ENCODER_BACKENDS
+
+    parser = argparse.ArgumentParser(description="인코더 백엔드 지연/처리량/메모리 + fp32 동등성")
+    parser.add_argument("--backends", nargs="+", choices=ENCODER_BACKENDS, default=list(ENCODER_BACKENDS))
+    parser.add_argument("--docs", type=int, default=32, help="처리량 측정 문서 수 (설교 요약)")
+    parser.add_argument("--rounds", type=int, default=3, help="질문 세트 반복 횟수 (지연 측정)")
+    parser.add_argument("--threads", type=int, default=0, help="CPU 스레드 수 (0: 기본값)")
+    parser.add_argument("--min-cosine", type=float, default=0.99)
+    args = parser.parse_args()
+
+    backends = list(args.backends)
+    if "torch" not in backends:
+        backends.insert(0, "torch")  # 동등성 기준 (fp32)
+    docs = _load_docs(args.docs)
+
+    # 백엔드마다 새 프로세스: 이전 모델의 메모리가 RSS에 섞이지 않도록
+    ctx = mp.get_context("spawn")
+    results = {}
+    for backend in backends:
+        print(f"[{backend}] 측정 중...", flush=True)
+        with ctx.Pool(1) as pool:
+            try:
+                results[backend] = pool.apply(_run_backend, (backend, docs, args.rounds, args.threads))
+            except Exception as e:
+                print(f"[{backend}] 실패: {e}", flush=True)
+
+    if "torch" not in results:
+        print("기준 백엔드(torch fp32) 측정 실패")
+        sys.exit(1)
+    base = results["torch"]
+
+    print("=" * 108)
+    print(f"인코더 백엔드 비교 ({MODEL_NAME}, 질문 {len(PARITY_QUERIES)}개 x {args.rounds}, 문서 {len(docs)}개)")
+    print("=" * 108)
+    print(
+        f"  {'백엔드':<11} {'로딩(s)':>8} {'RSS(MB)':>9} {'최대RSS':>9} {'p50(ms)':>9} {'p99(ms)':>9} "
+        f"{'문서/s':>8} {'cos 최소':>9} {'cos 평균':>9}"
+    )
+    failed = []
+    for backend in backends:
+        r = results.get(backend)
+        if r is None:
+            failed.append(backend)
+            continue
+        cos = np.concatenate([
+            _cosines(r["query_vecs"], base["query_vecs"]),
+            _cosines(r["doc_vecs"], base["doc_vecs"]),
+        ])
+        if cos.min() < args.min_cosine:
+            failed.append(backend)
+        print(
+            f"  {backend:<11} {r['load_s']:>8.1f} {r['rss_loaded_mb']:>9.0f} {r['rss_peak_mb']:>9.0f} "
+            f"{r['p50_ms']:>9.1f} {r['p99_ms']:>9.1f} {r['docs_per_s']:>8.1f} "
+            f"{cos.min():>9.4f} {cos.mean():>9.4f}"
+        )
+    print("=" * 108)
+
+    if failed:
+        print(f"동등성 기준 미달 또는 실패 (cos < {args.min_cosine}): {', '.join(failed)}")
+        sys.exit(1)
+    print(f"모든 백엔드 cos ≥ {args.min_cosine}")
+
+
+if __name__ == "__main__":
+    main()
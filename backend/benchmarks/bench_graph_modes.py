@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+그래프 모드 비교 벤치마크 (sequential vs speculative)
+
+같은 질문 목록으로 두 그래프를 실행해 end-to-end 지연(p50/p99)을 비교한다.
+질문마다 임베딩 캐시를 우회하도록 접미사를 붙인다.
+
+실제 OpenAI/임베딩 모델 대신 고정 지연으로 바꿔 네트워크 없이 구조만 비교할 수도 있다:
+    --simulate-llm-ms 500 800   # router, answer LLM 지연 (ms)
+    --simulate-embed-ms 150     # 임베딩 지연 (ms)
+
+사용법:
+    python -B backend/benchmarks/bench_graph_modes.py --rounds 3
+    python -B backend/benchmarks/bench_graph_modes.py --simulate-llm-ms 500 800 --simulate-embed-ms 150
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+import uuid
+from typing import List, Optional
+
+import numpy as np
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from backend.sermon_agent import graph as graph_module
+from backend.sermon_agent.nodes import answer_creator, query_router, sermon_retriever
+
+TEST_QUESTIONS = [
+    "하나님의 사랑에 대한 설교를 찾아줘",
+    "고난 중에 어떻게 믿음을 지킬 수 있을까?",
+    "감사하는 삶에 대해 알려주세요",
+    "기도의 중요성",
+    "용서는 어떻게 해야 하나요?",
+    "오늘 점심 뭐 먹을까요?",
+]
+
+
+class _SimulatedEmbeddings:
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    def _vec(self, text: str) -> List[float]:
+        rng = np.random.default_rng(abs(hash(text)) % (2**32))
+        v = rng.standard_normal(sermon_retriever.EMBEDDING_DIMENSION)
+        return (v / np.linalg.norm(v)).tolist()
+
+    def embed_query(self, text: str) -> List[float]:
+        time.sleep(self.delay)
+        return self._vec(text)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        time.sleep(self.delay)
+        return [self._vec(t) for t in texts]
+
+
+def _simulate(llm_ms: Optional[List[float]], embed_ms: Optional[float]) -> None:
+    if llm_ms:
+        router_delay, answer_delay = llm_ms[0] / 1000, llm_ms[-1] / 1000
+
+        def fake_router(text, profile_mode):
+            time.sleep(router_delay)
+            use_rag = "점심" not in text
+            return query_router.RouterDecisionSchema(
+                category="SERMON_SEARCH" if use_rag else "OTHER",
+                use_rag=use_rag,
+                reason="simulated",
+            )
+
+        def fake_answer(*args, **kwargs):
+            time.sleep(answer_delay)
+            return "시뮬레이션 답변"
+
+        query_router._call_router_llm = fake_router
+        answer_creator._run_answer_llm = fake_answer
+
+    if embed_ms is not None:
+        sermon_retriever._embeddings_model = _SimulatedEmbeddings(embed_ms / 1000)
+
+
+def _run(graph, questions: List[str], rounds: int) -> List[float]:
+    latencies = []
+    for _ in range(rounds):
+        for q in questions:
+            state = {
+                "user_input": f"{q} ({uuid.uuid4().hex[:6]})",
+                "user_action": "chat",
+                "profile_mode": "research",
+                "messages": [],
+            }
+            start = time.perf_counter()
+            graph.invoke(state)
+            latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def _summary(label: str, samples: List[float]) -> None:
+    ordered = sorted(samples)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(
+        f"  {label:<12} mean={statistics.mean(samples):8.1f}ms  "
+        f"p50={statistics.median(samples):8.1f}ms  p99={p99:8.1f}ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="sequential vs speculative 그래프 지연 비교")
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--simulate-llm-ms", type=float, nargs="+", default=None)
+    parser.add_argument("--simulate-embed-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    _simulate(args.simulate_llm_ms, args.simulate_embed_ms)
+
+    sequential = graph_module.create_sermon_agent_graph()
+    speculative = graph_module.create_speculative_sermon_agent_graph()
+
+    # 워밍업 (모델 로딩, 인덱스 구축)
+    _run(sequential, TEST_QUESTIONS[:1], 1)
+
+    seq_lat = _run(sequential, TEST_QUESTIONS, args.rounds)
+    spec_lat = _run(speculative, TEST_QUESTIONS, args.rounds)
+
+    print("=" * 64)
+    print("그래프 모드 end-to-end 지연")
+    print("=" * 64)
+    print(f"질문: {len(TEST_QUESTIONS)}개 x {args.rounds}회")
+    if args.simulate_llm_ms or args.simulate_embed_ms is not None:
+        print(f"(시뮬레이션: LLM {args.simulate_llm_ms}ms, 임베딩 {args.simulate_embed_ms}ms)")
+    _summary("sequential", seq_lat)
+    _summary("speculative", spec_lat)
+    saved = statistics.median(seq_lat) - statistics.median(spec_lat)
+    print(f"\n  p50 단축: {saved:.1f}ms ({saved / statistics.median(seq_lat) * 100:.1f}%)")
+    print("=" * 64)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+하이브리드 검색 BM25 + RRF 추가 지연 벤치마크
+
+sermon_retriever의 BM25 검색 + RRF 융합 단계만 측정해 쿼리당 예산
+(SERMON_RETRIEVER_HYBRID_BUDGET_MS, 기본 5ms) 안에 드는지 확인한다.
+쿼리는 설교 제목/본문 참조에서 만든다 (임베딩 모델 불필요).
+
+사용법:
+    python -B backend/benchmarks/bench_hybrid_sparse.py --queries 500
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from backend.sermon_agent.nodes import sermon_retriever as retriever
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BM25 + RRF 지연 벤치마크")
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--top-k", type=int, default=retriever.TOP_K)
+    args = parser.parse_args()
+
+    build_start = time.perf_counter()
+    index = retriever._get_sparse_index()
+    build_time = time.perf_counter() - build_start
+
+    meta = index._data[0]
+    if not meta:
+        print("설교 데이터가 없습니다.")
+        return
+
+    rng = random.Random(0)
+    queries = []
+    for _ in range(args.queries):
+        m = rng.choice(meta)
+        queries.append(rng.choice([m[1], m[3], f"{m[3]} {m[1]}"]) or "설교")
+
+    # 벡터 후보는 BM25 상위 결과를 뒤섞어 흉내 낸다 (융합 비용 측정용)
+    latencies = []
+    for q in queries:
+        dense_rows = [r[:8] + (0.5,) for r in index.search(q, retriever.HYBRID_CANDIDATES)]
+        rng.shuffle(dense_rows)
+        start = time.perf_counter()
+        retriever._hybrid_results(q, dense_rows, args.top_k)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    ordered = sorted(latencies)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    stats = retriever.get_hybrid_stats()
+
+    print("=" * 64)
+    print("BM25 + RRF 추가 지연")
+    print("=" * 64)
+    print(f"인덱스: {index.size}개 설교, 구축 {build_time:.2f}s")
+    print(f"쿼리: {len(queries)}개, 후보 {retriever.HYBRID_CANDIDATES}, top_k={args.top_k}")
+    print(
+        f"  mean={statistics.mean(latencies):.3f}ms  "
+        f"p50={statistics.median(latencies):.3f}ms  p99={p99:.3f}ms  max={ordered[-1]:.3f}ms"
+    )
+    print(f"  예산 {retriever.HYBRID_BUDGET_MS}ms 초과: {stats['over_budget']}회")
+    print("=" * 64)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+pgvector 쿼리 벡터 바인딩 마이크로 벤치마크
+
+비교 대상:
+  - old: 1024개 float를 "[...]" 텍스트로 포맷팅, SQL에서 ::vector 캐스트 2회
+  - new: pgvector 어댑터로 float32 배열을 바이너리 바인딩 1회, 서브쿼리에서 거리 1회 계산
+
+사용법:
+    python -B backend/benchmarks/bench_pgvector_binding.py              # 직렬화만
+    python -B backend/benchmarks/bench_pgvector_binding.py --db         # DB 왕복 포함 (DATABASE_URL 필요)
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from typing import Callable, List
+
+import numpy as np
+from pgvector.utils import Vector
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from dotenv import load_dotenv
+load_dotenv()
+
+
+DIMENSION = 1024
+
+OLD_SQL = """
+    SELECT
+        s.id, s.title, s.sermon_date, s.bible_ref, s.content_summary,
+        s.video_url, s.church_name, s.preacher,
+        (1 - (e.embedding <=> %(qvec)s::vector)) AS similarity
+    FROM sermon_embeddings e
+    JOIN sermons s ON s.id = e.sermon_id
+    ORDER BY e.embedding <=> %(qvec)s::vector
+    LIMIT %(limit)s
+"""
+
+
+def _random_unit_vectors(n: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    vecs = rng.standard_normal((n, DIMENSION)).astype(np.float32)
+    return vecs / np.linalg.norm(vecs, axis=1, keepdims=True)
+
+
+def _old_serialize(vec: np.ndarray) -> str:
+    return "[" + ",".join(f"{v:.6f}" for v in vec) + "]"
+
+
+def _new_serialize(vec: np.ndarray) -> bytes:
+    return Vector(vec).to_binary()
+
+
+def _time_ms(fn: Callable[[np.ndarray], object], vecs: np.ndarray) -> List[float]:
+    out = []
+    for v in vecs:
+        start = time.perf_counter()
+        fn(v)
+        out.append((time.perf_counter() - start) * 1000)
+    return out
+
+
+def _report(label: str, samples: List[float]) -> None:
+    ordered = sorted(samples)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(
+        f"  {label:<28} mean={statistics.mean(samples):8.3f}ms  "
+        f"p50={statistics.median(samples):8.3f}ms  p99={p99:8.3f}ms"
+    )
+
+
+def bench_serialization(vecs: np.ndarray) -> None:
+    print("\n[1] 직렬화 (Python)")
+    print(f"  old payload: {len(_old_serialize(vecs[0])):,} bytes (text)")
+    print(f"  new payload: {len(_new_serialize(vecs[0])):,} bytes (binary)")
+    _report("old: f-string text", _time_ms(_old_serialize, vecs))
+    _report("new: pgvector binary", _time_ms(_new_serialize, vecs))
+
+
+def bench_round_trip(vecs: np.ndarray, top_k: int) -> None:
+    from backend.sermon_agent.nodes.sermon_retriever import SEARCH_SQL, _get_connection_pool
+
+    print("\n[2] 직렬화 + DB 왕복")
+    pool = _get_connection_pool()
+
+    def run_old(v: np.ndarray):
+        with pool.connection() as conn, conn.cursor() as cur:
+            cur.execute(OLD_SQL, {"qvec": _old_serialize(v), "limit": top_k})
+            return cur.fetchall()
+
+    def run_new(v: np.ndarray):
+        with pool.connection() as conn, conn.cursor() as cur:
+            cur.execute(SEARCH_SQL, {"qvec": v, "limit": top_k})
+            return cur.fetchall()
+
+    # 워밍업 + 결과 일치 확인
+    mismatches = 0
+    for v in vecs[:10]:
+        old_ids = [r[0] for r in run_old(v)]
+        new_ids = [r[0] for r in run_new(v)]
+        mismatches += int(old_ids != new_ids)
+    print(f"  결과 일치: {10 - mismatches}/10")
+
+    _report("old: text, cast x2", _time_ms(run_old, vecs))
+    _report("new: binary, cast x1", _time_ms(run_new, vecs))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="pgvector 바인딩 벤치마크")
+    parser.add_argument("--n", type=int, default=200, help="반복 횟수")
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--db", action="store_true", help="DB 왕복 시간 측정 (DATABASE_URL 필요)")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("pgvector 쿼리 벡터 바인딩 벤치마크")
+    print("=" * 60)
+
+    vecs = _random_unit_vectors(args.n)
+    bench_serialization(vecs)
+
+    if args.db:
+        bench_round_trip(vecs, args.top_k)
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+검색 백엔드 비교 벤치마크 (pgvector vs 인메모리 numpy)
+
+같은 쿼리 벡터로 두 백엔드의 top-k 검색 지연과 결과 일치율을 측정한다.
+쿼리 벡터는 저장된 설교 임베딩에 노이즈를 섞어 생성한다 (임베딩 모델 불필요).
+
+사용법:
+    python -B backend/benchmarks/bench_retrieval_backends.py --queries 200 --top-k 5
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from typing import List
+
+import numpy as np
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from backend.sermon_agent.nodes.sermon_retriever import SEARCH_SQL, _get_connection_pool
+from backend.sermon_agent.utils.memory_index import InMemorySermonIndex
+
+
+def _sample_queries(pool, n: int, noise: float, seed: int = 0) -> List[np.ndarray]:
+    with pool.connection() as conn:
+        rows = conn.execute(
+            "SELECT embedding FROM sermon_embeddings ORDER BY random() LIMIT %s", (n,)
+        ).fetchall()
+    rng = np.random.default_rng(seed)
+    queries = []
+    for i in range(n):
+        v = np.asarray(rows[i % len(rows)][0], dtype=np.float32)
+        v = v + noise * rng.standard_normal(v.shape[0]).astype(np.float32) / np.sqrt(v.shape[0])
+        queries.append(v / np.linalg.norm(v))
+    return queries
+
+
+def _summary(label: str, samples_ms: List[float]) -> None:
+    ordered = sorted(samples_ms)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(
+        f"  {label:<22} mean={statistics.mean(samples_ms):8.3f}ms  "
+        f"p50={statistics.median(samples_ms):8.3f}ms  p99={p99:8.3f}ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="pgvector vs numpy 검색 벤치마크")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--noise", type=float, default=0.8)
+    args = parser.parse_args()
+
+    pool = _get_connection_pool()
+    queries = _sample_queries(pool, args.queries, args.noise)
+
+    print("=" * 64)
+    print("검색 백엔드 비교 (pgvector vs numpy)")
+    print("=" * 64)
+
+    load_start = time.perf_counter()
+    index = InMemorySermonIndex()
+    index.maybe_refresh(pool)
+    load_time = time.perf_counter() - load_start
+    print(f"numpy 인덱스: {index.size}개, 로드 {load_time:.2f}s, top_k={args.top_k}")
+
+    pg_lat, np_lat, overlaps = [], [], []
+    for q in queries:
+        start = time.perf_counter()
+        with pool.connection() as conn, conn.cursor() as cur:
+            cur.execute(SEARCH_SQL, {"qvec": q, "limit": args.top_k})
+            pg_ids = [r[0] for r in cur.fetchall()]
+        pg_lat.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        np_ids = [r[0] for r in index.search(q, args.top_k)]
+        np_lat.append((time.perf_counter() - start) * 1000)
+
+        overlaps.append(len(set(pg_ids) & set(np_ids)) / max(1, len(pg_ids)))
+
+    print()
+    _summary("pgvector (pool+SQL)", pg_lat)
+    _summary("numpy (matvec)", np_lat)
+    print(f"\n  top-{args.top_k} 일치율: {statistics.mean(overlaps):.3f}")
+    print("=" * 64)
+
+
+if __name__ == "__main__":
+    main()
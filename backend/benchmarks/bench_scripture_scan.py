@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+성경 구절 추출 벤치마크 (기존 다중 정규식 vs 단일 스캐너)
+
+답변 길이(약 1,500자)의 텍스트에 구절 참조를 섞어 만든 뒤
+기존 answer_creator 방식(re.findall 6회 + set)과 parse_scripture_reference 방식
+(re.finditer 3회)을 bible_books.scan_scripture 1회 스캔과 비교한다.
+
+사용법:
+    python -B backend/benchmarks/bench_scripture_scan.py --texts 200 --repeat 20
+"""
+
+import argparse
+import os
+import random
+import re
+import statistics
+import sys
+import time
+from typing import List
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from backend.sermon_agent.utils.bible_books import BOOKS, scan_scripture
+from backend.sermon_agent.utils.scripture_parser import extract_scripture_references
+
+# 변경 전 answer_creator._extract_scripture_references 패턴
+LEGACY_ANSWER_PATTERNS = [
+    r"[가-힣]+복음?\s*\d+장\s*\d+절?(?:\s*[-~]\s*\d+절?)?",
+    r"[가-힣]+복음?\s*\d+:\d+(?:\s*[-~]\s*\d+)?",
+    r"[가-힣]+서?\s*\d+장\s*\d+절?(?:\s*[-~]\s*\d+절?)?",
+    r"[가-힣]+서?\s*\d+:\d+(?:\s*[-~]\s*\d+)?",
+    r"시편\s*\d+편(?:\s*\d+절?)?",
+    r"잠언\s*\d+장\s*\d+절?",
+]
+
+# 변경 전 scripture_parser.parse_scripture_reference 패턴
+LEGACY_PARSER_PATTERNS = [
+    r'([가-힣]+(?:복음|서)?)\s*(\d+)장\s*(\d+)(?:-(\d+))?절?',
+    r'([가-힣]+(?:복음|서)?)\s*(\d+):(\d+)(?:-(\d+))?',
+    r'(시편)\s*(\d+)편',
+]
+
+FILLER = (
+    "2024년 03월 10일 '하나님의 사랑' 설교에서는 공동체가 서로를 돌보는 삶을 강조했습니다. "
+    "목사님은 고난 가운데서도 소망을 붙드는 믿음의 태도를 여러 예화로 설명하셨고, "
+    "성도들이 일상에서 실천할 수 있는 구체적인 적용점을 제시하셨습니다. "
+)
+
+
+def _random_reference(rng: random.Random) -> str:
+    book = rng.choice(BOOKS)
+    name = rng.choice([book.name, book.abbr])
+    c, v = rng.randint(1, 30), rng.randint(1, 30)
+    return rng.choice([
+        f"{name} {c}장 {v}절",
+        f"{name} {c}:{v}",
+        f"{name} {c}장 {v}-{v + 5}절",
+        f"{name} {c} : {v} ~ {v + 8}",
+        f"{book.name} {c}장",
+    ])
+
+
+def _make_texts(n: int, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(n):
+        parts = []
+        while sum(len(p) for p in parts) < 1500:
+            parts.append(FILLER)
+            parts.append(f"{_random_reference(rng)}에서 말씀하신 것처럼, ")
+        texts.append("".join(parts))
+    return texts
+
+
+def legacy_answer_extract(text: str) -> List[str]:
+    references = []
+    for pattern in LEGACY_ANSWER_PATTERNS:
+        references.extend(re.findall(pattern, text))
+    return list(set(references))
+
+
+def legacy_parser_extract(text: str) -> int:
+    count = 0
+    for pattern in LEGACY_PARSER_PATTERNS:
+        for _ in re.finditer(pattern, text):
+            count += 1
+    return count
+
+
+def _time_per_text(func, texts: List[str], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for t in texts:
+            func(t)
+        samples.append((time.perf_counter() - start) / len(texts) * 1e6)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="성경 구절 추출 벤치마크")
+    parser.add_argument("--texts", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    texts = _make_texts(args.texts)
+    avg_len = statistics.mean(len(t) for t in texts)
+
+    print("=" * 64)
+    print("성경 구절 추출 벤치마크")
+    print("=" * 64)
+    print(f"텍스트: {len(texts)}개, 평균 {avg_len:.0f}자, 반복 {args.repeat}회 (중앙값)")
+    print()
+
+    rows = [
+        ("legacy answer (findall x6)", legacy_answer_extract),
+        ("legacy parser (finditer x3)", legacy_parser_extract),
+        ("scan_scripture (1 pass)", scan_scripture),
+        ("extract_scripture_references", extract_scripture_references),
+    ]
+    for label, func in rows:
+        print(f"  {label:<30} {_time_per_text(func, texts, args.repeat):8.1f} us/text")
+
+    found = statistics.mean(len(scan_scripture(t)) for t in texts)
+    legacy_found = statistics.mean(len(legacy_answer_extract(t)) for t in texts)
+    print(f"\n  텍스트당 참조 수: scan {found:.1f} / legacy answer {legacy_found:.1f}")
+    print("=" * 64)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,22 @@
 import re
 from typing import Optional
 
+# 성경 구절 파서 (에이전트와 같은 책 이름 테이블/표준 표기 사용, 표준 라이브러리만 의존)
+# run.py는 backend/를 sys.path에 넣고, 프로젝트 루트에서 실행하면 backend. 접두어가 필요하다
+try:
+    from sermon_agent.utils.scripture_parser import (
+        format_scripture_reference,
+        parse_scripture_reference as _parse_references,
+    )
+except ImportError:
+    try:
+        from backend.sermon_agent.utils.scripture_parser import (
+            format_scripture_reference,
+            parse_scripture_reference as _parse_references,
+        )
+    except ImportError:
+        format_scripture_reference = _parse_references = None
+
 
 def parse_date_from_title(title: str) -> Optional[str]:
     """
@@ -51,13 +67,20 @@ def parse_scripture_reference(text: str) -> Optional[str]:
         text: 본문 텍스트 (예: "본 문 : 마 25 : 1 ~ 13")
 
     Returns:
-        성경 구절 (예: "마 25 : 1 ~ 13") 또는 None
+        성경 구절. 알려진 책 이름으로 시작하면 표준 표기 (예: "마태복음 25장 1-13절"),
+        아니면 원문 일부 (예: "마 25 : 1 ~ 13") 또는 None
     """
     if "본" in text and "문" in text and ":" in text:
         scripture_match = re.search(r":\s*(.+)$", text)
         if scripture_match:
             raw_scripture = scripture_match.group(1).strip()
 
+            # 알려진 책 이름/약어로 시작하는 구절이면 표준 표기로 저장 (약어/구분자 표기 차이 제거)
+            if _parse_references is not None:
+                refs = _parse_references(raw_scripture)
+                if refs and refs[0]["span"][0] == 0:
+                    return format_scripture_reference(refs[0])
+
             # 성경 구절 패턴만 추출 (한글 책명 + 장:절 형식)
             clean_match = re.match(
                 r'^([가-힣]+\s*\d+\s*[:\s]*\d*\s*[~\-\s]*\d*)',
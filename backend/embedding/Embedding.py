@@ -2,30 +2,48 @@
 대덕교회 설교 임베딩 생성 모듈
 
 - 모델: dragonkue/bge-m3-ko (한국어 최적화, 1024차원)
-- 방식: A 방식 (설교 1개 = 임베딩 1개)
+- 방식:
+    A 방식 (설교 1개 = 임베딩 1개)            → daedeok_sermons_with_embeddings.json
+    청크 방식 (문단 단위 청크 1개 = 임베딩 1개) → daedeok_sermon_chunk_embeddings.json
+
+사용법:
+    python -B backend/embedding/Embedding.py                  # A 방식
+    python -B backend/embedding/Embedding.py --mode chunk     # 청크 방식
+    python -B backend/embedding/Embedding.py --mode both --chunk-chars 500
+    python -B backend/embedding/Embedding.py --encoder onnx-int8   # ONNX Runtime int8 인코더 (onnxruntime 필요)
 """
 
+import argparse
 import json
 import os
+import sys
 from typing import List, Dict, Any
-from langchain_huggingface import HuggingFaceEmbeddings
 from tqdm import tqdm
 
 # 경로 설정
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROJECT_ROOT = os.path.dirname(BASE_DIR)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from backend.sermon_agent.utils.chunking import (
+    DEFAULT_CHUNK_CHARS,
+    DEFAULT_OVERLAP_SENTENCES,
+    chunk_text,
+)
+from backend.sermon_agent.utils.encoder import ENCODER_BACKENDS, create_encoder
+
 INPUT_FILE = os.path.join(BASE_DIR, "crawling", "output", "daedeok_sermons_2023_2026.json")
 OUTPUT_FILE = os.path.join(BASE_DIR, "crawling", "output", "daedeok_sermons_with_embeddings.json")
+CHUNK_OUTPUT_FILE = os.path.join(BASE_DIR, "crawling", "output", "daedeok_sermon_chunk_embeddings.json")
+ENCODER_CACHE_DIR = os.getenv("SERMON_ENCODER_CACHE_DIR", os.path.join(BASE_DIR, ".cache", "onnx"))
 
 
-def create_embedding_model():
-    """임베딩 모델 초기화 (dragonkue/bge-m3-ko)"""
-    print("임베딩 모델 로딩 중...")
+def create_embedding_model(backend: str = "torch"):
+    """임베딩 모델 초기화 (dragonkue/bge-m3-ko, 인코더 백엔드 선택)"""
+    print(f"임베딩 모델 로딩 중... ({backend})")
 
-    embeddings_model = HuggingFaceEmbeddings(
-        model_name="dragonkue/bge-m3-ko",
-        model_kwargs={'device': 'cpu'},  # GPU 사용 시 'cuda'로 변경
-        encode_kwargs={'normalize_embeddings': True},
-    )
+    embeddings_model = create_encoder(backend, "dragonkue/bge-m3-ko", cache_dir=ENCODER_CACHE_DIR)
 
     print("모델 로딩 완료!")
     return embeddings_model
@@ -85,6 +103,53 @@ def generate_embeddings(sermons: List[Dict[str, Any]], model) -> List[Dict[str,
     return sermons
 
 
+def create_chunk_embedding_text(sermon: Dict[str, Any], chunk_text_value: str) -> str:
+    """청크 임베딩용 텍스트 (제목/본문을 앞에 붙여 어느 설교의 청크인지 드러나게)"""
+    parts = []
+    if sermon.get('title'):
+        parts.append(f"제목: {sermon['title']}")
+    if sermon.get('bible_ref'):
+        parts.append(f"본문: {sermon['bible_ref']}")
+    parts.append(chunk_text_value)
+    return "\n".join(parts)
+
+
+def generate_chunk_embeddings(
+    sermons: List[Dict[str, Any]],
+    model,
+    max_chars: int = DEFAULT_CHUNK_CHARS,
+    overlap_sentences: int = DEFAULT_OVERLAP_SENTENCES,
+) -> List[Dict[str, Any]]:
+    """
+    청크 방식: content_summary를 문단 단위 청크로 나눠 청크마다 임베딩 생성
+
+    반환: [{sermon_id, chunk_index, content, char_start, char_end, embedding}, ...]
+    """
+    print(f"\n청크 분할 (최대 {max_chars}자, 문장 겹침 {overlap_sentences}개)...")
+
+    chunks: List[Dict[str, Any]] = []
+    texts: List[str] = []
+    for sermon in sermons:
+        for chunk in chunk_text(sermon.get('content_summary'), max_chars, overlap_sentences):
+            chunks.append({
+                'sermon_id': sermon['id'],
+                'chunk_index': chunk.index,
+                'content': chunk.text,
+                'char_start': chunk.char_start,
+                'char_end': chunk.char_end,
+            })
+            texts.append(create_chunk_embedding_text(sermon, chunk.text))
+
+    print(f"총 {len(texts)}개 청크 임베딩 중 (설교당 평균 {len(texts) / max(len(sermons), 1):.1f}개)...")
+    embeddings = model.embed_documents(texts)
+
+    for chunk, embedding in zip(tqdm(chunks, desc="임베딩 적용"), embeddings):
+        chunk['embedding'] = embedding
+
+    print(f"\n청크 임베딩 생성 완료! (차원: {len(embeddings[0]) if embeddings else 0})")
+    return chunks
+
+
 def save_sermons_with_embeddings(sermons: List[Dict[str, Any]], output_path: str):
     """임베딩 포함된 설교 데이터 저장"""
     with open(output_path, 'w', encoding='utf-8') as f:
@@ -92,35 +157,65 @@ def save_sermons_with_embeddings(sermons: List[Dict[str, Any]], output_path: str
     print(f"저장 완료: {output_path}")
 
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="대덕교회 설교 임베딩 생성")
+    parser.add_argument(
+        "--mode", choices=["sermon", "chunk", "both"], default="sermon",
+        help="sermon: A 방식 (설교 1개 = 임베딩 1개), chunk: 문단 청크 임베딩, both: 둘 다",
+    )
+    parser.add_argument("--chunk-chars", type=int, default=DEFAULT_CHUNK_CHARS, help="청크 최대 글자 수")
+    parser.add_argument(
+        "--chunk-overlap", type=int, default=DEFAULT_OVERLAP_SENTENCES, help="이웃 청크와 겹칠 문장 수"
+    )
+    parser.add_argument(
+        "--encoder", choices=ENCODER_BACKENDS, default="torch",
+        help="인코더 백엔드 (torch: fp32 기본, torch-int8 / onnx / onnx-int8: CPU 경량화)",
+    )
+    return parser.parse_args()
+
+
 def main():
     """메인 실행 함수"""
+    args = parse_args()
+
     print("=" * 60)
     print("대덕교회 설교 임베딩 생성")
     print("=" * 60)
     print(f"모델: dragonkue/bge-m3-ko")
-    print(f"방식: A (설교 1개 = 임베딩 1개)")
+    print(f"방식: {args.mode}")
+    print(f"인코더: {args.encoder}")
     print(f"입력: {INPUT_FILE}")
-    print(f"출력: {OUTPUT_FILE}")
+    if args.mode in ("sermon", "both"):
+        print(f"출력 (A 방식): {OUTPUT_FILE}")
+    if args.mode in ("chunk", "both"):
+        print(f"출력 (청크): {CHUNK_OUTPUT_FILE}")
     print("=" * 60 + "\n")
 
     # 1. 설교 데이터 로드
     sermons = load_sermons(INPUT_FILE)
 
     # 2. 임베딩 모델 초기화
-    model = create_embedding_model()
+    model = create_embedding_model(args.encoder)
 
-    # 3. 임베딩 생성
-    sermons_with_embeddings = generate_embeddings(sermons, model)
+    # 3. 임베딩 생성 + 저장
+    if args.mode in ("sermon", "both"):
+        sermons_with_embeddings = generate_embeddings(sermons, model)
+        save_sermons_with_embeddings(sermons_with_embeddings, OUTPUT_FILE)
 
-    # 4. 결과 저장
-    save_sermons_with_embeddings(sermons_with_embeddings, OUTPUT_FILE)
+    if args.mode in ("chunk", "both"):
+        chunks = generate_chunk_embeddings(sermons, model, args.chunk_chars, args.chunk_overlap)
+        save_sermons_with_embeddings(chunks, CHUNK_OUTPUT_FILE)
 
-    # 5. 결과 요약
+    # 4. 결과 요약
     print("\n" + "=" * 60)
     print("임베딩 생성 완료!")
-    print(f"총 설교 수: {len(sermons_with_embeddings)}")
-    print(f"임베딩 차원: {len(sermons_with_embeddings[0]['embedding'])}")
-    print(f"저장 위치: {OUTPUT_FILE}")
+    print(f"총 설교 수: {len(sermons)}")
+    if args.mode in ("sermon", "both"):
+        print(f"임베딩 차원: {len(sermons_with_embeddings[0]['embedding'])}")
+        print(f"저장 위치: {OUTPUT_FILE}")
+    if args.mode in ("chunk", "both"):
+        print(f"청크 수: {len(chunks)}")
+        print(f"저장 위치: {CHUNK_OUTPUT_FILE}")
     print("=" * 60)
 
 
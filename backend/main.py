@@ -8,19 +8,72 @@ FastAPI 진입점.
 
 from __future__ import annotations
 
+import asyncio
+import json
+import os
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Optional
 
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 from pydantic import BaseModel
+from starlette.concurrency import iterate_in_threadpool
 
-from backend.sermon_agent.graph import get_sermon_agent_graph
+from backend.sermon_agent.graph import (
+    ainvoke_graph,
+    get_sermon_agent_graph,
+    shutdown_graph_executor,
+)
+from backend.sermon_agent.nodes.answer_creator import stream_answer
 from backend.sermon_agent.state.sermon_state import State, ProfileMode
-from backend.auth.routes import router as auth_router
+from backend.sermon_agent.utils.metrics import render_prometheus
+from backend.sermon_agent.utils.scripture_parser import extract_scripture_references
+from backend.sermon_agent.utils.session_store import ConversationSession, get_session_store
+from backend.sermon_agent import warmup
+from backend.auth.db import close_pool as close_auth_pool, get_pool as get_auth_pool
+from backend.auth.routes import get_current_user, router as auth_router
+from backend.auth.utils import shutdown_hash_executor
+
+
+# 시작 워밍업: "background" (기본, 서버는 바로 뜨고 /ready가 완료를 알림)
+#             | "blocking" (워밍업이 끝나야 요청 수신) | "off" (첫 요청에서 지연 초기화)
+STARTUP_WARMUP = os.getenv("STARTUP_WARMUP", "background").lower()
+# OpenAI 연결 워밍업 (오프라인 개발 환경에서는 false)
+STARTUP_WARMUP_OPENAI = os.getenv("STARTUP_WARMUP_OPENAI", "true").lower() in ("1", "true", "yes")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """시작: 모델/DB 풀/인덱스/OpenAI 연결 워밍업, 종료: 그래프/bcrypt 스레드풀, 인증 DB 풀 정리."""
+    warmup_task: Optional[asyncio.Future] = None
+    if STARTUP_WARMUP == "off":
+        warmup.skip_warmup()
+    else:
+        # 인증 풀은 이벤트 루프에 묶이므로 여기서 연다 (연결은 백그라운드에서 채워짐)
+        try:
+            await get_auth_pool()
+        except Exception as e:
+            print(f"[Warmup] auth db_pool 실패: {e}", flush=True)
+        warmup_task = asyncio.ensure_future(
+            asyncio.to_thread(warmup.run_warmup, STARTUP_WARMUP_OPENAI)
+        )
+        if STARTUP_WARMUP == "blocking":
+            await warmup_task
 
+    yield
 
-app = FastAPI(title="Sermon AI Backend", version="0.1.0")
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
+    warmup.stop_warmup_retries()
+    shutdown_graph_executor()
+    shutdown_hash_executor()
+    await close_auth_pool()
+
+
+app = FastAPI(title="Sermon AI Backend", version="0.1.0", lifespan=lifespan)
 
 # CORS 설정: Next.js 프론트엔드에서 호출 가능하도록 허용
 app.add_middleware(
@@ -52,6 +105,7 @@ class ChatResponse(BaseModel):
     references: list
     scripture_refs: list
     category: Optional[str] = None
+    turn_count: Optional[int] = None
 
 
 # ─────────────────────────────────────────────────────────
@@ -62,33 +116,65 @@ class ChatResponse(BaseModel):
 _graph = get_sermon_agent_graph()
 
 
-@app.post("/chat/sermon", response_model=ChatResponse)
-async def chat_sermon(payload: ChatRequest) -> ChatResponse:
+def _session_key(payload: ChatRequest, current_user: Optional[dict]) -> Optional[str]:
     """
-    설교 지원 에이전트와의 단일 턴 대화.
+    세션 저장소 키 (인증된 사용자 id + session_id).
 
-    Next.js 프론트엔드에서 호출:
-      - body: { user_id, question, profile_mode, session_id }
-      - 응답: 설교 답변 텍스트 + 참고 설교 목록 + 성경 구절 참조
+    사용자 부분은 검증된 토큰(Authorization: Bearer)에서만 가져온다. body의 user_id는
+    클라이언트가 마음대로 보낼 수 있어, 그것으로 키를 만들면 남의 대화(상담 내용)를 이어받을 수 있다.
+    다음 경우에는 None → 이력 없이 단일 턴으로 처리:
+      - 로그인하지 않은 요청
+      - session_id가 비었거나 기본값("default")
     """
-    if not payload.question.strip():
-        raise HTTPException(status_code=400, detail="질문이 비어 있습니다.")
+    if not current_user:
+        return None
+    session_id = payload.session_id.strip()
+    if not session_id or session_id == "default":
+        return None
+    return f"{current_user['user_id']}:{session_id}"
+
+
+async def _load_session(
+    payload: ChatRequest, current_user: Optional[dict]
+) -> Optional[ConversationSession]:
+    key = _session_key(payload, current_user)
+    if key is None:
+        return None
+    return await asyncio.to_thread(get_session_store().load, key)
+
+
+def _record_turn(
+    session: ConversationSession, question: str, answer_text: str, rag_snippets: list
+) -> None:
+    """이번 턴(질문/답변/검색 결과)을 세션에 기록하고 저장."""
+    session.add_user_message(question)
+    session.add_assistant_message(answer_text)
+    if rag_snippets:
+        session.set_rag_snippets(rag_snippets)
+    get_session_store().save(session)
+
 
+def _build_initial_state(
+    payload: ChatRequest,
+    streaming_mode: bool = False,
+    session: Optional[ConversationSession] = None,
+) -> State:
+    """요청 payload(+ 세션 이력)로 LangGraph 초기 상태 구성."""
     now = datetime.now(timezone.utc).isoformat()
+    conversation_context = session.get_context_summary() if session else ""
 
-    # LangGraph 초기 상태 구성 (단일 턴)
-    initial_state: State = {
+    return {
         "session_id": payload.session_id,
         "user_id": None,  # TODO: users/profiles 구조와 연결 시 UUID ↔ profile_id 매핑
         "end_session": False,
         "started_at": now,
         "last_activity_at": now,
-        "turn_count": 1,
+        "turn_count": session.turn_count + 1 if session else 1,
         "messages": [],
-        "rolling_summary": None,
+        "rolling_summary": conversation_context or None,
         "profile_mode": payload.profile_mode,
         "profile_mode_prompt": None,
-        "user_context": {},
+        "user_context": {"conversation_history": conversation_context} if conversation_context else {},
         "retrieval": {},
         "rag_snippets": [],
         "user_input": payload.question,
@@ -98,29 +184,194 @@ async def chat_sermon(payload: ChatRequest) -> ChatResponse:
         "next": None,
         "uploaded_images": [],
         "ocr_results": [],
-        "streaming_mode": False,
+        "streaming_mode": streaming_mode,
         "streaming_context": {},
     }
 
+
+@app.post("/chat/sermon", response_model=ChatResponse)
+async def chat_sermon(
+    payload: ChatRequest, current_user: Optional[dict] = Depends(get_current_user)
+) -> ChatResponse:
+    """
+    설교 지원 에이전트와의 대화.
+
+    Next.js 프론트엔드에서 호출:
+      - body: { user_id, question, profile_mode, session_id }
+      - 응답: 설교 답변 텍스트 + 참고 설교 목록 + 성경 구절 참조
+      - 로그인 토큰(Authorization: Bearer)과 같은 session_id로 보내면 이전 대화를 컨텍스트로 사용
+    """
+    if not payload.question.strip():
+        raise HTTPException(status_code=400, detail="질문이 비어 있습니다.")
+
+    session = await _load_session(payload, current_user)
+    initial_state = _build_initial_state(payload, session=session)
+
     try:
-        result: Dict[str, Any] = _graph.invoke(initial_state)
+        result: Dict[str, Any] = await ainvoke_graph(initial_state, _graph)
     except Exception as e:  # noqa: BLE001
         raise HTTPException(status_code=500, detail=f"LangGraph 실행 오류: {e}") from e
 
     answer_block: Dict[str, Any] = result.get("answer") or {}
     router_block: Dict[str, Any] = result.get("router") or {}
+    answer_text = answer_block.get("text", "")
+
+    if session is not None:
+        await asyncio.to_thread(
+            _record_turn, session, payload.question, answer_text, result.get("rag_snippets") or []
+        )
 
     return ChatResponse(
-        answer=answer_block.get("text", ""),
+        answer=answer_text,
         references=answer_block.get("citations", []),  # answer_creator에서 citations로 반환
         scripture_refs=answer_block.get("scripture_refs", []),
         category=router_block.get("category"),
+        turn_count=session.turn_count if session else None,
+    )
+
+
+# ─────────────────────────────────────────────────────────
+# 스트리밍 Chat API (Server-Sent Events)
+# ─────────────────────────────────────────────────────────
+
+
+def _sse_event(event: str, data: Dict[str, Any]) -> str:
+    """SSE 이벤트 한 건을 직렬화."""
+    payload = json.dumps(data, ensure_ascii=False)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+async def _stream_sermon_events(
+    initial_state: State,
+    request_start: float,
+    session: Optional[ConversationSession] = None,
+) -> AsyncIterator[str]:
+    """
+    router + retriever 실행 후 citations → token → done 순서로 SSE 이벤트 생성.
+
+    그래프는 전용 스레드풀에서, 동기 토큰 제너레이터는 스레드풀 순회로 실행해
+    이벤트 루프를 막지 않는다. 세션이 있으면 done 전에 이번 턴을 저장한다
+    (스트림 도중 연결이 끊기면 저장하지 않음).
+    """
+    try:
+        result: Dict[str, Any] = await ainvoke_graph(initial_state, _graph)
+    except Exception as e:  # noqa: BLE001
+        yield _sse_event("error", {"detail": f"LangGraph 실행 오류: {e}"})
+        return
+
+    answer_block: Dict[str, Any] = result.get("answer") or {}
+    router_block: Dict[str, Any] = result.get("router") or {}
+    retrieval_time = time.perf_counter() - request_start
+
+    # 1) 검색 결과(출처)를 먼저 전송
+    yield _sse_event(
+        "citations",
+        {
+            "references": answer_block.get("citations", []),
+            "category": router_block.get("category"),
+            "used_rag": answer_block.get("used_rag", False),
+            "retrieval_time": round(retrieval_time, 3),
+        },
+    )
+
+    # 2) 토큰 스트리밍
+    streaming_context: Dict[str, Any] = result.get("streaming_context") or {}
+    chunks = []
+    ttft: Optional[float] = None
+
+    if streaming_context:
+        async for chunk in iterate_in_threadpool(stream_answer(streaming_context)):
+            if ttft is None:
+                ttft = time.perf_counter() - request_start
+            chunks.append(chunk)
+            yield _sse_event("token", {"text": chunk})
+    elif answer_block.get("text"):
+        # router가 answer_creator 없이 종료한 경우 (빈 입력 등)
+        ttft = time.perf_counter() - request_start
+        chunks.append(answer_block["text"])
+        yield _sse_event("token", {"text": answer_block["text"]})
+
+    # 3) 완료 이벤트 (TTFT 포함)
+    answer_text = "".join(chunks)
+    if session is not None:
+        await asyncio.to_thread(
+            _record_turn,
+            session,
+            initial_state["user_input"],
+            answer_text,
+            result.get("rag_snippets") or [],
+        )
+    total_time = time.perf_counter() - request_start
+    yield _sse_event(
+        "done",
+        {
+            "answer": answer_text,
+            "scripture_refs": extract_scripture_references(answer_text),
+            "category": router_block.get("category"),
+            "ttft": round(ttft, 3) if ttft is not None else None,
+            "retrieval_time": round(retrieval_time, 3),
+            "total_time": round(total_time, 3),
+            "turn_count": session.turn_count if session else None,
+        },
+    )
+    print(
+        f"[stream] ttft={ttft if ttft is not None else -1:.2f}s, total={total_time:.2f}s",
+        flush=True,
+    )
+
+
+@app.post("/chat/sermon/stream")
+async def chat_sermon_stream(
+    payload: ChatRequest, current_user: Optional[dict] = Depends(get_current_user)
+) -> StreamingResponse:
+    """
+    설교 지원 에이전트 스트리밍 대화 (text/event-stream).
+
+    이벤트 순서:
+      - citations: 참고 설교 목록 + 카테고리 (검색 직후 즉시 전송)
+      - token: 답변 토큰 조각 (여러 번)
+      - done: 전체 답변, 성경 구절 참조, ttft/total_time (초)
+      - error: 실행 오류
+    """
+    if not payload.question.strip():
+        raise HTTPException(status_code=400, detail="질문이 비어 있습니다.")
+
+    request_start = time.perf_counter()
+    session = await _load_session(payload, current_user)
+    initial_state = _build_initial_state(payload, streaming_mode=True, session=session)
+
+    return StreamingResponse(
+        _stream_sermon_events(initial_state, request_start, session),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
     )
 
 
 @app.get("/health")
 async def health() -> Dict[str, str]:
-    """헬스체크 엔드포인트 (Next.js / 모니터링용)."""
+    """헬스체크 엔드포인트 (Next.js / 모니터링용). 프로세스 생존 여부만 확인."""
     return {"status": "ok"}
 
 
+@app.get("/ready")
+async def ready() -> JSONResponse:
+    """
+    준비 상태 (로드밸런서 readiness probe용).
+
+    필수 구성 요소 워밍업이 끝나면 200 (부가 요소만 실패한 degraded 포함),
+    진행 중이거나 필수 요소가 실패하면 503 (실패 요소는 백그라운드에서 재시도).
+    응답에 구성 요소별 소요 시간(초), 시도 횟수, 오류를 포함한다.
+    """
+    status = warmup.get_warmup_status()
+    return JSONResponse(status, status_code=200 if warmup.is_ready() else 503)
+
+
+@app.get("/metrics")
+async def metrics() -> PlainTextResponse:
+    """프로세스 지표 (Prometheus 텍스트 포맷: DB 풀 대기/점유 시간 히스토그램, 풀 연결 수)."""
+    return PlainTextResponse(render_prometheus(), media_type="text/plain; version=0.0.4")
+
+
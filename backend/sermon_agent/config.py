@@ -26,15 +26,24 @@ class SermonAgentConfig:
     DATABASE_URL = os.getenv("DATABASE_URL")
 
     # 검색 설정
+    # 2단계 검색: RAW_TOP_K개 후보 → cross-encoder 재순위 → CONTEXT_TOP_K개를 답변 컨텍스트로 사용
     SERMON_RETRIEVER_RAW_TOP_K = int(os.getenv("SERMON_RETRIEVER_RAW_TOP_K", "10"))
     SERMON_RETRIEVER_CONTEXT_TOP_K = int(os.getenv("SERMON_RETRIEVER_CONTEXT_TOP_K", "5"))
     SERMON_RETRIEVER_SIM_FLOOR = float(os.getenv("SERMON_RETRIEVER_SIM_FLOOR", "0.3"))
 
+    # Cross-encoder 재순위 설정 (로컬 CPU, 예산 초과 시 1단계 순서 유지)
+    SERMON_RERANKER_ENABLED = os.getenv("SERMON_RERANKER_ENABLED", "false").lower() in ("1", "true", "yes")
+    SERMON_RERANKER_MODEL = os.getenv("SERMON_RERANKER_MODEL", "dragonkue/bge-reranker-v2-m3-ko")
+    SERMON_RERANKER_BUDGET_MS = float(os.getenv("SERMON_RERANKER_BUDGET_MS", "500"))
+
     # 프로필 모드 기본값
     DEFAULT_PROFILE_MODE = os.getenv("DEFAULT_PROFILE_MODE", "research")
 
-    # 임베딩 캐시 설정
-    EMBEDDING_CACHE_SIZE = int(os.getenv("EMBEDDING_CACHE_SIZE", "30"))
+    # 임베딩 캐시 설정 (메모리 LRU 바이트 예산 + SQLite 디스크 캐시)
+    EMBEDDING_CACHE_MAX_BYTES = int(os.getenv("EMBEDDING_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+    EMBEDDING_CACHE_PATH = os.getenv("EMBEDDING_CACHE_PATH")
+    EMBEDDING_CACHE_DISK_MAX_ENTRIES = int(os.getenv("EMBEDDING_CACHE_DISK_MAX_ENTRIES", "50000"))
+    EMBEDDING_CACHE_DISK_MAX_BYTES = int(os.getenv("EMBEDDING_CACHE_DISK_MAX_BYTES", str(256 * 1024 * 1024)))
 
     @classmethod
     def validate(cls) -> Dict[str, Any]:
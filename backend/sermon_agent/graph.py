@@ -13,20 +13,31 @@ graph.py
   2. sermon_retriever: 설교 아카이브 벡터 검색
   3. answer_creator: 최종 답변 생성 (OpenAI LLM)
 
+SERMON_AGENT_GRAPH_MODE=speculative:
+  router LLM 호출과 설교 검색(임베딩 + 벡터 검색)을 동시에 시작하고,
+  rag_gate에서 router가 use_rag=False로 판단하면 검색 결과를 버린다.
+
 LLM: OpenAI GPT-4o-mini
 임베딩: dragonkue/bge-m3-ko (1024차원)
 """
 
 from __future__ import annotations
 
-from typing import Literal
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Literal, Optional
 
-from langgraph.graph import StateGraph, END
+from langgraph.graph import StateGraph, START, END
 
 from backend.sermon_agent.state.sermon_state import State
 from backend.sermon_agent.nodes.query_router import query_router_node
 from backend.sermon_agent.nodes.sermon_retriever import sermon_retriever_node
 from backend.sermon_agent.nodes.answer_creator import answer_creator_node
+from backend.sermon_agent.utils.intent_rules import classify_by_rules
+
+# 그래프 모드: "sequential" (기본) | "speculative" (라우팅과 검색 병렬 실행)
+GRAPH_MODE = os.getenv("SERMON_AGENT_GRAPH_MODE", "sequential").lower()
 
 
 # ─────────────────────────────────────────────────────────
@@ -60,6 +71,58 @@ def route_after_router(
         return "answer_creator"
 
 
+# ─────────────────────────────────────────────────────────
+# 추측 실행 노드 (speculative 모드)
+# ─────────────────────────────────────────────────────────
+
+
+def speculative_retriever_node(state: State) -> Dict[str, Any]:
+    """
+    router와 병렬로 실행되는 설교 검색.
+
+    특수 액션이거나 규칙상 명백한 SMALL_TALK이면 검색하지 않는다.
+    """
+    action = (state.get("user_action") or "chat").strip()
+    if action != "chat":
+        return {}
+
+    rule = classify_by_rules(state.get("user_input") or "")
+    if rule is not None and not rule.use_rag:
+        return {}
+
+    return sermon_retriever_node(state)
+
+
+def rag_gate_node(state: State) -> Dict[str, Any]:
+    """
+    router와 추측 검색의 합류 지점.
+
+    router가 RAG 불필요로 판단하면 미리 가져온 검색 결과를 버린다.
+    """
+    router = state.get("router") or {}
+    if state.get("next") == "end" or router.get("use_rag", False):
+        return {}
+
+    discarded = len(state.get("rag_snippets") or [])
+    if not discarded:
+        return {}
+
+    wasted = (state.get("timing") or {}).get("retriever", 0.0)
+    print(f"[graph] speculative retrieval discarded ({discarded} sermons)", flush=True)
+    return {
+        "rag_snippets": [],
+        "retrieval": {"used_rag": False, "count": 0, "speculative_discarded": discarded},
+        "timing": {"speculative_wasted": wasted},
+    }
+
+
+def route_after_gate(state: State) -> Literal["answer_creator", "__end__"]:
+    """rag_gate 이후: 특수 액션이면 종료, 아니면 답변 생성."""
+    if state.get("next") == "end":
+        return END
+    return "answer_creator"
+
+
 # ─────────────────────────────────────────────────────────
 # 그래프 생성
 # ─────────────────────────────────────────────────────────
@@ -114,6 +177,51 @@ def create_sermon_agent_graph() -> StateGraph:
     return workflow.compile()
 
 
+def create_speculative_sermon_agent_graph() -> StateGraph:
+    """
+    라우팅과 검색을 병렬로 실행하는 그래프 (SERMON_AGENT_GRAPH_MODE=speculative).
+
+    그래프 구조:
+        START
+          ├──> query_router ─────────────┐
+          │                              ▼
+          └──> speculative_retriever ──> rag_gate ──(end)──> END
+                                         │
+                                         └──> answer_creator ──> END
+
+    대부분의 질문이 RAG를 사용하므로, router LLM 왕복과 임베딩/벡터 검색이
+    겹쳐 임계 경로에서 한 단계가 빠진다. use_rag=False면 검색 결과는 버려진다.
+
+    Returns:
+        컴파일된 StateGraph
+    """
+    workflow = StateGraph(State)
+
+    workflow.add_node("query_router", query_router_node)
+    workflow.add_node("speculative_retriever", speculative_retriever_node)
+    workflow.add_node("rag_gate", rag_gate_node)
+    workflow.add_node("answer_creator", answer_creator_node)
+
+    # 시작 -> query_router, speculative_retriever (동시 실행)
+    workflow.add_edge(START, "query_router")
+    workflow.add_edge(START, "speculative_retriever")
+
+    # 두 노드가 모두 끝나면 rag_gate
+    workflow.add_edge(["query_router", "speculative_retriever"], "rag_gate")
+
+    workflow.add_conditional_edges(
+        "rag_gate",
+        route_after_gate,
+        {
+            "answer_creator": "answer_creator",
+            END: END,
+        },
+    )
+    workflow.add_edge("answer_creator", END)
+
+    return workflow.compile()
+
+
 # ─────────────────────────────────────────────────────────
 # 싱글톤 인스턴스
 # ─────────────────────────────────────────────────────────
@@ -129,8 +237,11 @@ def get_sermon_agent_graph():
     """
     global _graph_instance
     if _graph_instance is None:
-        print("[graph] Initializing sermon agent graph...", flush=True)
-        _graph_instance = create_sermon_agent_graph()
+        print(f"[graph] Initializing sermon agent graph (mode={GRAPH_MODE})...", flush=True)
+        if GRAPH_MODE == "speculative":
+            _graph_instance = create_speculative_sermon_agent_graph()
+        else:
+            _graph_instance = create_sermon_agent_graph()
         print("[graph] Graph initialized successfully", flush=True)
     return _graph_instance
 
@@ -141,3 +252,45 @@ def reset_graph():
     """
     global _graph_instance
     _graph_instance = None
+
+
+# ─────────────────────────────────────────────────────────
+# 비동기 실행 (이벤트 루프 블로킹 방지)
+# ─────────────────────────────────────────────────────────
+
+# 노드들은 동기 OpenAI 호출, CPU 임베딩, psycopg 쿼리를 수행하므로
+# 전용 스레드풀에서 실행한다. 워커 수가 동시 실행 그래프 수의 상한이 된다.
+GRAPH_MAX_WORKERS = int(os.getenv("SERMON_AGENT_GRAPH_WORKERS", "8"))
+
+_graph_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_graph_executor() -> ThreadPoolExecutor:
+    """그래프 실행용 스레드풀 (싱글톤)."""
+    global _graph_executor
+    if _graph_executor is None:
+        _graph_executor = ThreadPoolExecutor(
+            max_workers=GRAPH_MAX_WORKERS,
+            thread_name_prefix="sermon-graph",
+        )
+    return _graph_executor
+
+
+async def ainvoke_graph(state: State, graph=None) -> Dict[str, Any]:
+    """
+    그래프를 전용 스레드풀에서 실행하고 결과를 await.
+
+    FastAPI 핸들러에서 사용하면 한 요청의 LLM/DB 대기가
+    다른 요청(/health 포함)을 막지 않는다.
+    """
+    graph = graph or get_sermon_agent_graph()
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_graph_executor(), graph.invoke, state)
+
+
+def shutdown_graph_executor() -> None:
+    """스레드풀 종료 (서버 종료 시)."""
+    global _graph_executor
+    if _graph_executor is not None:
+        _graph_executor.shutdown(wait=False, cancel_futures=True)
+        _graph_executor = None
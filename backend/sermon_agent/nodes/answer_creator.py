@@ -7,6 +7,8 @@ answer_creator.py
   - 검색된 설교 정보와 사용자 질문을 바탕으로 최종 답변 생성
   - 멀티 프로필 모드에 따라 다른 스타일의 답변 제공
   - 스트리밍 모드 지원
+  - 의미 기반 답변 캐시: 비슷한 질문 + 같은 검색 결과면 LLM 호출 생략
+  - 설교 컨텍스트는 토큰 예산 안에서 질문 관련 문단 위주로 발췌
 
 핵심:
   - 답변 시 반드시 출처(설교 날짜, 제목)를 명시
@@ -18,10 +20,9 @@ LLM: OpenAI GPT-4o-mini
 from __future__ import annotations
 
 import os
-import re
 import time
 from datetime import datetime, timezone
-from typing import Any, Dict, Generator, List, Optional
+from typing import Any, Dict, Generator, List, Optional, Tuple
 
 from dotenv import load_dotenv
 from openai import OpenAI
@@ -43,6 +44,14 @@ from backend.sermon_agent.state.sermon_state import (
     AnswerResult,
     ProfileMode,
 )
+from backend.sermon_agent.nodes.sermon_retriever import (
+    MEMORY_INDEX_REFRESH_SECONDS,
+    embed_query,
+    get_connection_pool,
+)
+from backend.sermon_agent.utils.answer_cache import SemanticAnswerCache, make_bucket_key
+from backend.sermon_agent.utils.context_packer import TokenCounter, pack_sermon_context
+from backend.sermon_agent.utils.scripture_parser import extract_scripture_references
 
 load_dotenv()
 
@@ -53,7 +62,22 @@ load_dotenv()
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 ANSWER_MODEL = os.getenv("ANSWER_MODEL", "gpt-4o-mini")
 
+# 설교 컨텍스트 토큰 예산 (전체 / 설교 1편 요약 상한)
+ANSWER_CONTEXT_MAX_TOKENS = int(os.getenv("ANSWER_CONTEXT_MAX_TOKENS", "3000"))
+ANSWER_CONTEXT_SNIPPET_MAX_TOKENS = int(os.getenv("ANSWER_CONTEXT_SNIPPET_MAX_TOKENS", "700"))
+
+# 의미 기반 답변 캐시
+# 질문 임베딩 코사인 유사도 임계값, 최대 항목 수 (0이면 비활성화), 항목 수명(초, 0이면 무제한)
+ANSWER_CACHE_THRESHOLD = float(os.getenv("ANSWER_CACHE_THRESHOLD", "0.95"))
+ANSWER_CACHE_MAX_ENTRIES = int(os.getenv("ANSWER_CACHE_MAX_ENTRIES", "512"))
+ANSWER_CACHE_TTL_SECONDS = float(os.getenv("ANSWER_CACHE_TTL_SECONDS", "86400"))
+
+# 스트리밍 중 오류가 나면 이 접두어로 오류 문구를 흘려보낸다 (캐시 저장 제외 판단용)
+_STREAM_ERROR_PREFIX = "\n\n[오류 발생: "
+
 _client: Optional[OpenAI] = None
+_token_counter: Optional[TokenCounter] = None
+_answer_cache: Optional[SemanticAnswerCache] = None
 
 
 def _get_client() -> OpenAI:
@@ -63,6 +87,13 @@ def _get_client() -> OpenAI:
     return _client
 
 
+def _get_token_counter() -> TokenCounter:
+    global _token_counter
+    if _token_counter is None:
+        _token_counter = TokenCounter(ANSWER_MODEL)
+    return _token_counter
+
+
 # ─────────────────────────────────────────────────────────
 # 유틸리티 함수
 # ─────────────────────────────────────────────────────────
@@ -73,22 +104,8 @@ def _now_iso() -> str:
 
 
 def _extract_scripture_references(text: str) -> List[str]:
-    """텍스트에서 성경 구절 참조 추출."""
-    patterns = [
-        r"[가-힣]+복음?\s*\d+장\s*\d+절?(?:\s*[-~]\s*\d+절?)?",
-        r"[가-힣]+복음?\s*\d+:\d+(?:\s*[-~]\s*\d+)?",
-        r"[가-힣]+서?\s*\d+장\s*\d+절?(?:\s*[-~]\s*\d+절?)?",
-        r"[가-힣]+서?\s*\d+:\d+(?:\s*[-~]\s*\d+)?",
-        r"시편\s*\d+편(?:\s*\d+절?)?",
-        r"잠언\s*\d+장\s*\d+절?",
-    ]
-
-    references = []
-    for pattern in patterns:
-        matches = re.findall(pattern, text)
-        references.extend(matches)
-
-    return list(set(references))
+    """텍스트에서 성경 구절 참조 추출 (정규화된 책 이름, 등장 순서)."""
+    return extract_scripture_references(text)
 
 
 # ─────────────────────────────────────────────────────────
@@ -162,45 +179,35 @@ def _get_system_prompt(mode: ProfileMode) -> str:
 # ─────────────────────────────────────────────────────────
 
 
-def _format_sermon_context(snippets: List[SermonSnippet]) -> str:
-    """검색된 설교를 LLM 컨텍스트로 포맷팅."""
-    if not snippets:
-        return ""
-
-    lines = [
-        "=" * 50,
-        "[참고 설교 아카이브] 아래 내용만을 바탕으로 답변하세요",
-        "=" * 50,
-        "",
-    ]
-
-    for i, s in enumerate(snippets, 1):
-        lines.append(f"[설교 {i}]")
-        lines.append(f"  제목: {s.get('title', '제목 없음')}")
-        lines.append(f"  날짜: {s.get('date', '날짜 미상')}")
-
-        if s.get("scripture"):
-            lines.append(f"  성경 본문: {s['scripture']}")
-
-        if s.get("preacher"):
-            lines.append(f"  설교자: {s['preacher']}")
-
-        if s.get("score"):
-            lines.append(f"  관련도: {s['score']:.1%}")
-
-        if s.get("summary"):
-            lines.append(f"  \n  [설교 내용]")
-            lines.append(f"  {s['summary']}")
-
-        lines.append("-" * 50)
+def _format_sermon_context(
+    snippets: List[SermonSnippet], query: str = ""
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    검색된 설교를 LLM 컨텍스트로 포맷팅 (ANSWER_CONTEXT_MAX_TOKENS 예산).
 
-    lines.append("")
-    lines.append(
-        "위 설교 내용을 바탕으로 질문에 답변하세요. 반드시 날짜와 제목을 인용하세요."
+    Returns:
+        (컨텍스트, 패킹 통계)
+    """
+    return pack_sermon_context(
+        snippets,
+        query,
+        _get_token_counter(),
+        max_tokens=ANSWER_CONTEXT_MAX_TOKENS,
+        snippet_max_tokens=ANSWER_CONTEXT_SNIPPET_MAX_TOKENS,
     )
-    lines.append("=" * 50)
 
-    return "\n".join(lines)
+
+def _count_prompt_tokens(
+    user_input: str,
+    profile_mode: ProfileMode,
+    sermon_context: str,
+    category: str,
+    conversation_context: str = "",
+) -> int:
+    """시스템 + 사용자 프롬프트 토큰 수 (답변 LLM 입력 크기)."""
+    counter = _get_token_counter()
+    user_prompt = _build_user_prompt(user_input, sermon_context, category, conversation_context)
+    return counter.count(_get_system_prompt(profile_mode)) + counter.count(user_prompt)
 
 
 def _build_user_prompt(
@@ -335,7 +342,7 @@ def _run_answer_llm_stream(
                 yield chunk.choices[0].delta.content
 
     except Exception as e:
-        yield f"\n\n[오류 발생: {str(e)}]"
+        yield f"{_STREAM_ERROR_PREFIX}{str(e)}]"
 
 
 # ─────────────────────────────────────────────────────────
@@ -360,6 +367,97 @@ def _build_citations(snippets: List[SermonSnippet]) -> List[Citation]:
     return citations
 
 
+# ─────────────────────────────────────────────────────────
+# 의미 기반 답변 캐시
+# ─────────────────────────────────────────────────────────
+
+
+def _get_answer_cache() -> SemanticAnswerCache:
+    """답변 캐시 (싱글톤, 아카이브 변경 시 전체 무효화)."""
+    global _answer_cache
+    if _answer_cache is None:
+        _answer_cache = SemanticAnswerCache(
+            threshold=ANSWER_CACHE_THRESHOLD,
+            max_entries=ANSWER_CACHE_MAX_ENTRIES,
+            ttl_seconds=ANSWER_CACHE_TTL_SECONDS,
+            refresh_interval=MEMORY_INDEX_REFRESH_SECONDS,
+        )
+    _answer_cache.maybe_refresh(get_connection_pool())
+    return _answer_cache
+
+
+def get_answer_cache_stats() -> Dict[str, Any]:
+    """답변 캐시 hit/miss, hit율, 절약한 LLM 시간."""
+    if _answer_cache is None:
+        return {"enabled": ANSWER_CACHE_MAX_ENTRIES > 0, "lookups": 0}
+    return {"enabled": ANSWER_CACHE_MAX_ENTRIES > 0, **_answer_cache.stats()}
+
+
+def _answer_cache_key(
+    user_input: str,
+    profile_mode: ProfileMode,
+    category: str,
+    snippets: List[SermonSnippet],
+    conversation_context: str,
+) -> Optional[Dict[str, Any]]:
+    """
+    캐시 조회/저장 키 {"qvec", "bucket", "version"}.
+
+    대화 이력이 있으면 같은 질문이라도 답이 달라지므로, 검색 결과가 없으면
+    답변 근거가 없으므로 캐시하지 않는다 (None).
+    질문 임베딩은 사용자 질문 원문만 인코딩한다 (모드 접두어가 붙은 검색 쿼리는
+    짧은 질문에서 접두어가 유사도를 지배해 서로 다른 질문이 임계값을 넘을 수 있음).
+    모드는 bucket 키로 구분한다.
+    """
+    question = (user_input or "").strip()
+    if ANSWER_CACHE_MAX_ENTRIES <= 0 or conversation_context or not snippets or not question:
+        return None
+
+    try:
+        cache = _get_answer_cache()
+        qvec = embed_query(question)
+    except Exception as e:
+        print(f"  [AnswerCache] 키 생성 실패 (캐시 생략): {e}", flush=True)
+        return None
+    if not qvec.any():
+        # 임베딩 실패 시 영벡터 → 캐시 생략
+        return None
+
+    return {
+        "qvec": qvec,
+        "bucket": make_bucket_key(profile_mode, category, [s.get("sermon_id", "") for s in snippets]),
+        "version": cache.version,
+    }
+
+
+def _cache_status(
+    cache_key: Optional[Dict[str, Any]], cache_hit: Optional[Dict[str, Any]]
+) -> Optional[str]:
+    """로그 메타용 캐시 상태: "hit" | "miss" | None (캐시 대상 아님)."""
+    if cache_key is None:
+        return None
+    return "hit" if cache_hit is not None else "miss"
+
+
+def _lookup_answer_cache(cache_key: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    if cache_key is None or _answer_cache is None:
+        return None
+    return _answer_cache.lookup(cache_key["qvec"], cache_key["bucket"])
+
+
+def _store_answer_cache(
+    cache_key: Optional[Dict[str, Any]],
+    question: str,
+    answer: Dict[str, Any],
+    llm_time: float,
+) -> None:
+    if cache_key is None or _answer_cache is None:
+        return
+    _answer_cache.store(
+        cache_key["qvec"], cache_key["bucket"], question, answer, llm_time, cache_key["version"]
+    )
+
+
 # ─────────────────────────────────────────────────────────
 # 메인 노드 함수
 # ─────────────────────────────────────────────────────────
@@ -424,22 +522,65 @@ def answer_creator_node(state: State) -> Dict[str, Any]:
             "timing": {"answer": elapsed},
         }
 
-    # 설교 컨텍스트 구성
+    # 설교 컨텍스트 구성 (토큰 예산 안에서 발췌)
+    # 출처는 실제로 컨텍스트에 들어간 설교만 ([설교 i] 번호와 citations 순서 일치)
+    context_stats: Dict[str, Any] = {}
+    cited_snippets: List[SermonSnippet] = []
     if rag_snippets:
-        sermon_context = _format_sermon_context(rag_snippets)
+        sermon_context, context_stats = _format_sermon_context(rag_snippets, user_input)
+        cited_snippets = [rag_snippets[i] for i in context_stats["included_indices"]]
     else:
         sermon_context = """
 [알림] 관련 설교를 찾지 못했습니다.
 제공된 설교 아카이브에서 해당 주제와 관련된 설교가 검색되지 않았습니다.
 """
+    prompt_tokens = _count_prompt_tokens(
+        user_input, profile_mode, sermon_context, category, conversation_context
+    )
+    token_meta = {"prompt_tokens": prompt_tokens, "context": context_stats}
+    if context_stats:
+        print(
+            f"[answer] prompt {prompt_tokens} tokens "
+            f"(context {context_stats['context_tokens']}/{ANSWER_CONTEXT_MAX_TOKENS}, "
+            f"sermons {context_stats['included']}/{len(rag_snippets)}, "
+            f"source {context_stats['source_tokens']})",
+            flush=True,
+        )
+
+    cache_key = _answer_cache_key(
+        user_input, profile_mode, category, rag_snippets, conversation_context
+    )
 
     # 스트리밍 모드: 컨텍스트만 저장하고 LLM 호출 스킵
     if streaming_mode:
         print(f"[answer] streaming mode - skipping LLM call", flush=True)
 
+        citations = _build_citations(cited_snippets)
+        streaming_context = {
+            "user_input": user_input,
+            "profile_mode": profile_mode,
+            "sermon_context": sermon_context,
+            "category": category,
+            "conversation_context": conversation_context,
+        }
+
+        # 캐시 hit: 저장된 답변을 그대로 흘려보낸다. miss: 스트리밍 완료 후 저장
+        cache_hit = _lookup_answer_cache(cache_key)
+        if cache_hit is not None:
+            citations = cache_hit["answer"]["citations"]
+            streaming_context["cached_answer"] = cache_hit["answer"]["text"]
+            print(
+                f"[answer] cache hit (sim={cache_hit['similarity']:.3f}, "
+                f"saved {cache_hit['llm_time']:.2f}s)",
+                flush=True,
+            )
+        elif cache_key is not None:
+            streaming_context["answer_cache_key"] = cache_key
+            streaming_context["citations"] = citations
+
         answer: AnswerResult = {
             "text": "",  # 스트리밍으로 채워질 예정
-            "citations": _build_citations(rag_snippets),
+            "citations": citations,
             "scripture_refs": [],
             "category": category,
             "profile_mode": profile_mode,
@@ -447,19 +588,15 @@ def answer_creator_node(state: State) -> Dict[str, Any]:
             "used_rag": bool(rag_snippets),
         }
 
-        streaming_context = {
-            "user_input": user_input,
-            "profile_mode": profile_mode,
-            "sermon_context": sermon_context,
-            "category": category,
-            "conversation_context": conversation_context,
-        }
-
         tool_msg: Message = {
             "role": "tool",
             "content": "[answer] streaming mode - context prepared",
             "created_at": _now_iso(),
-            "meta": {"streaming": True},
+            "meta": {
+                "streaming": True,
+                "answer_cache": _cache_status(cache_key, cache_hit),
+                **token_meta,
+            },
         }
 
         elapsed = time.time() - start_time
@@ -470,20 +607,33 @@ def answer_creator_node(state: State) -> Dict[str, Any]:
             "timing": {"answer": elapsed},
         }
 
-    # 일반 모드: LLM 호출
+    # 일반 모드: 캐시 조회 → miss면 LLM 호출
     try:
-        llm_start = time.time()
-        answer_text = _run_answer_llm(
-            user_input,
-            profile_mode,
-            sermon_context,
-            category,
-            conversation_context,
-        )
-        llm_time = time.time() - llm_start
-
-        scripture_refs = _extract_scripture_references(answer_text)
-        citations = _build_citations(rag_snippets)
+        cache_hit = _lookup_answer_cache(cache_key)
+        if cache_hit is not None:
+            answer_text = cache_hit["answer"]["text"]
+            scripture_refs = cache_hit["answer"]["scripture_refs"]
+            citations = cache_hit["answer"]["citations"]
+            llm_time = 0.0
+        else:
+            llm_start = time.time()
+            answer_text = _run_answer_llm(
+                user_input,
+                profile_mode,
+                sermon_context,
+                category,
+                conversation_context,
+            )
+            llm_time = time.time() - llm_start
+
+            scripture_refs = _extract_scripture_references(answer_text)
+            citations = _build_citations(cited_snippets)
+            _store_answer_cache(
+                cache_key,
+                user_input,
+                {"text": answer_text, "citations": citations, "scripture_refs": scripture_refs},
+                llm_time,
+            )
 
         answer: AnswerResult = {
             "text": answer_text,
@@ -495,7 +645,13 @@ def answer_creator_node(state: State) -> Dict[str, Any]:
             "used_rag": bool(rag_snippets),
         }
 
-        log_content = f"[answer] generated ({len(answer_text)} chars, {llm_time:.2f}s)"
+        if cache_hit is not None:
+            log_content = (
+                f"[answer] cache hit ({len(answer_text)} chars, "
+                f"sim={cache_hit['similarity']:.3f}, saved {cache_hit['llm_time']:.2f}s)"
+            )
+        else:
+            log_content = f"[answer] generated ({len(answer_text)} chars, {llm_time:.2f}s)"
         tool_msg: Message = {
             "role": "tool",
             "content": log_content,
@@ -503,6 +659,8 @@ def answer_creator_node(state: State) -> Dict[str, Any]:
             "meta": {
                 "llm_time": llm_time,
                 "citations_count": len(citations),
+                "answer_cache": _cache_status(cache_key, cache_hit),
+                **token_meta,
             },
         }
 
@@ -518,10 +676,7 @@ def answer_creator_node(state: State) -> Dict[str, Any]:
             },
         }
 
-        print(
-            f"[answer] generated {len(answer_text)} chars in {llm_time:.2f}s",
-            flush=True,
-        )
+        print(log_content, flush=True)
 
     except Exception as e:
         print(f"[answer] ERROR: {e}", flush=True)
@@ -588,10 +743,35 @@ def stream_answer(streaming_context: Dict[str, Any]) -> Generator[str, None, Non
     category = streaming_context.get("category", "OTHER")
     conversation_context = streaming_context.get("conversation_context", "")
 
-    yield from _run_answer_llm_stream(
+    # 캐시 hit: 저장된 답변을 한 번에 전달
+    cached_answer = streaming_context.get("cached_answer")
+    if cached_answer:
+        yield cached_answer
+        return
+
+    cache_key = streaming_context.get("answer_cache_key")
+    llm_start = time.time()
+    chunks: List[str] = []
+    for chunk in _run_answer_llm_stream(
         user_input,
         profile_mode,
         sermon_context,
         category,
         conversation_context,
-    )
+    ):
+        chunks.append(chunk)
+        yield chunk
+
+    # 끝까지 정상 생성된 답변만 저장 (클라이언트가 중간에 끊으면 여기까지 오지 않는다)
+    answer_text = "".join(chunks)
+    if cache_key is not None and answer_text and _STREAM_ERROR_PREFIX not in answer_text:
+        _store_answer_cache(
+            cache_key,
+            user_input,
+            {
+                "text": answer_text,
+                "citations": streaming_context.get("citations", []),
+                "scripture_refs": _extract_scripture_references(answer_text),
+            },
+            time.time() - llm_start,
+        )
@@ -8,6 +8,10 @@ query_router.py
     1) 발화 타입 분류 (SERMON_PREP, COUNSELING, SCRIPTURE_QA, SERMON_SEARCH, SMALL_TALK, OTHER)
     2) RAG 사용 여부 판단 (설교 아카이브 검색 필요 여부)
 
+  - 인사/설교 검색처럼 명확한 발화는 규칙 기반 fast path로 LLM 없이 결정
+  - ROUTER_MODE=classifier: 검색 쿼리 임베딩(retriever와 공유) + 로컬 분류기로 결정,
+    확신도가 낮을 때만 LLM 호출
+  - LLM 결정은 (정규화 텍스트, profile_mode) 키로 TTL 캐시 → 같은 질문 반복 시 LLM 생략
   - 결정 결과는 state["router"]에 저장
   - 메시지 로그를 state["messages"]에 append
 
@@ -16,11 +20,13 @@ LLM: OpenAI GPT-4o-mini
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
+import threading
 import time
 from datetime import datetime, timezone
-from typing import Any, Dict, Literal, Optional
+from typing import Any, Dict, Literal, Optional, Tuple
 
 from dotenv import load_dotenv
 from openai import OpenAI
@@ -41,6 +47,13 @@ from backend.sermon_agent.state.sermon_state import (
     RouterDecision,
     QuestionCategory,
 )
+from backend.sermon_agent.utils.intent_classifier import IntentClassifier, RouterDecisionLog
+from backend.sermon_agent.utils.intent_rules import classify_by_rules
+from backend.sermon_agent.utils.router_cache import (
+    MemoryRouterCacheBackend,
+    RouterDecisionCache,
+    SQLiteRouterCacheBackend,
+)
 
 load_dotenv()
 
@@ -51,7 +64,55 @@ load_dotenv()
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 ROUTER_MODEL = os.getenv("ROUTER_MODEL", "gpt-4o-mini")
 
+# 규칙 기반 fast path 최소 확신도 (1보다 크게 두면 항상 LLM 사용)
+ROUTER_RULE_MIN_CONFIDENCE = float(os.getenv("ROUTER_RULE_MIN_CONFIDENCE", "0.85"))
+
+# 라우터 모드: "llm" (기본) | "classifier" (로컬 분류기 → 확신도 낮으면 LLM)
+ROUTER_MODE = os.getenv("ROUTER_MODE", "llm").lower()
+_BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+ROUTER_CLASSIFIER_PATH = os.getenv(
+    "ROUTER_CLASSIFIER_PATH",
+    os.path.join(_BACKEND_DIR, ".cache", "router_classifier.joblib"),
+)
+ROUTER_CLASSIFIER_MIN_CONFIDENCE = float(os.getenv("ROUTER_CLASSIFIER_MIN_CONFIDENCE", "0.6"))
+# 라우터 결정 로그 (분류기 학습 데이터). 질문 원문이 남으므로 기본은 기록 안 함 (opt-in)
+# 예: ROUTER_DECISION_LOG=backend/.cache/router_decisions.jsonl
+ROUTER_DECISION_LOG = os.getenv("ROUTER_DECISION_LOG", "")
+# 로그 파일 크기 상한 (넘으면 .1, .2 ... 로 회전) / 회전 파일 수 / 보관 기간 (일)
+ROUTER_DECISION_LOG_MAX_BYTES = int(os.getenv("ROUTER_DECISION_LOG_MAX_BYTES", str(10 * 1024 * 1024)))
+ROUTER_DECISION_LOG_BACKUPS = int(os.getenv("ROUTER_DECISION_LOG_BACKUPS", "2"))
+ROUTER_DECISION_LOG_RETENTION_DAYS = float(os.getenv("ROUTER_DECISION_LOG_RETENTION_DAYS", "30"))
+
+# LLM 결정 캐시: "memory" (기본, 워커별) | "sqlite" (워커 간 공유) | "none"
+ROUTER_CACHE_BACKEND = os.getenv("ROUTER_CACHE_BACKEND", "memory").lower()
+ROUTER_CACHE_TTL_SECONDS = float(os.getenv("ROUTER_CACHE_TTL_SECONDS", "3600"))
+ROUTER_CACHE_MAX_ENTRIES = int(os.getenv("ROUTER_CACHE_MAX_ENTRIES", "4096"))
+ROUTER_CACHE_PATH = os.getenv(
+    "ROUTER_CACHE_PATH",
+    os.path.join(_BACKEND_DIR, ".cache", "router_cache.sqlite3"),
+)
+
 _client: Optional[OpenAI] = None
+_router_cache: Optional[RouterDecisionCache] = None
+_router_cache_checked = False
+_router_cache_lock = threading.Lock()
+_classifier: Optional[IntentClassifier] = None
+_classifier_checked = False
+_classifier_lock = threading.Lock()
+_decision_log: Optional[RouterDecisionLog] = (
+    RouterDecisionLog(
+        ROUTER_DECISION_LOG,
+        max_bytes=ROUTER_DECISION_LOG_MAX_BYTES,
+        backups=ROUTER_DECISION_LOG_BACKUPS,
+        retention_days=ROUTER_DECISION_LOG_RETENTION_DAYS,
+    )
+    if ROUTER_DECISION_LOG
+    else None
+)
+
+# 라우팅 경로별 카운터 (rule:<규칙>, classifier, cache, llm, llm_error, action, empty)
+_route_counts: Dict[str, int] = {}
+_route_counts_lock = threading.Lock()
 
 
 def _get_client() -> OpenAI:
@@ -70,6 +131,106 @@ def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+def _count_route(path: str) -> None:
+    with _route_counts_lock:
+        _route_counts[path] = _route_counts.get(path, 0) + 1
+
+
+def get_router_stats() -> Dict[str, Any]:
+    """라우팅 경로별 횟수와 LLM 생략 비율."""
+    with _route_counts_lock:
+        counts = dict(_route_counts)
+    rule = sum(v for k, v in counts.items() if k.startswith("rule:"))
+    local = rule + counts.get("classifier", 0) + counts.get("cache", 0)
+    llm = counts.get("llm", 0) + counts.get("llm_error", 0)
+    cache = _get_router_cache()
+    return {
+        "mode": ROUTER_MODE,
+        "paths": counts,
+        "rule": rule,
+        "classifier": counts.get("classifier", 0),
+        "cache": cache.stats() if cache is not None else None,
+        "llm": llm,
+        "llm_skip_rate": round(local / (local + llm), 4) if local + llm else 0.0,
+    }
+
+
+def _get_router_cache() -> Optional[RouterDecisionCache]:
+    """LLM 결정 캐시 (싱글톤, ROUTER_CACHE_BACKEND=none이면 None)."""
+    global _router_cache, _router_cache_checked
+    if _router_cache_checked:
+        return _router_cache
+
+    with _router_cache_lock:
+        if _router_cache_checked:
+            return _router_cache
+        if ROUTER_CACHE_BACKEND == "none" or ROUTER_CACHE_MAX_ENTRIES <= 0:
+            _router_cache_checked = True
+            return None
+
+        backend = None
+        if ROUTER_CACHE_BACKEND == "sqlite":
+            try:
+                backend = SQLiteRouterCacheBackend(
+                    ROUTER_CACHE_PATH, ROUTER_CACHE_MAX_ENTRIES, ROUTER_CACHE_TTL_SECONDS
+                )
+            except Exception as e:
+                print(f"  [RouterCache] SQLite 캐시 비활성화 ({e}) -> 메모리 캐시 사용", flush=True)
+        if backend is None:
+            backend = MemoryRouterCacheBackend(ROUTER_CACHE_MAX_ENTRIES, ROUTER_CACHE_TTL_SECONDS)
+
+        # 모델이나 프롬프트가 바뀌면 이전 결정을 쓰지 않도록 키에 지문을 넣는다
+        prompt_hash = hashlib.sha256(SYSTEM_PROMPT.encode("utf-8")).hexdigest()[:12]
+        _router_cache = RouterDecisionCache(backend, namespace=f"{ROUTER_MODEL}:{prompt_hash}")
+        # 캐시를 만든 뒤에 확인 완료 표시 (잠금 밖 fast path가 None을 보지 않도록, 생성 중 예외면 다음 호출에서 재시도)
+        _router_cache_checked = True
+        return _router_cache
+
+
+def _get_classifier() -> Optional[IntentClassifier]:
+    """학습된 로컬 분류기 (없으면 None → LLM 사용)."""
+    global _classifier, _classifier_checked
+    if _classifier_checked:
+        return _classifier
+
+    # 시작 워밍업과 첫 요청이 동시에 로드하지 않도록 잠금 후 다시 확인
+    with _classifier_lock:
+        if _classifier_checked:
+            return _classifier
+        if os.path.exists(ROUTER_CLASSIFIER_PATH):
+            try:
+                _classifier = IntentClassifier.load(ROUTER_CLASSIFIER_PATH)
+                print(
+                    f"  [router] 분류기 로드: {ROUTER_CLASSIFIER_PATH} "
+                    f"({_classifier.meta.get('n_samples')}개 학습)",
+                    flush=True,
+                )
+            except Exception as e:
+                print(f"  [router] 분류기 로드 실패: {e}", flush=True)
+        else:
+            print(f"  [router] 분류기 없음 ({ROUTER_CLASSIFIER_PATH}) -> LLM 사용", flush=True)
+        # 로드 결과를 기록한 뒤에 확인 완료 표시 (잠금 밖 fast path가 None을 보지 않도록)
+        _classifier_checked = True
+    return _classifier
+
+
+def _classify_locally(text: str, profile_mode: str):
+    """
+    retriever와 같은 검색 쿼리 임베딩으로 분류 (임베딩 캐시 공유 → 인코딩 1회).
+
+    Returns:
+        (category, use_rag, confidence) 또는 분류기가 없으면 None
+    """
+    classifier = _get_classifier()
+    if classifier is None:
+        return None
+
+    from backend.sermon_agent.nodes.sermon_retriever import build_search_query, embed_query
+
+    qvec = embed_query(build_search_query(text, profile_mode))
+    return classifier.predict(qvec)
+
+
 def _extract_json(text: str) -> str:
     """응답에서 JSON 블록만 추출."""
     # ```json ... ``` 형식 처리
@@ -219,6 +380,28 @@ def _call_router_llm(text: str, profile_mode: str) -> RouterDecisionSchema:
     return RouterDecisionSchema(**data)
 
 
+def _route_with_llm(text: str, profile_mode: str) -> Tuple[RouterDecisionSchema, str]:
+    """
+    결정 캐시 조회 후 miss면 LLM 호출 (결과 저장).
+
+    Returns:
+        (결정, 경로) — 경로는 "cache" 또는 "llm"
+    """
+    cache = _get_router_cache()
+    if cache is not None:
+        cached = cache.get(text, profile_mode)
+        if cached is not None:
+            try:
+                return RouterDecisionSchema(**cached), "cache"
+            except ValueError:
+                pass  # 스키마가 바뀐 예전 항목 → LLM으로 갱신
+
+    decision = _call_router_llm(text, profile_mode)
+    if cache is not None:
+        cache.put(text, profile_mode, decision.model_dump())
+    return decision, "llm"
+
+
 # ─────────────────────────────────────────────────────────
 # 메인 노드 함수
 # ─────────────────────────────────────────────────────────
@@ -252,6 +435,7 @@ def query_router_node(state: State) -> Dict[str, Any]:
 
     # 저장 액션
     if action == "save":
+        _count_route("action")
         router_info: RouterDecision = {
             "category": "OTHER",
             "use_rag": False,
@@ -273,6 +457,7 @@ def query_router_node(state: State) -> Dict[str, Any]:
 
     # 리셋 액션
     if action in ("reset", "reset_save", "reset_drop"):
+        _count_route("action")
         router_info: RouterDecision = {
             "category": "OTHER",
             "use_rag": False,
@@ -294,6 +479,7 @@ def query_router_node(state: State) -> Dict[str, Any]:
 
     # 빈 입력
     if not text:
+        _count_route("empty")
         router_info: RouterDecision = {
             "category": "OTHER",
             "use_rag": False,
@@ -313,10 +499,97 @@ def query_router_node(state: State) -> Dict[str, Any]:
             "timing": {"router": elapsed},
         }
 
-    # ── LLM 라우터 호출 ─────────────────────────────────
+    # ── 규칙 기반 fast path ─────────────────────────────
+
+    rule = classify_by_rules(text)
+    if rule is not None and rule.confidence >= ROUTER_RULE_MIN_CONFIDENCE:
+        _count_route(f"rule:{rule.rule}")
+        router_info: RouterDecision = {
+            "category": rule.category,
+            "use_rag": rule.use_rag,
+            "reason": f"[rule:{rule.rule}] {rule.reason}",
+        }
+        tool_msg: Message = {
+            "role": "tool",
+            "content": (
+                f"[router] rule={rule.rule}, category={rule.category}, "
+                f"use_rag={rule.use_rag}, confidence={rule.confidence}"
+            ),
+            "created_at": _now_iso(),
+            "meta": {"router": router_info, "router_path": "rule"},
+        }
+        next_node = "sermon_retriever" if rule.use_rag else "answer_creator"
+        elapsed = time.time() - start_time
+        print(f"[router] -> {next_node} (category={rule.category}, rule={rule.rule})", flush=True)
+        return {
+            "router": router_info,
+            "next": next_node,
+            "messages": [tool_msg],
+            "timing": {"router": elapsed},
+        }
+
+    # ── 로컬 분류기 (ROUTER_MODE=classifier) ────────────
+
+    if ROUTER_MODE == "classifier":
+        try:
+            predicted = _classify_locally(text, profile_mode)
+        except Exception as e:
+            print(f"[router] classifier ERROR: {e}", flush=True)
+            predicted = None
+
+        if predicted is not None and predicted[2] >= ROUTER_CLASSIFIER_MIN_CONFIDENCE:
+            category, use_rag, confidence = predicted
+            _count_route("classifier")
+            router_info: RouterDecision = {
+                "category": category,
+                "use_rag": use_rag,
+                "reason": f"[classifier] confidence={confidence:.2f}",
+            }
+            tool_msg: Message = {
+                "role": "tool",
+                "content": (
+                    f"[router] classifier category={category}, "
+                    f"use_rag={use_rag}, confidence={confidence:.2f}"
+                ),
+                "created_at": _now_iso(),
+                "meta": {"router": router_info, "router_path": "classifier"},
+            }
+            next_node = "sermon_retriever" if use_rag else "answer_creator"
+            elapsed = time.time() - start_time
+            if _decision_log is not None:
+                _decision_log.append({
+                    "text": text,
+                    "profile_mode": profile_mode,
+                    "category": category,
+                    "use_rag": use_rag,
+                    "confidence": round(confidence, 4),
+                    "path": "classifier",
+                    "latency": round(elapsed, 4),
+                })
+            print(f"[router] -> {next_node} (category={category}, classifier)", flush=True)
+            return {
+                "router": router_info,
+                "next": next_node,
+                "messages": [tool_msg],
+                "timing": {"router": elapsed},
+            }
+
+    # ── LLM 라우터 호출 (결정 캐시 → LLM) ───────────────
 
     try:
-        decision = _call_router_llm(text, profile_mode)
+        llm_start = time.time()
+        decision, route_path = _route_with_llm(text, profile_mode)
+        llm_time = time.time() - llm_start
+        _count_route(route_path)
+        if route_path == "llm" and _decision_log is not None:
+            _decision_log.append({
+                "text": text,
+                "profile_mode": profile_mode,
+                "category": decision.category,
+                "use_rag": decision.use_rag,
+                "path": "llm",
+                "latency": round(llm_time, 4),
+            })
         router_info: RouterDecision = {
             "category": decision.category,
             "use_rag": decision.use_rag,
@@ -332,7 +605,7 @@ def query_router_node(state: State) -> Dict[str, Any]:
             "role": "tool",
             "content": log_content,
             "created_at": _now_iso(),
-            "meta": {"router": router_info},
+            "meta": {"router": router_info, "router_path": route_path},
         }
 
         # 다음 노드 결정
@@ -341,10 +614,14 @@ def query_router_node(state: State) -> Dict[str, Any]:
         else:
             next_node = "answer_creator"
 
-        print(f"[router] -> {next_node} (category={decision.category})", flush=True)
+        if route_path == "cache":
+            print(f"[router] -> {next_node} (category={decision.category}, cached)", flush=True)
+        else:
+            print(f"[router] -> {next_node} (category={decision.category})", flush=True)
 
     except Exception as e:
         print(f"[router] ERROR: {e}", flush=True)
+        _count_route("llm_error")
         # 에러 시 안전하게 RAG 사용
         router_info: RouterDecision = {
             "category": "SERMON_SEARCH",
@@ -5,24 +5,28 @@ sermon_retriever.py
 
 역할:
   1) user_input과 profile_mode를 기반으로 설교 아카이브 검색
-  2) PGVector 기반 벡터 검색 (Cosine Similarity)
+  2) PGVector 기반 벡터 검색 (Cosine Similarity) + BM25 희소 검색 (RRF 융합)
+     - 순수 본문 질의("마태복음 5장으로 설교한 적 있나요?")는 본문 구간 인덱스로 바로 조회
+     - 청크 모드: 문단 청크 임베딩을 검색해 설교 단위로 집계하고, 매칭된 청크만 답변 컨텍스트로 전달
+     - (선택) cross-encoder 재순위로 RAW_TOP_K → CONTEXT_TOP_K
   3) 검색 결과를 SermonSnippet 형태로 변환하여 state에 저장
 
-임베딩 모델: dragonkue/bge-m3-ko (1024차원)
+임베딩 모델: dragonkue/bge-m3-ko (1024차원, 인코더 백엔드: torch / torch-int8 / onnx / onnx-int8)
 """
 
 from __future__ import annotations
 
 import os
+import threading
 import time
-import hashlib
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import psycopg
 from psycopg_pool import ConnectionPool
+from pgvector.psycopg import register_vector
 from dotenv import load_dotenv
-from langchain_huggingface import HuggingFaceEmbeddings
 
 # LangSmith trace 데코레이터
 try:
@@ -34,6 +38,15 @@ except Exception:
 
 
 from backend.sermon_agent.state.sermon_state import State, Message, SermonSnippet
+from backend.sermon_agent.utils.archive import format_sermon_date
+from backend.sermon_agent.utils.bible_books import scan_scripture
+from backend.sermon_agent.utils.db_pool import DB_PREPARE_STATEMENTS, create_pool
+from backend.sermon_agent.utils.embedding_cache import EmbeddingCache
+from backend.sermon_agent.utils.encoder import create_encoder
+from backend.sermon_agent.utils.memory_index import InMemorySermonIndex
+from backend.sermon_agent.utils.reranker import CrossEncoderReranker
+from backend.sermon_agent.utils.scripture_index import ScriptureIndex, is_pure_passage_query
+from backend.sermon_agent.utils.sparse_index import SparseSermonIndex
 
 load_dotenv()
 
@@ -48,20 +61,100 @@ if not DB_URL:
 if DB_URL.startswith("postgresql+psycopg://"):
     DB_URL = DB_URL.replace("postgresql+psycopg://", "postgresql://", 1)
 
-# Retriever 파라미터
-TOP_K = int(os.getenv("SERMON_RETRIEVER_TOP_K", "5"))
+# Retriever 파라미터 (2단계 검색)
+# 1단계: 벡터(+BM25) 검색으로 RAW_TOP_K개 후보 → 2단계: cross-encoder 재순위 후 CONTEXT_TOP_K개를 답변에 사용
+# SERMON_RETRIEVER_TOP_K는 이전 설정 이름 (CONTEXT_TOP_K가 없을 때 사용)
+CONTEXT_TOP_K = int(
+    os.getenv("SERMON_RETRIEVER_CONTEXT_TOP_K", os.getenv("SERMON_RETRIEVER_TOP_K", "5"))
+)
+RAW_TOP_K = max(int(os.getenv("SERMON_RETRIEVER_RAW_TOP_K", "10")), CONTEXT_TOP_K)
+TOP_K = CONTEXT_TOP_K
 SIMILARITY_FLOOR = float(os.getenv("SERMON_RETRIEVER_SIM_FLOOR", "0.3"))
 
+# ANN 인덱스 검색 파라미터 (backend/database/vector_index.py로 생성한 인덱스용)
+# 값이 클수록 recall↑ / 지연↑. HNSW ef_search는 top_k 이상이어야 한다.
+HNSW_EF_SEARCH = int(os.getenv("SERMON_RETRIEVER_HNSW_EF_SEARCH", "40"))
+IVFFLAT_PROBES = int(os.getenv("SERMON_RETRIEVER_IVFFLAT_PROBES", "1"))
+
+# 연결 풀 크기 기준: 그래프 스레드풀 워커 수 (동시에 검색할 수 있는 최대 그래프 수, graph.py와 같은 설정)
+# 실제 크기/수명은 utils/db_pool.py의 DB_POOL_* / DB_MAX_CONNECTIONS / WEB_CONCURRENCY
+POOL_CONCURRENCY = int(os.getenv("SERMON_AGENT_GRAPH_WORKERS", "8"))
+# 검색 SQL 실행 방식: 서버 prepared statement 재사용 (False면 자동 prepare도 끔)
+_PREPARE = DB_PREPARE_STATEMENTS
+
+# 검색 백엔드: "pgvector" (기본, DB 검색) | "numpy" (인메모리 행렬 검색)
+RETRIEVER_BACKEND = os.getenv("SERMON_RETRIEVER_BACKEND", "pgvector").lower()
+# numpy 백엔드: 행렬 mmap 캐시 경로 (빈 값이면 메모리만), 아카이브 변경 확인 주기(초)
+MEMORY_INDEX_PATH = os.getenv("SERMON_MEMORY_INDEX_PATH", "")
+MEMORY_INDEX_REFRESH_SECONDS = float(os.getenv("SERMON_MEMORY_INDEX_REFRESH_SECONDS", "60"))
+
+# 하이브리드 검색 (BM25 + 벡터, Reciprocal Rank Fusion)
+# 점수 = DENSE_WEIGHT / (RRF_K + 벡터 순위) + SPARSE_WEIGHT / (RRF_K + BM25 순위)
+# SPARSE_WEIGHT=0이면 BM25를 건너뛰고 벡터 검색만 사용한다.
+DENSE_WEIGHT = float(os.getenv("SERMON_RETRIEVER_DENSE_WEIGHT", "1.0"))
+SPARSE_WEIGHT = float(os.getenv("SERMON_RETRIEVER_SPARSE_WEIGHT", "1.0"))
+RRF_K = int(os.getenv("SERMON_RETRIEVER_RRF_K", "60"))
+# 융합 전 각 검색기에서 가져올 후보 수 (top_k보다 커야 순위 융합 의미가 있음)
+HYBRID_CANDIDATES = int(os.getenv("SERMON_RETRIEVER_HYBRID_CANDIDATES", "20"))
+# BM25 검색 + 융합에 허용하는 쿼리당 추가 지연 (ms). 초과 시 경고 로그 + 카운트
+HYBRID_BUDGET_MS = float(os.getenv("SERMON_RETRIEVER_HYBRID_BUDGET_MS", "5"))
+
+# 검색 단위: "sermon" (기본, 설교 1개 = 임베딩 1개) | "chunk" (sermon_chunk_embeddings 검색 → 설교별 집계)
+# 청크 모드는 백엔드 설정과 관계없이 DB에서 검색한다.
+RETRIEVAL_GRANULARITY = os.getenv("SERMON_RETRIEVER_GRANULARITY", "sermon").lower()
+# 청크 → 설교 점수 집계: "max" (최고 청크 유사도) | "sum" (설교별 상위 청크 유사도 합)
+CHUNK_AGGREGATION = os.getenv("SERMON_RETRIEVER_CHUNK_AGG", "max").lower()
+# 설교 1편당 답변 컨텍스트로 넘길 매칭 청크 수 (sum 집계도 이 개수까지 합산)
+CHUNKS_PER_SERMON = int(os.getenv("SERMON_RETRIEVER_CHUNKS_PER_SERMON", "2"))
+# 설교 후보 1개당 가져올 청크 후보 수 (한 설교의 청크가 상위를 독점하는 경우 대비)
+CHUNK_CANDIDATE_MULTIPLIER = int(os.getenv("SERMON_RETRIEVER_CHUNK_CANDIDATE_MULTIPLIER", "4"))
+
+# Cross-encoder 재순위 (로컬 CPU, 기본 비활성화)
+# 후보 RAW_TOP_K개를 배치 1회로 점수화. BUDGET_MS를 넘을 것으로 예측되거나 실제로 넘으면 1단계 순서 유지
+RERANKER_ENABLED = os.getenv("SERMON_RERANKER_ENABLED", "false").lower() in ("1", "true", "yes")
+RERANKER_MODEL_NAME = os.getenv("SERMON_RERANKER_MODEL", "dragonkue/bge-reranker-v2-m3-ko")
+RERANKER_MAX_LENGTH = int(os.getenv("SERMON_RERANKER_MAX_LENGTH", "256"))
+RERANKER_BUDGET_MS = float(os.getenv("SERMON_RERANKER_BUDGET_MS", "500"))
+# 재순위 입력으로 쓸 요약 앞부분 글자 수 (max_length 토큰을 넘는 부분은 어차피 잘림)
+RERANKER_PASSAGE_CHARS = int(os.getenv("SERMON_RERANKER_PASSAGE_CHARS", "600"))
+
 # 임베딩 모델 설정
 EMBEDDING_MODEL_NAME = "dragonkue/bge-m3-ko"
 EMBEDDING_DIMENSION = 1024
-EMBEDDING_CACHE_SIZE = 30
+
+# 쿼리 인코더 백엔드: "torch" (기본, fp32) | "torch-int8" | "onnx" | "onnx-int8"
+# onnx 계열은 onnxruntime 필요, 첫 로딩 시 ENCODER_CACHE_DIR에 ONNX 모델을 만들어 둔다.
+# 문서 임베딩(Embedding.py)과 다른 백엔드를 써도 fp32 대비 코사인 ≥ 0.99여야 한다 (bench_encoder_backends.py)
+ENCODER_BACKEND = os.getenv("SERMON_ENCODER_BACKEND", "torch").lower()
+ENCODER_THREADS = int(os.getenv("SERMON_ENCODER_THREADS", "0"))
+
+# 임베딩 캐시 설정 (메모리 LRU 바이트 예산 + 디스크 캐시 경로, 빈 값이면 디스크 비활성화)
+_BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+EMBEDDING_CACHE_MAX_BYTES = int(os.getenv("EMBEDDING_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+EMBEDDING_CACHE_PATH = os.getenv(
+    "EMBEDDING_CACHE_PATH",
+    os.path.join(_BACKEND_DIR, ".cache", "embedding_cache.sqlite3"),
+)
+# 디스크 캐시 상한 (초과분은 오래 안 쓴 순으로 정리, 0이면 무제한)
+EMBEDDING_CACHE_DISK_MAX_ENTRIES = int(os.getenv("EMBEDDING_CACHE_DISK_MAX_ENTRIES", "50000"))
+EMBEDDING_CACHE_DISK_MAX_BYTES = int(os.getenv("EMBEDDING_CACHE_DISK_MAX_BYTES", str(256 * 1024 * 1024)))
+# onnx 계열 인코더 내보내기/양자화 결과 저장 위치
+ENCODER_CACHE_DIR = os.getenv("SERMON_ENCODER_CACHE_DIR", os.path.join(_BACKEND_DIR, ".cache", "onnx"))
 
 # 전역 상태 (싱글톤)
-_embeddings_model: Optional[HuggingFaceEmbeddings] = None
+_embeddings_model: Optional[Any] = None
 _connection_pool: Optional[ConnectionPool] = None
-_embedding_cache: Dict[str, List[float]] = {}
-_cache_order: List[str] = []
+_embedding_cache: Optional[EmbeddingCache] = None
+_memory_index: Optional[InMemorySermonIndex] = None
+_sparse_index: Optional[SparseSermonIndex] = None
+_scripture_index: Optional[ScriptureIndex] = None
+_reranker: Optional[CrossEncoderReranker] = None
+_chunk_table_state: Dict[str, Any] = {"available": None, "checked_at": 0.0}
+_hybrid_stats: Dict[str, float] = {"queries": 0, "total_ms": 0.0, "max_ms": 0.0, "over_budget": 0}
+_hybrid_stats_lock = threading.Lock()
+# 모델/풀 지연 초기화 잠금 (시작 워밍업과 첫 요청이 겹쳐도 한 번만 생성)
+_model_lock = threading.Lock()
+_pool_lock = threading.Lock()
 
 
 # ─────────────────────────────────────────────────────────
@@ -73,66 +166,166 @@ def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-def _get_embeddings_model() -> HuggingFaceEmbeddings:
-    """임베딩 모델 (싱글톤)."""
+def _get_embeddings_model():
+    """임베딩 모델 (싱글톤, SERMON_ENCODER_BACKEND에 따라 torch/onnx, fp32/int8)."""
     global _embeddings_model
     if _embeddings_model is None:
-        print(f"  [Embedding] {EMBEDDING_MODEL_NAME} 모델 로딩 중...", flush=True)
-        _embeddings_model = HuggingFaceEmbeddings(
-            model_name=EMBEDDING_MODEL_NAME,
-            model_kwargs={"device": "cpu"},
-            encode_kwargs={"normalize_embeddings": True},
-        )
+        with _model_lock:
+            if _embeddings_model is None:
+                print(f"  [Embedding] {EMBEDDING_MODEL_NAME} ({ENCODER_BACKEND}) 모델 로딩 중...", flush=True)
+                _embeddings_model = create_encoder(
+                    ENCODER_BACKEND,
+                    EMBEDDING_MODEL_NAME,
+                    cache_dir=ENCODER_CACHE_DIR,
+                    threads=ENCODER_THREADS,
+                )
         # print(f"  [Embedding] 모델 로딩 완료 ({EMBEDDING_DIMENSION}차원)", flush=True)
     return _embeddings_model
 
 
+def _configure_connection(conn: psycopg.Connection) -> None:
+    """
+    풀 연결 초기화.
+      - pgvector 어댑터 등록 (numpy 배열 → vector 바이너리 바인딩)
+      - ANN 인덱스 검색 파라미터 세션 설정 (hnsw.ef_search, ivfflat.probes)
+      - 검색 SQL을 prepared statement로 한 번 실행 (첫 요청의 계획 수립 생략 + 인덱스 페이지 적재)
+    """
+    register_vector(conn)
+    conn.execute(
+        "SELECT set_config('hnsw.ef_search', %s, false), "
+        "set_config('ivfflat.probes', %s, false)",
+        (str(HNSW_EF_SEARCH), str(IVFFLAT_PROBES)),
+    )
+    if _PREPARE:
+        probe = np.zeros(EMBEDDING_DIMENSION, dtype=np.float32)
+        probe[0] = 1.0
+        try:
+            conn.execute(SEARCH_SQL, {"qvec": probe, "limit": 1}, prepare=True).fetchall()
+        except psycopg.errors.UndefinedTable:
+            conn.rollback()  # 테이블 생성 전 (import_data.py 실행 전)
+    else:
+        conn.prepare_threshold = None
+    conn.commit()
+
+
 def _get_connection_pool() -> ConnectionPool:
-    """DB 연결 풀 (싱글톤)."""
+    """DB 연결 풀 (싱글톤, 크기는 그래프 워커 수와 연결 예산으로 결정)."""
     global _connection_pool
     if _connection_pool is None:
-        _connection_pool = ConnectionPool(
-            conninfo=DB_URL,
-            min_size=1,
-            max_size=3,
-            timeout=30,
-            max_lifetime=300,
-            max_idle=60,
-            reconnect_timeout=10,
-        )
+        with _pool_lock:
+            if _connection_pool is None:
+                _connection_pool = create_pool(
+                    DB_URL,
+                    name="retriever",
+                    concurrency=POOL_CONCURRENCY,
+                    configure=_configure_connection,
+                )
         # print("  [DB Pool] 연결 풀 초기화 완료", flush=True)
     return _connection_pool
 
 
-def _embed_text(text: str) -> List[float]:
-    """텍스트 임베딩 (캐싱 포함)."""
+def get_connection_pool() -> ConnectionPool:
+    """검색용 DB 연결 풀 (다른 노드에서 아카이브 버전 조회 등에 공유)."""
+    return _get_connection_pool()
+
+
+def _get_embedding_cache() -> EmbeddingCache:
+    """쿼리 임베딩 캐시 (싱글톤)."""
+    global _embedding_cache
+    if _embedding_cache is None:
+        # 양자화 백엔드 벡터가 fp32 캐시 항목과 섞이지 않도록 백엔드별로 키를 나눈다
+        cache_model = EMBEDDING_MODEL_NAME
+        if ENCODER_BACKEND != "torch":
+            cache_model = f"{EMBEDDING_MODEL_NAME}:{ENCODER_BACKEND}"
+        _embedding_cache = EmbeddingCache(
+            model_name=cache_model,
+            max_bytes=EMBEDDING_CACHE_MAX_BYTES,
+            disk_path=EMBEDDING_CACHE_PATH or None,
+            disk_max_entries=EMBEDDING_CACHE_DISK_MAX_ENTRIES,
+            disk_max_bytes=EMBEDDING_CACHE_DISK_MAX_BYTES,
+        )
+    return _embedding_cache
+
+
+def get_embedding_cache_stats() -> Dict[str, Any]:
+    """임베딩 캐시 hit/miss/eviction 카운터."""
+    return _get_embedding_cache().stats()
+
+
+def _embed_text(text: str) -> np.ndarray:
+    """텍스트 임베딩 (2단 캐시 포함, float32)."""
     text_to_embed = (text or "").strip()
     if not text_to_embed:
-        return [0.0] * EMBEDDING_DIMENSION
-
-    cache_key = hashlib.md5(text_to_embed.encode("utf-8")).hexdigest()
+        return np.zeros(EMBEDDING_DIMENSION, dtype=np.float32)
 
-    global _embedding_cache, _cache_order
-    if cache_key in _embedding_cache:
-        return _embedding_cache[cache_key]
+    cache = _get_embedding_cache()
+    cached = cache.get(text_to_embed)
+    if cached is not None:
+        return cached
 
     try:
         model = _get_embeddings_model()
         embedding = model.embed_query(text_to_embed)
+        return cache.put(text_to_embed, embedding)
+
+    except Exception as e:
+        print(f"  [Embedding ERROR] {e}", flush=True)
+        return np.zeros(EMBEDDING_DIMENSION, dtype=np.float32)
 
-        # 캐시 저장 (FIFO)
-        _embedding_cache[cache_key] = embedding
-        _cache_order.append(cache_key)
 
-        if len(_cache_order) > EMBEDDING_CACHE_SIZE:
-            oldest_key = _cache_order.pop(0)
-            _embedding_cache.pop(oldest_key, None)
+def embed_query(text: str) -> np.ndarray:
+    """
+    텍스트 임베딩 (다른 노드용, 검색과 같은 임베딩 캐시 사용).
 
-        return embedding
+    검색 쿼리 접두어(_build_search_query)는 붙이지 않으므로 호출 측에서 넘긴 문자열 그대로 인코딩한다.
+    """
+    return _embed_text(text)
 
-    except Exception as e:
-        print(f"  [Embedding ERROR] {e}", flush=True)
-        return [0.0] * EMBEDDING_DIMENSION
+
+def _embed_texts(texts: List[str]) -> np.ndarray:
+    """
+    여러 텍스트 임베딩 (Q x 1024, float32).
+
+    캐시에 없는 텍스트만 모아 embed_documents 1회로 인코딩한다.
+    """
+    vectors: List[Optional[np.ndarray]] = [None] * len(texts)
+    cache = _get_embedding_cache()
+    misses: Dict[str, List[int]] = {}
+
+    for i, text in enumerate(texts):
+        text_to_embed = (text or "").strip()
+        if not text_to_embed:
+            vectors[i] = np.zeros(EMBEDDING_DIMENSION, dtype=np.float32)
+            continue
+        cached = cache.get(text_to_embed)
+        if cached is not None:
+            vectors[i] = cached
+        else:
+            misses.setdefault(text_to_embed, []).append(i)
+
+    if misses:
+        miss_texts = list(misses)
+        try:
+            model = _get_embeddings_model()
+            embeddings = model.embed_documents(miss_texts)
+            for text_to_embed, embedding in zip(miss_texts, embeddings):
+                vec = cache.put(text_to_embed, embedding)
+                for i in misses[text_to_embed]:
+                    vectors[i] = vec
+        except Exception as e:
+            print(f"  [Embedding ERROR] {e}", flush=True)
+            for positions in misses.values():
+                for i in positions:
+                    vectors[i] = np.zeros(EMBEDDING_DIMENSION, dtype=np.float32)
+
+    if not vectors:
+        return np.zeros((0, EMBEDDING_DIMENSION), dtype=np.float32)
+    return np.stack(vectors)
+
+
+def embed_texts(texts: List[str]) -> np.ndarray:
+    """여러 텍스트 임베딩 (Q x 1024, 검색과 같은 임베딩 캐시 사용)."""
+    return _embed_texts(texts)
 
 
 def _build_search_query(
@@ -154,17 +347,482 @@ def _build_search_query(
     return base_query
 
 
+def build_search_query(user_input: str, profile_mode: str) -> str:
+    """프로필 모드 접두어를 붙인 검색 쿼리 (라우터 분류기 등 같은 임베딩을 공유할 노드용)."""
+    return _build_search_query(user_input, profile_mode)
+
+
 # ─────────────────────────────────────────────────────────
 # 벡터 검색
 # ─────────────────────────────────────────────────────────
 
+# 거리는 서브쿼리에서 행마다 한 번만 계산하고, 바깥 쿼리는 top-k 행만 JOIN.
+# %(qvec)b: pgvector 어댑터를 통해 float32 배열을 바이너리 포맷으로 전송.
+SEARCH_SQL = """
+    SELECT
+        s.id,
+        s.title,
+        s.sermon_date,
+        s.bible_ref,
+        s.content_summary,
+        s.video_url,
+        s.church_name,
+        s.preacher,
+        1 - d.distance AS similarity
+    FROM (
+        SELECT e.sermon_id, e.embedding <=> %(qvec)b AS distance
+        FROM sermon_embeddings e
+        ORDER BY distance
+        LIMIT %(limit)s
+    ) d
+    JOIN sermons s ON s.id = d.sermon_id
+    ORDER BY d.distance
+"""
+
+
+def _get_memory_index() -> InMemorySermonIndex:
+    """인메모리 벡터 인덱스 (싱글톤, 아카이브 변경 시 증분 갱신)."""
+    global _memory_index
+    if _memory_index is None:
+        _memory_index = InMemorySermonIndex(
+            cache_path=MEMORY_INDEX_PATH or None,
+            refresh_interval=MEMORY_INDEX_REFRESH_SECONDS,
+        )
+    _memory_index.maybe_refresh(_get_connection_pool())
+    return _memory_index
+
+
+def _row_to_result(r) -> Dict[str, Any]:
+    """검색 결과 행 (SEARCH_SQL 컬럼 순서) → 결과 dict."""
+    return {
+        "sermon_id": str(r[0]),
+        "title": r[1] or "",
+        "date": format_sermon_date(r[2]),
+        "bible_ref": r[3] or "",
+        "content_summary": r[4] or "",
+        "video_url": r[5] or None,
+        "church_name": r[6] or "대덕교회",
+        "preacher": r[7] or "",
+        "similarity": round(float(r[8]) if r[8] is not None else 0.0, 4),
+    }
+
+
+def _search_rows(qvec: np.ndarray, top_k: int) -> List[tuple]:
+    """설정된 검색 단위(설교 / 청크)와 백엔드(pgvector / numpy)로 top-k 행 조회."""
+    if RETRIEVAL_GRANULARITY == "chunk" and _chunk_search_available():
+        return _search_chunk_rows(qvec, top_k)
+    return _search_sermon_rows(qvec, top_k)
+
+
+def _search_sermon_rows(qvec: np.ndarray, top_k: int) -> List[tuple]:
+    """설교 임베딩(A 방식) top-k 행 조회."""
+    if RETRIEVER_BACKEND == "numpy":
+        return _get_memory_index().search(qvec, top_k)
+
+    # DB 검색 (쿼리 벡터는 바이너리로 한 번만 바인딩)
+    pool = _get_connection_pool()
+    with pool.connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(SEARCH_SQL, {"qvec": qvec, "limit": top_k}, prepare=_PREPARE)
+            return cur.fetchall()
+
+
+# 여러 쿼리를 한 번의 SQL로 처리: 쿼리 벡터 배열을 unnest하고 LATERAL로 쿼리별 top-k.
+SEARCH_BATCH_SQL = """
+    SELECT
+        q.ord,
+        s.id,
+        s.title,
+        s.sermon_date,
+        s.bible_ref,
+        s.content_summary,
+        s.video_url,
+        s.church_name,
+        s.preacher,
+        1 - d.distance AS similarity
+    FROM unnest(%(qvecs)b::vector[]) WITH ORDINALITY AS q(qvec, ord)
+    CROSS JOIN LATERAL (
+        SELECT e.sermon_id, e.embedding <=> q.qvec AS distance
+        FROM sermon_embeddings e
+        ORDER BY distance
+        LIMIT %(limit)s
+    ) d
+    JOIN sermons s ON s.id = d.sermon_id
+    ORDER BY q.ord, d.distance
+"""
+
+
+def _search_rows_batch(qmat: np.ndarray, top_k: int) -> List[List[tuple]]:
+    """여러 쿼리 벡터의 top-k 행을 한 번에 조회 (SQL 1회 또는 행렬 곱 1회)."""
+    if len(qmat) == 0:
+        return []
+
+    if RETRIEVAL_GRANULARITY == "chunk" and _chunk_search_available():
+        return _search_chunk_rows_batch(qmat, top_k)
+
+    if RETRIEVER_BACKEND == "numpy":
+        return _get_memory_index().search_batch(qmat, top_k)
+
+    per_query: List[List[tuple]] = [[] for _ in range(len(qmat))]
+    pool = _get_connection_pool()
+    with pool.connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(SEARCH_BATCH_SQL, {"qvecs": list(qmat), "limit": top_k}, prepare=_PREPARE)
+            for row in cur.fetchall():
+                per_query[row[0] - 1].append(row[1:])
+    return per_query
+
+
+# ─────────────────────────────────────────────────────────
+# 청크 검색 (문단 청크 → 설교 집계)
+# ─────────────────────────────────────────────────────────
+
+CHUNK_SEARCH_SQL = """
+    SELECT d.sermon_id, d.chunk_index, d.content, 1 - d.distance AS similarity
+    FROM (
+        SELECT c.sermon_id, c.chunk_index, c.content, c.embedding <=> %(qvec)b AS distance
+        FROM sermon_chunk_embeddings c
+        ORDER BY distance
+        LIMIT %(limit)s
+    ) d
+    ORDER BY d.distance
+"""
+
+# 여러 쿼리의 청크 후보를 한 번에 조회 (SEARCH_BATCH_SQL과 같은 unnest + LATERAL)
+CHUNK_SEARCH_BATCH_SQL = """
+    SELECT q.ord, d.sermon_id, d.chunk_index, d.content, 1 - d.distance AS similarity
+    FROM unnest(%(qvecs)b::vector[]) WITH ORDINALITY AS q(qvec, ord)
+    CROSS JOIN LATERAL (
+        SELECT c.sermon_id, c.chunk_index, c.content, c.embedding <=> q.qvec AS distance
+        FROM sermon_chunk_embeddings c
+        ORDER BY distance
+        LIMIT %(limit)s
+    ) d
+    ORDER BY q.ord, d.distance
+"""
+
+SERMONS_BY_ID_SQL = """
+    SELECT s.id, s.title, s.sermon_date, s.bible_ref, s.content_summary,
+           s.video_url, s.church_name, s.preacher
+    FROM sermons s
+    WHERE s.id = ANY(%(ids)s)
+"""
+
+
+def _chunk_search_available() -> bool:
+    """sermon_chunk_embeddings 테이블에 데이터가 있는지 (아카이브 확인 주기마다 재확인)."""
+    now = time.monotonic()
+    state = _chunk_table_state
+    if state["available"] is not None and now - state["checked_at"] < MEMORY_INDEX_REFRESH_SECONDS:
+        return state["available"]
+
+    pool = _get_connection_pool()
+    with pool.connection() as conn:
+        exists = conn.execute(
+            "SELECT to_regclass('sermon_chunk_embeddings') IS NOT NULL"
+        ).fetchone()[0]
+        if exists:
+            exists = conn.execute(
+                "SELECT EXISTS (SELECT 1 FROM sermon_chunk_embeddings)"
+            ).fetchone()[0]
+
+    if not exists and state["available"] is not False:
+        print(
+            "  [Search] 청크 임베딩이 없어 설교 단위 검색 사용 "
+            "(Embedding.py --mode chunk → import_data.py)",
+            flush=True,
+        )
+    state["available"] = bool(exists)
+    state["checked_at"] = now
+    return state["available"]
+
+
+def _join_chunks(chunks: List[tuple]) -> str:
+    """매칭 청크를 본문 순서로 이어 붙인다 (떨어진 청크 사이는 생략 부호)."""
+    ordered = sorted(chunks, key=lambda c: c[0])
+    parts = [ordered[0][1]]
+    for prev, cur in zip(ordered, ordered[1:]):
+        parts.append("\n" if cur[0] == prev[0] + 1 else "\n…\n")
+        parts.append(cur[1])
+    return "".join(parts)
+
+
+def _chunk_candidate_limit(top_k: int) -> int:
+    return max(top_k, 1) * max(CHUNK_CANDIDATE_MULTIPLIER, 1)
+
+
+def _rank_chunk_groups(
+    chunk_rows: List[tuple],
+    top_k: int,
+    aggregation: str,
+) -> Tuple[List[Any], Dict[Any, List[tuple]]]:
+    """청크 후보 (sermon_id, chunk_index, content, similarity) → 집계 순위 상위 설교 ID, 설교별 청크."""
+    # 유사도 내림차순으로 들어오므로 설교별 목록도 내림차순
+    grouped: Dict[Any, List[tuple]] = {}
+    for sermon_id, chunk_index, content, similarity in chunk_rows:
+        grouped.setdefault(sermon_id, []).append((chunk_index, content, float(similarity)))
+
+    def score(sermon_id) -> float:
+        sims = [c[2] for c in grouped[sermon_id][:CHUNKS_PER_SERMON]]
+        return sum(sims) if aggregation == "sum" else sims[0]
+
+    return sorted(grouped, key=score, reverse=True)[:top_k], grouped
+
+
+def _chunk_result_rows(
+    ranked: List[Any],
+    grouped: Dict[Any, List[tuple]],
+    meta: Dict[Any, tuple],
+) -> List[tuple]:
+    """집계된 설교를 SEARCH_SQL 컬럼 순서 행으로 변환 (요약 자리에 매칭 청크)."""
+    rows = []
+    for sermon_id in ranked:
+        m = meta.get(sermon_id)
+        if m is None:
+            continue
+        chunks = grouped[sermon_id]
+        content = _join_chunks(chunks[:CHUNKS_PER_SERMON])
+        rows.append(m[:4] + (content,) + m[5:8] + (chunks[0][2],))
+    return rows
+
+
+def _search_chunk_rows(
+    qvec: np.ndarray,
+    top_k: int,
+    aggregation: Optional[str] = None,
+) -> List[tuple]:
+    """
+    청크 검색 후 설교별로 집계한 top-k 행 (SEARCH_SQL과 같은 컬럼 순서).
+
+    - 순위: aggregation("max" | "sum") 점수
+    - similarity: 설교의 최고 청크 유사도 (유사도 하한/표시용)
+    - content_summary 자리: 매칭된 상위 CHUNKS_PER_SERMON개 청크
+    """
+    aggregation = aggregation or CHUNK_AGGREGATION
+
+    pool = _get_connection_pool()
+    with pool.connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                CHUNK_SEARCH_SQL,
+                {"qvec": qvec, "limit": _chunk_candidate_limit(top_k)},
+                prepare=_PREPARE,
+            )
+            ranked, grouped = _rank_chunk_groups(cur.fetchall(), top_k, aggregation)
+            if not ranked:
+                return []
+            cur.execute(SERMONS_BY_ID_SQL, {"ids": ranked}, prepare=_PREPARE)
+            meta = {r[0]: r for r in cur.fetchall()}
+
+    return _chunk_result_rows(ranked, grouped, meta)
+
+
+def _search_chunk_rows_batch(
+    qmat: np.ndarray,
+    top_k: int,
+    aggregation: Optional[str] = None,
+) -> List[List[tuple]]:
+    """
+    여러 쿼리의 청크 검색 + 설교 집계 (_search_chunk_rows와 같은 결과).
+
+    청크 후보는 CHUNK_SEARCH_BATCH_SQL 1회, 설교 메타데이터는 모든 쿼리의 상위 설교를 모아 1회 조회.
+    """
+    aggregation = aggregation or CHUNK_AGGREGATION
+    per_query_chunks: List[List[tuple]] = [[] for _ in range(len(qmat))]
+
+    pool = _get_connection_pool()
+    with pool.connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                CHUNK_SEARCH_BATCH_SQL,
+                {"qvecs": list(qmat), "limit": _chunk_candidate_limit(top_k)},
+                prepare=_PREPARE,
+            )
+            for row in cur.fetchall():
+                per_query_chunks[row[0] - 1].append(row[1:])
+
+            ranked_groups = [
+                _rank_chunk_groups(chunk_rows, top_k, aggregation) for chunk_rows in per_query_chunks
+            ]
+            ids = list({sermon_id for ranked, _ in ranked_groups for sermon_id in ranked})
+            meta: Dict[Any, tuple] = {}
+            if ids:
+                cur.execute(SERMONS_BY_ID_SQL, {"ids": ids}, prepare=_PREPARE)
+                meta = {r[0]: r for r in cur.fetchall()}
+
+    return [_chunk_result_rows(ranked, grouped, meta) for ranked, grouped in ranked_groups]
+
+
+# ─────────────────────────────────────────────────────────
+# 하이브리드 검색 (BM25 + RRF)
+# ─────────────────────────────────────────────────────────
+
+
+def _get_sparse_index() -> SparseSermonIndex:
+    """BM25 희소 인덱스 (싱글톤, 아카이브 변경 시 재구축)."""
+    global _sparse_index
+    if _sparse_index is None:
+        _sparse_index = SparseSermonIndex(refresh_interval=MEMORY_INDEX_REFRESH_SECONDS)
+    _sparse_index.maybe_refresh(_get_connection_pool())
+    return _sparse_index
+
+
+def get_hybrid_stats() -> Dict[str, Any]:
+    """BM25 + 융합 단계 지연 통계 (예산 초과 횟수 포함)."""
+    with _hybrid_stats_lock:
+        stats = dict(_hybrid_stats)
+    queries = stats["queries"]
+    stats["avg_ms"] = round(stats["total_ms"] / queries, 3) if queries else 0.0
+    stats["budget_ms"] = HYBRID_BUDGET_MS
+    stats["enabled"] = SPARSE_WEIGHT > 0
+    return stats
+
+
+def _rrf_fuse(
+    dense: List[Dict[str, Any]],
+    sparse_rows: List[tuple],
+    similarities: Dict[str, float],
+    top_k: int,
+) -> List[Dict[str, Any]]:
+    """
+    벡터 결과와 BM25 결과를 Reciprocal Rank Fusion으로 합친다.
+
+    BM25로만 들어온 설교는 벡터 후보에 있으면 그 유사도를, 없으면 0.0을 similarity로 쓴다.
+    """
+    fused: Dict[str, Dict[str, Any]] = {}
+    scores: Dict[str, float] = {}
+
+    for rank, r in enumerate(dense, start=1):
+        fused[r["sermon_id"]] = r
+        scores[r["sermon_id"]] = DENSE_WEIGHT / (RRF_K + rank)
+
+    for rank, row in enumerate(sparse_rows, start=1):
+        sermon_id = str(row[0])
+        if sermon_id not in fused:
+            fused[sermon_id] = _row_to_result(row[:8] + (similarities.get(sermon_id, 0.0),))
+        fused[sermon_id]["bm25_score"] = round(float(row[8]), 4)
+        scores[sermon_id] = scores.get(sermon_id, 0.0) + SPARSE_WEIGHT / (RRF_K + rank)
+
+    ranked = sorted(scores, key=scores.get, reverse=True)[:top_k]
+    results = []
+    for sermon_id in ranked:
+        r = fused[sermon_id]
+        r["rrf_score"] = round(scores[sermon_id], 6)
+        results.append(r)
+    return results
+
+
+def _hybrid_results(query_text: str, rows: List[tuple], top_k: int) -> List[Dict[str, Any]]:
+    """벡터 후보 행에 유사도 하한을 적용하고, 설정에 따라 BM25 결과와 융합."""
+    formatted = [_row_to_result(r) for r in rows]
+    dense = [r for r in formatted if r["similarity"] >= SIMILARITY_FLOOR]
+    if SPARSE_WEIGHT <= 0 or not query_text:
+        return dense[:top_k]
+
+    sparse_index = _get_sparse_index()  # 인덱스 (재)구축 시간은 예산에서 제외
+
+    start = time.perf_counter()
+    sparse_rows = sparse_index.search(query_text, HYBRID_CANDIDATES)
+    similarities = {r["sermon_id"]: r["similarity"] for r in formatted}
+    results = _rrf_fuse(dense, sparse_rows, similarities, top_k)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    over_budget = elapsed_ms > HYBRID_BUDGET_MS
+    with _hybrid_stats_lock:
+        _hybrid_stats["queries"] += 1
+        _hybrid_stats["total_ms"] += elapsed_ms
+        _hybrid_stats["max_ms"] = max(_hybrid_stats["max_ms"], elapsed_ms)
+        if over_budget:
+            _hybrid_stats["over_budget"] += 1
+    if over_budget:
+        print(
+            f"  [Hybrid] BM25+RRF {elapsed_ms:.1f}ms > 예산 {HYBRID_BUDGET_MS:.1f}ms",
+            flush=True,
+        )
+
+    return results
+
+
+# ─────────────────────────────────────────────────────────
+# 2단계: cross-encoder 재순위
+# ─────────────────────────────────────────────────────────
+
+
+def _get_reranker() -> CrossEncoderReranker:
+    """Cross-encoder 재순위기 (싱글톤, 모델은 첫 사용 시 로드)."""
+    global _reranker
+    if _reranker is None:
+        _reranker = CrossEncoderReranker(
+            RERANKER_MODEL_NAME,
+            max_length=RERANKER_MAX_LENGTH,
+            budget_ms=RERANKER_BUDGET_MS,
+        )
+    return _reranker
+
+
+def get_rerank_stats() -> Dict[str, Any]:
+    """재순위 통계 (실행/예산 초과로 건너뜀/오류 횟수, 지연)."""
+    if _reranker is None:
+        return {"enabled": RERANKER_ENABLED, "calls": 0}
+    stats = _reranker.stats()
+    stats["enabled"] = RERANKER_ENABLED
+    return stats
+
+
+def _rerank_passage(r: Dict[str, Any]) -> str:
+    """재순위 입력 문단: 제목 + 본문 + 요약 앞부분."""
+    parts = [
+        r.get("title") or "",
+        r.get("bible_ref") or "",
+        (r.get("content_summary") or "")[:RERANKER_PASSAGE_CHARS],
+    ]
+    return "\n".join(p for p in parts if p)
+
+
+def _rerank(query_text: str, results: List[Dict[str, Any]], top_k: int) -> List[Dict[str, Any]]:
+    """
+    1단계 후보를 cross-encoder 점수로 재정렬해 top_k개 반환.
+
+    재순위를 건너뛰면 (예산 초과/실행 중/모델 오류) 1단계 순서 그대로 top_k개.
+    """
+    if not RERANKER_ENABLED or len(results) <= 1 or not query_text:
+        return results[:top_k]
+
+    scores = _get_reranker().score(query_text, [_rerank_passage(r) for r in results])
+    if scores is None:
+        return results[:top_k]
 
-def _search_sermons(query_text: str, top_k: int = 5) -> List[Dict[str, Any]]:
+    for r, score in zip(results, scores):
+        r["rerank_score"] = round(score, 4)
+    ranked = sorted(results, key=lambda r: r["rerank_score"], reverse=True)
+    return ranked[:top_k]
+
+
+def _is_reranked(results: List[Dict[str, Any]]) -> bool:
+    return bool(results) and "rerank_score" in results[0]
+
+
+def _search_sermons(
+    query_text: str,
+    top_k: int = 5,
+    sparse_query: Optional[str] = None,
+) -> List[Dict[str, Any]]:
     """
-    PGVector 기반 설교 검색 (Cosine Similarity).
+    2단계 설교 검색.
+
+    1단계: 하이브리드 검색 (Cosine Similarity + BM25, RRF 융합)으로 후보 선정
+           (재순위 활성화 시 max(top_k, RAW_TOP_K)개)
+    2단계: cross-encoder 재순위 후 top_k개 (SERMON_RERANKER_ENABLED=true일 때)
+
+    백엔드: SERMON_RETRIEVER_BACKEND=pgvector (기본) | numpy (인메모리)
+
+    Args:
+        query_text: 임베딩할 검색 쿼리
+        top_k: 반환 개수
+        sparse_query: BM25/재순위용 쿼리 (기본: query_text). 프로필 접두어 없이 원문을 넘긴다.
 
     Returns:
-        유사도 순으로 정렬된 설교 목록
+        재순위 점수(또는 융합 점수) 순으로 정렬된 설교 목록
     """
     query_text = (query_text or "").strip()
     if not query_text:
@@ -175,75 +833,71 @@ def _search_sermons(query_text: str, top_k: int = 5) -> List[Dict[str, Any]]:
     qvec = _embed_text(query_text)
     embed_time = time.time() - embed_start
 
-    qvec_str = "[" + ",".join(f"{v:.6f}" for v in qvec) + "]"
-
-    # SQL 쿼리
-    sql = """
-        SELECT
-            s.id,
-            s.title,
-            s.sermon_date,
-            s.bible_ref,
-            s.content_summary,
-            s.video_url,
-            s.church_name,
-            s.preacher,
-            (1 - (e.embedding <=> %(qvec)s::vector)) AS similarity
-        FROM sermon_embeddings e
-        JOIN sermons s ON s.id = e.sermon_id
-        ORDER BY e.embedding <=> %(qvec)s::vector
-        LIMIT %(limit)s
-    """
-
-    # DB 검색
-    db_start = time.time()
-    rows = []
-    pool = _get_connection_pool()
-    with pool.connection() as conn:
-        with conn.cursor() as cur:
-            cur.execute(sql, {"qvec": qvec_str, "limit": top_k})
-            rows = cur.fetchall()
-    db_time = time.time() - db_start
-
-    # 결과 가공
-    results: List[Dict[str, Any]] = []
-    for r in rows:
-        similarity = float(r[8]) if r[8] is not None else 0.0
+    search_start = time.time()
+    raw_k = max(top_k, RAW_TOP_K) if RERANKER_ENABLED else top_k
+    candidate_k = max(raw_k, HYBRID_CANDIDATES) if SPARSE_WEIGHT > 0 else raw_k
+    rows = _search_rows(qvec, candidate_k)
+    search_time = time.time() - search_start
 
-        if similarity < SIMILARITY_FLOOR:
-            continue
+    # 결과 가공 (유사도 하한 + BM25 융합 → 재순위)
+    sparse_text = (sparse_query or query_text).strip()
+    results = _hybrid_results(sparse_text, rows, raw_k)
 
-        # 날짜 포맷팅
-        date_str = None
-        if r[2]:
-            if hasattr(r[2], "strftime"):
-                date_str = r[2].strftime("%Y년 %m월 %d일")
-            else:
-                date_str = str(r[2])
-
-        results.append(
-            {
-                "sermon_id": str(r[0]),
-                "title": r[1] or "",
-                "date": date_str,
-                "bible_ref": r[3] or "",
-                "content_summary": r[4] or "",
-                "video_url": r[5] or None,
-                "church_name": r[6] or "대덕교회",
-                "preacher": r[7] or "",
-                "similarity": round(similarity, 4),
-            }
-        )
+    rerank_start = time.time()
+    results = _rerank(sparse_text, results, top_k)
+    rerank_time = time.time() - rerank_start
 
+    rerank_log = ""
+    if RERANKER_ENABLED:
+        rerank_log = f", rerank: {rerank_time:.3f}s" + ("" if _is_reranked(results) else " 건너뜀")
     print(
         f"  [Search] '{query_text[:30]}...' -> {len(results)}개 "
-        f"(embed: {embed_time:.2f}s, db: {db_time:.2f}s)",
+        f"(embed: {embed_time:.2f}s, {RETRIEVER_BACKEND}: {search_time:.3f}s{rerank_log})",
         flush=True,
     )
 
     return results
 
 
+# ─────────────────────────────────────────────────────────
+# 본문(성경 구절) 검색
+# ─────────────────────────────────────────────────────────
+
+
+def _get_scripture_index() -> ScriptureIndex:
+    """설교 본문 구간 인덱스 (싱글톤, 아카이브 변경 시 재구축)."""
+    global _scripture_index
+    if _scripture_index is None:
+        _scripture_index = ScriptureIndex(refresh_interval=MEMORY_INDEX_REFRESH_SECONDS)
+    _scripture_index.maybe_refresh(_get_connection_pool())
+    return _scripture_index
+
+
+def _search_by_passage(user_input: str, top_k: int) -> Optional[List[Dict[str, Any]]]:
+    """
+    순수 본문 질의면 구간 인덱스로 조회 (임베딩 생략).
+
+    Returns:
+        본문 질의가 아니거나 겹치는 설교가 없으면 None (일반 검색으로 진행)
+    """
+    matches = scan_scripture(user_input)
+    if not matches or not is_pure_passage_query(user_input, matches):
+        return None
+
+    index = _get_scripture_index()
+
+    start = time.perf_counter()
+    rows = index.search(user_input, top_k, matches)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    refs = ", ".join(m.text for m in matches)
+    print(f"  [Search] 본문 조회 '{refs}' -> {len(rows)}개 ({elapsed_ms:.3f}ms)", flush=True)
+
+    if not rows:
+        return None
+    return [_row_to_result(r) for r in rows]
+
+
 # ─────────────────────────────────────────────────────────
 # 메인 노드 함수
 # ─────────────────────────────────────────────────────────
@@ -288,11 +942,19 @@ def sermon_retriever_node(state: State) -> Dict[str, Any]:
         }
 
     try:
-        # 검색 쿼리 구성
-        search_query = _build_search_query(user_input, profile_mode)
-
-        # 설교 검색
-        sermon_results = _search_sermons(search_query, top_k=TOP_K)
+        # 순수 본문 질의는 구간 인덱스로 바로 조회, 아니면 하이브리드 검색
+        sermon_results = _search_by_passage(user_input, CONTEXT_TOP_K)
+        if sermon_results is not None:
+            search_query = user_input
+            search_mode = "scripture"
+        else:
+            search_query = _build_search_query(user_input, profile_mode)
+            sermon_results = _search_sermons(search_query, top_k=CONTEXT_TOP_K, sparse_query=user_input)
+            search_mode = "hybrid" if SPARSE_WEIGHT > 0 else "vector"
+            if RETRIEVAL_GRANULARITY == "chunk" and _chunk_table_state["available"]:
+                search_mode += "+chunk"
+            if _is_reranked(sermon_results):
+                search_mode += "+rerank"
 
         # SermonSnippet으로 변환
         snippets: List[SermonSnippet] = []
@@ -314,9 +976,12 @@ def sermon_retriever_node(state: State) -> Dict[str, Any]:
         retrieval_info = {
             "used_rag": True,
             "search_query": search_query,
+            "search_mode": search_mode,
             "count": len(snippets),
             "top_scores": [s["score"] for s in snippets[:3]],
         }
+        if _is_reranked(sermon_results):
+            retrieval_info["rerank_scores"] = [r["rerank_score"] for r in sermon_results[:3]]
 
         log_content = (
             f"[retriever] found {len(snippets)} sermons "
@@ -371,6 +1036,45 @@ def search_sermons_standalone(query: str, top_k: int = 5) -> List[Dict[str, Any]
     return _search_sermons(query, top_k)
 
 
+def search_sermons_batch(queries: List[str], top_k: int = 5) -> List[List[Dict[str, Any]]]:
+    """
+    여러 쿼리를 한 번에 검색 (평가 스크립트, 쿼리 확장용).
+
+    - 임베딩: 캐시 miss만 모아 embed_documents 1회
+    - 검색: pgvector는 SQL 1회 (unnest + LATERAL), numpy는 행렬 곱 1회
+    - 쿼리별 BM25 융합 + 재순위는 _search_sermons와 동일
+
+    Returns:
+        쿼리 순서대로 _search_sermons와 같은 형식의 결과 목록
+    """
+    texts = [(q or "").strip() for q in queries]
+    active = [i for i, t in enumerate(texts) if t]
+    results: List[List[Dict[str, Any]]] = [[] for _ in texts]
+    if not active:
+        return results
+
+    embed_start = time.time()
+    qmat = _embed_texts([texts[i] for i in active])
+    embed_time = time.time() - embed_start
+
+    search_start = time.time()
+    raw_k = max(top_k, RAW_TOP_K) if RERANKER_ENABLED else top_k
+    candidate_k = max(raw_k, HYBRID_CANDIDATES) if SPARSE_WEIGHT > 0 else raw_k
+    rows_per_query = _search_rows_batch(qmat, candidate_k)
+    search_time = time.time() - search_start
+
+    for i, rows in zip(active, rows_per_query):
+        results[i] = _rerank(texts[i], _hybrid_results(texts[i], rows, raw_k), top_k)
+
+    print(
+        f"  [Search batch] {len(active)}개 쿼리 "
+        f"(embed: {embed_time:.2f}s, {RETRIEVER_BACKEND}: {search_time:.3f}s)",
+        flush=True,
+    )
+
+    return results
+
+
 if __name__ == "__main__":
     print("=" * 60)
     print("설교 벡터 검색 테스트")
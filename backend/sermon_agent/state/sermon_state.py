@@ -11,6 +11,7 @@ sermon_state.py
 
 - 특징:
   * messages는 Annotated[..., operator.add]로 append-only reducer 설정
+  * timing은 노드별 소요 시간을 합치는 dict merge reducer (병렬 노드 동시 기록 허용)
   * 멀티 프로필 모드 지원 (연구용/상담용/교육용)
   * 스트리밍 모드 지원
 """
@@ -28,6 +29,11 @@ except ImportError:  # Python 3.8~3.10
 import operator
 
 
+def merge_timing(left: Optional[Dict[str, float]], right: Optional[Dict[str, float]]) -> Dict[str, float]:
+    """timing reducer: 노드별 소요 시간 dict를 합친다."""
+    return {**(left or {}), **(right or {})}
+
+
 # ─────────────────────────────────────────────────────────
 # 기본 단위 타입
 # ─────────────────────────────────────────────────────────
@@ -165,7 +171,7 @@ class SermonState(TypedDict, total=False):
     streaming_context: Dict[str, Any]  # 스트리밍 재생성용 컨텍스트
 
     # ── 타이밍/디버그 ───────────────────────────────────
-    timing: Dict[str, float]  # 각 노드별 소요 시간
+    timing: Annotated[Dict[str, float], merge_timing]  # 각 노드별 소요 시간
 
 
 # alias 편의를 위해 짧은 이름도 제공
@@ -181,4 +187,5 @@ __all__ = [
     "RouterDecision",
     "SermonState",
     "State",
+    "merge_timing",
 ]
@@ -0,0 +1,216 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+라우터 로컬 분류기 학습 / 평가 CLI
+
+LLM 라우터 결정 로그(ROUTER_DECISION_LOG, JSONL, 회전 파일 포함)를 학습 데이터로 사용한다.
+로그는 기본으로 꺼져 있으므로 서버에 ROUTER_DECISION_LOG를 설정해 모은 뒤 실행한다.
+특징 벡터는 sermon_retriever와 같은 검색 쿼리 임베딩 (build_search_query → bge-m3-ko).
+
+사용법:
+    # 학습 (홀드아웃 평가 후 전체 데이터로 재학습해 저장)
+    python -B backend/sermon_agent/train_router_classifier.py train
+
+    # 저장된 분류기를 로그와 비교 (정확도, 확신도 임계값별 커버리지, 지연)
+    python -B backend/sermon_agent/train_router_classifier.py report --log new_decisions.jsonl
+
+적용:
+    ROUTER_MODE=classifier
+    ROUTER_CLASSIFIER_MIN_CONFIDENCE=0.6
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from collections import Counter
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from sklearn.model_selection import train_test_split
+
+from backend.sermon_agent.nodes.query_router import (
+    ROUTER_CLASSIFIER_MIN_CONFIDENCE,
+    ROUTER_CLASSIFIER_PATH,
+    ROUTER_DECISION_LOG,
+    ROUTER_DECISION_LOG_BACKUPS,
+    ROUTER_DECISION_LOG_RETENTION_DAYS,
+)
+from backend.sermon_agent.nodes.sermon_retriever import (
+    EMBEDDING_MODEL_NAME,
+    build_search_query,
+    embed_query,
+    embed_texts,
+)
+from backend.sermon_agent.utils.intent_classifier import IntentClassifier, RouterDecisionLog
+
+
+def _load_dataset(log_path: str) -> Tuple[np.ndarray, List[str], List[bool], List[Dict[str, Any]]]:
+    records = RouterDecisionLog(
+        log_path,
+        backups=ROUTER_DECISION_LOG_BACKUPS,
+        retention_days=ROUTER_DECISION_LOG_RETENTION_DAYS,
+    ).load(path_filter="llm")
+    if not records:
+        return np.zeros((0, 0), dtype=np.float32), [], [], []
+
+    queries = [build_search_query(r["text"], r.get("profile_mode", "research")) for r in records]
+    start = time.time()
+    X = embed_texts(queries)
+    print(f"임베딩: {len(queries)}개 ({time.time() - start:.1f}s)")
+
+    categories = [r["category"] for r in records]
+    use_rags = [bool(r.get("use_rag")) for r in records]
+    return X, categories, use_rags, records
+
+
+def _evaluate(
+    clf: IntentClassifier,
+    X: np.ndarray,
+    categories: List[str],
+    use_rags: List[bool],
+    thresholds: List[float],
+) -> None:
+    predictions = clf.predict_batch(X)
+    n = len(predictions)
+
+    cat_acc = sum(p[0] == c for p, c in zip(predictions, categories)) / n
+    rag_acc = sum(p[1] == r for p, r in zip(predictions, use_rags)) / n
+    print(f"  category 정확도: {cat_acc:.3f}   use_rag 정확도: {rag_acc:.3f}   (n={n})")
+
+    print(f"\n  {'임계값':>8} {'커버리지':>10} {'category':>10} {'use_rag':>10}")
+    for t in thresholds:
+        covered = [(p, c, r) for p, c, r in zip(predictions, categories, use_rags) if p[2] >= t]
+        if not covered:
+            print(f"  {t:>8.2f} {0.0:>10.3f} {'-':>10} {'-':>10}")
+            continue
+        c_acc = sum(p[0] == c for p, c, _ in covered) / len(covered)
+        r_acc = sum(p[1] == r for p, _, r in covered) / len(covered)
+        print(f"  {t:>8.2f} {len(covered) / n:>10.3f} {c_acc:>10.3f} {r_acc:>10.3f}")
+
+    confusion = Counter((c, p[0]) for p, c in zip(predictions, categories) if p[0] != c)
+    if confusion:
+        print("\n  주요 오분류 (LLM → 분류기):")
+        for (truth, pred), count in confusion.most_common(5):
+            print(f"    {truth} → {pred}: {count}")
+
+
+def _latency_report(clf: IntentClassifier, records: List[Dict[str, Any]], X: np.ndarray) -> None:
+    predict_us = []
+    for row in X[: min(len(X), 200)]:
+        start = time.perf_counter()
+        clf.predict(row)
+        predict_us.append((time.perf_counter() - start) * 1e6)
+
+    # 캐시에 있는 임베딩 조회 (retriever와 공유되는 경우의 추가 비용)
+    cached_us = []
+    for r in records[: min(len(records), 200)]:
+        start = time.perf_counter()
+        embed_query(build_search_query(r["text"], r.get("profile_mode", "research")))
+        cached_us.append((time.perf_counter() - start) * 1e6)
+
+    llm_ms = [r["latency"] * 1000 for r in records if r.get("latency") is not None]
+
+    print("\n  지연:")
+    print(f"    분류기 predict        p50={statistics.median(predict_us):9.1f}us")
+    print(f"    임베딩 (캐시 공유)     p50={statistics.median(cached_us):9.1f}us")
+    if llm_ms:
+        ordered = sorted(llm_ms)
+        p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+        print(f"    LLM 라우터 (로그)      p50={statistics.median(llm_ms):9.1f}ms  p99={p99:.1f}ms")
+
+
+def cmd_train(args) -> None:
+    X, categories, use_rags, records = _load_dataset(args.log)
+    print(f"학습 데이터: {len(categories)}개 ({args.log})")
+    if len(categories) < args.min_samples:
+        print(f"데이터 부족: 최소 {args.min_samples}개 필요")
+        sys.exit(1)
+    print(f"  분포: {dict(Counter(categories))}")
+
+    counts = Counter(categories)
+    stratify = categories if min(counts.values()) >= 2 else None
+    X_train, X_test, c_train, c_test, r_train, r_test = train_test_split(
+        X, categories, use_rags, test_size=args.test_size, random_state=0, stratify=stratify
+    )
+
+    print(f"\n[홀드아웃 평가] train={len(c_train)}, test={len(c_test)}")
+    holdout = IntentClassifier.fit(X_train, c_train, r_train, C=args.C)
+    _evaluate(holdout, X_test, c_test, r_test, args.thresholds)
+
+    clf = IntentClassifier.fit(
+        X, categories, use_rags, C=args.C, meta={"embedding_model": EMBEDDING_MODEL_NAME}
+    )
+    clf.save(args.out)
+    _latency_report(clf, records, X)
+    print(f"\n저장: {args.out}")
+
+
+def cmd_report(args) -> None:
+    if not os.path.exists(args.model):
+        print(f"분류기 없음: {args.model}")
+        sys.exit(1)
+    clf = IntentClassifier.load(args.model)
+    print(f"분류기: {args.model} ({clf.meta})")
+
+    X, categories, use_rags, records = _load_dataset(args.log)
+    if not categories:
+        print(f"평가 데이터 없음: {args.log}")
+        sys.exit(1)
+
+    print(f"\n[LLM 라우터 대비] {args.log}")
+    _evaluate(clf, X, categories, use_rags, args.thresholds)
+    _latency_report(clf, records, X)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="라우터 로컬 분류기 학습/평가")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    thresholds = [0.0, 0.5, ROUTER_CLASSIFIER_MIN_CONFIDENCE, 0.7, 0.8, 0.9]
+
+    train = sub.add_parser("train", help="결정 로그로 분류기 학습")
+    train.add_argument(
+        "--log", default=ROUTER_DECISION_LOG or None, required=not ROUTER_DECISION_LOG,
+        help="결정 로그 경로 (기본: ROUTER_DECISION_LOG)",
+    )
+    train.add_argument("--out", default=ROUTER_CLASSIFIER_PATH)
+    train.add_argument("--test-size", type=float, default=0.2)
+    train.add_argument("--min-samples", type=int, default=30)
+    train.add_argument("--C", type=float, default=4.0, help="LogisticRegression 규제 강도 역수")
+    train.add_argument("--thresholds", type=float, nargs="+", default=thresholds)
+
+    report = sub.add_parser("report", help="저장된 분류기를 LLM 결정과 비교")
+    report.add_argument(
+        "--log", default=ROUTER_DECISION_LOG or None, required=not ROUTER_DECISION_LOG,
+        help="결정 로그 경로 (기본: ROUTER_DECISION_LOG)",
+    )
+    report.add_argument("--model", default=ROUTER_CLASSIFIER_PATH)
+    report.add_argument("--thresholds", type=float, nargs="+", default=thresholds)
+
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    print("=" * 64)
+    print("라우터 로컬 분류기")
+    print("=" * 64)
+    if args.command == "train":
+        cmd_train(args)
+    else:
+        cmd_report(args)
+    print("=" * 64)
+
+
+if __name__ == "__main__":
+    main()
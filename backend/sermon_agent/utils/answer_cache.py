@@ -0,0 +1,236 @@
+# backend/sermon_agent/utils/answer_cache.py
+# -*- coding: utf-8 -*-
+"""
+answer_cache.py
+
+의미 기반 답변 캐시 (answer_creator 앞단).
+
+- 버킷 키: (profile_mode, category, 검색된 설교 ID 집합)
+  → 같은 설교 컨텍스트·같은 프롬프트로 생성된 답변만 재사용 후보
+- 버킷 안에서 질문 임베딩 코사인 유사도가 임계값 이상이면 hit
+- 전체 항목 수 LRU 제한 + TTL
+- 아카이브 버전(fetch_archive_version)이 바뀌면 전체 무효화 (재-import 대응)
+
+지표: hit/miss, hit율, 절약한 LLM 생성 시간 합계
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from backend.sermon_agent.utils.archive import fetch_archive_version
+
+
+BucketKey = Tuple[str, str, Tuple[str, ...]]
+
+
+def make_bucket_key(profile_mode: str, category: str, sermon_ids: Iterable[str]) -> BucketKey:
+    """버킷 키 (설교 ID는 순서 무관)."""
+    return (profile_mode or "", category or "", tuple(sorted(str(s) for s in sermon_ids)))
+
+
+class _Entry(NamedTuple):
+    bucket: BucketKey
+    question: str
+    qvec: np.ndarray
+    answer: Dict[str, Any]
+    llm_time: float
+    created: float
+
+
+class SemanticAnswerCache:
+    """
+    질문 임베딩 기반 답변 캐시.
+
+    Usage:
+        cache = SemanticAnswerCache(threshold=0.95, max_entries=512)
+        cache.maybe_refresh(pool)
+        version = cache.version
+        hit = cache.lookup(qvec, bucket)
+        if hit is None:
+            ...  # LLM 호출
+            cache.store(qvec, bucket, question, answer, llm_time, version)
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.95,
+        max_entries: int = 512,
+        ttl_seconds: float = 86400.0,
+        refresh_interval: float = 60.0,
+    ):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.refresh_interval = refresh_interval
+
+        self._entries: "OrderedDict[int, _Entry]" = OrderedDict()
+        self._buckets: Dict[BucketKey, List[int]] = {}
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+
+        self._version: Optional[str] = None
+        self._last_check = 0.0
+
+        self._stats: Dict[str, float] = {
+            "hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+            "invalidations": 0,
+            "saved_seconds": 0.0,
+        }
+
+    @property
+    def version(self) -> Optional[str]:
+        return self._version
+
+    # ── 조회 / 저장 ─────────────────────────────────────
+
+    def lookup(self, qvec: np.ndarray, bucket: BucketKey) -> Optional[Dict[str, Any]]:
+        """
+        같은 버킷에서 가장 유사한 질문의 답변 조회.
+
+        Returns:
+            {"answer", "question", "similarity", "llm_time"} 또는 None
+        """
+        now = time.monotonic()
+        with self._lock:
+            best: Optional[_Entry] = None
+            best_sim = -1.0
+            entry_ids = self._buckets.get(bucket, [])
+            if entry_ids:
+                self._expire(entry_ids, now)
+                entry_ids = self._buckets.get(bucket, [])
+            if entry_ids:
+                mat = np.stack([self._entries[i].qvec for i in entry_ids])
+                sims = mat @ qvec
+                pos = int(np.argmax(sims))
+                best_sim = float(sims[pos])
+                if best_sim >= self.threshold:
+                    best_id = entry_ids[pos]
+                    best = self._entries[best_id]
+                    self._entries.move_to_end(best_id)
+
+            if best is None:
+                self._stats["misses"] += 1
+                return None
+
+            self._stats["hits"] += 1
+            self._stats["saved_seconds"] += best.llm_time
+            return {
+                "answer": best.answer,
+                "question": best.question,
+                "similarity": round(best_sim, 4),
+                "llm_time": best.llm_time,
+            }
+
+    def store(
+        self,
+        qvec: np.ndarray,
+        bucket: BucketKey,
+        question: str,
+        answer: Dict[str, Any],
+        llm_time: float,
+        version: Optional[str],
+    ) -> bool:
+        """
+        답변 저장. 조회 이후 아카이브가 바뀌었으면(version 불일치) 저장하지 않는다.
+        """
+        if self.max_entries <= 0:
+            return False
+
+        with self._lock:
+            if version != self._version:
+                return False
+
+            entry_id = next(self._ids)
+            self._entries[entry_id] = _Entry(
+                bucket=bucket,
+                question=question,
+                qvec=np.asarray(qvec, dtype=np.float32),
+                answer=answer,
+                llm_time=llm_time,
+                created=time.monotonic(),
+            )
+            self._buckets.setdefault(bucket, []).append(entry_id)
+            self._stats["stores"] += 1
+
+            while len(self._entries) > self.max_entries:
+                old_id, old = self._entries.popitem(last=False)
+                self._remove_from_bucket(old.bucket, old_id)
+                self._stats["evictions"] += 1
+            return True
+
+    def _expire(self, entry_ids: List[int], now: float) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        for entry_id in list(entry_ids):
+            entry = self._entries[entry_id]
+            if now - entry.created > self.ttl_seconds:
+                del self._entries[entry_id]
+                self._remove_from_bucket(entry.bucket, entry_id)
+                self._stats["evictions"] += 1
+
+    def _remove_from_bucket(self, bucket: BucketKey, entry_id: int) -> None:
+        ids = self._buckets.get(bucket)
+        if ids is None:
+            return
+        ids.remove(entry_id)
+        if not ids:
+            del self._buckets[bucket]
+
+    # ── 무효화 ─────────────────────────────────────────
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._buckets.clear()
+
+    def maybe_refresh(self, pool) -> bool:
+        """refresh_interval마다 아카이브 버전을 확인하고 바뀌었으면 전체 무효화."""
+        now = time.monotonic()
+        if self._version is not None and now - self._last_check < self.refresh_interval:
+            return False
+
+        with self._lock:
+            if self._version is not None and now - self._last_check < self.refresh_interval:
+                return False
+            self._last_check = now
+
+            with pool.connection() as conn:
+                version = fetch_archive_version(conn)
+            if version == self._version:
+                return False
+
+            if self._version is not None:
+                print(
+                    f"  [AnswerCache] 아카이브 변경 감지 → {len(self._entries)}개 항목 무효화",
+                    flush=True,
+                )
+                self._stats["invalidations"] += 1
+            self._entries.clear()
+            self._buckets.clear()
+            self._version = version
+            return True
+
+    # ── 지표 ───────────────────────────────────────────
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "saved_seconds": round(self._stats["saved_seconds"], 3),
+                "lookups": lookups,
+                "hit_rate": round(self._stats["hits"] / lookups, 4) if lookups else 0.0,
+                "entries": len(self._entries),
+                "buckets": len(self._buckets),
+                "version": self._version,
+            }
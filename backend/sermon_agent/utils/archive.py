@@ -0,0 +1,82 @@
+# backend/sermon_agent/utils/archive.py
+# -*- coding: utf-8 -*-
+"""
+archive.py
+
+설교 아카이브(sermons / sermon_embeddings) 공용 조회 유틸리티.
+
+- 아카이브 버전: 재-import 여부를 판단하는 가벼운 지문
+  (import_data.py는 UPSERT 시 sermons.updated_at을 갱신하고, 임베딩/청크 행은 새 id로 다시 넣는다)
+- 설교 메타데이터 조회: 인메모리 보조 인덱스(BM25, 성경 구절) 구축용
+- 날짜 포맷팅: 검색 결과 표시용 "YYYY년 MM월 DD일"
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+# import_data.py는 임베딩을 같은 모델 기준으로 DELETE 후 다시 INSERT하므로
+# 행 수가 같아도 SERIAL id(MAX(id))와 created_at이 바뀐다 → 재-import 감지
+ARCHIVE_VERSION_SQL = """
+    SELECT
+        (SELECT COUNT(*) FROM sermons),
+        (SELECT MAX(updated_at) FROM sermons),
+        (SELECT COUNT(*) FROM sermon_embeddings),
+        (SELECT MAX(id) FROM sermon_embeddings),
+        (SELECT MAX(created_at) FROM sermon_embeddings),
+        to_regclass('sermon_chunk_embeddings') IS NOT NULL
+"""
+
+# 청크 테이블은 청크 임베딩을 import했을 때만 존재
+CHUNK_VERSION_SQL = """
+    SELECT COUNT(*), MAX(id), MAX(created_at) FROM sermon_chunk_embeddings
+"""
+
+# 검색 결과와 같은 순서의 메타데이터 8개 컬럼 (임베딩 제외)
+SERMON_META_SQL = """
+    SELECT
+        s.id,
+        s.title,
+        s.sermon_date,
+        s.bible_ref,
+        s.content_summary,
+        s.video_url,
+        s.church_name,
+        s.preacher
+    FROM sermons s
+    ORDER BY s.id
+"""
+
+
+def _fmt(value: Any) -> str:
+    if value is None:
+        return "-"
+    return value.isoformat() if hasattr(value, "isoformat") else str(value)
+
+
+def fetch_archive_version(conn) -> str:
+    """
+    아카이브 버전 문자열 조회.
+
+    설교 수/최종 수정 시각, 설교·청크 임베딩 각각의 행 수/MAX(id)/MAX(created_at)을
+    합친 값으로, 하나라도 바뀌면 인메모리 인덱스/캐시를 갱신해야 한다.
+    """
+    with conn.cursor() as cur:
+        cur.execute(ARCHIVE_VERSION_SQL)
+        sermon_count, max_updated_at, emb_count, emb_max_id, emb_max_created, has_chunks = cur.fetchone()
+        chunk = (0, None, None)
+        if has_chunks:
+            cur.execute(CHUNK_VERSION_SQL)
+            chunk = cur.fetchone()
+
+    parts = [sermon_count, max_updated_at, emb_count, emb_max_id, emb_max_created, *chunk]
+    return ":".join(_fmt(p) for p in parts)
+
+
+def format_sermon_date(value: Any) -> Optional[str]:
+    """sermon_date를 "YYYY년 MM월 DD일" 형식으로 변환."""
+    if not value:
+        return None
+    if hasattr(value, "strftime"):
+        return value.strftime("%Y년 %m월 %d일")
+    return str(value)
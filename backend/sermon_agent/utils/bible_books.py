@@ -0,0 +1,242 @@
+# backend/sermon_agent/utils/bible_books.py
+# -*- coding: utf-8 -*-
+"""
+bible_books.py
+
+성경 66권 책 이름 정규화 테이블 + 구절 참조 스캐너.
+
+- 책마다 정수 ID(1~66), OSIS 코드, 개역개정 이름/약어, 별칭
+- 아카이브 형식("마 25 : 31 ~ 46")과 질문 형식("마태복음 5장 3절", "요한복음 3:16",
+  "시편 23편")을 하나의 정규식으로 인식
+- 표준 라이브러리(re)만 사용 (크롤러 등 다른 패키지에서도 import 가능)
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+
+class BibleBook(NamedTuple):
+    id: int
+    code: str
+    name: str
+    abbr: str
+    aliases: Tuple[str, ...] = ()
+
+
+BOOKS: Tuple[BibleBook, ...] = (
+    # 구약
+    BibleBook(1, "Gen", "창세기", "창"),
+    BibleBook(2, "Exod", "출애굽기", "출"),
+    BibleBook(3, "Lev", "레위기", "레"),
+    BibleBook(4, "Num", "민수기", "민"),
+    BibleBook(5, "Deut", "신명기", "신"),
+    BibleBook(6, "Josh", "여호수아", "수"),
+    BibleBook(7, "Judg", "사사기", "삿"),
+    BibleBook(8, "Ruth", "룻기", "룻"),
+    BibleBook(9, "1Sam", "사무엘상", "삼상"),
+    BibleBook(10, "2Sam", "사무엘하", "삼하"),
+    BibleBook(11, "1Kgs", "열왕기상", "왕상"),
+    BibleBook(12, "2Kgs", "열왕기하", "왕하"),
+    BibleBook(13, "1Chr", "역대상", "대상"),
+    BibleBook(14, "2Chr", "역대하", "대하"),
+    BibleBook(15, "Ezra", "에스라", "스"),
+    BibleBook(16, "Neh", "느헤미야", "느"),
+    BibleBook(17, "Esth", "에스더", "에"),
+    BibleBook(18, "Job", "욥기", "욥"),
+    BibleBook(19, "Ps", "시편", "시"),
+    BibleBook(20, "Prov", "잠언", "잠"),
+    BibleBook(21, "Eccl", "전도서", "전"),
+    BibleBook(22, "Song", "아가", "아"),
+    BibleBook(23, "Isa", "이사야", "사"),
+    BibleBook(24, "Jer", "예레미야", "렘"),
+    BibleBook(25, "Lam", "예레미야애가", "애", ("애가",)),
+    BibleBook(26, "Ezek", "에스겔", "겔"),
+    BibleBook(27, "Dan", "다니엘", "단"),
+    BibleBook(28, "Hos", "호세아", "호"),
+    BibleBook(29, "Joel", "요엘", "욜"),
+    BibleBook(30, "Amos", "아모스", "암"),
+    BibleBook(31, "Obad", "오바댜", "옵"),
+    BibleBook(32, "Jonah", "요나", "욘"),
+    BibleBook(33, "Mic", "미가", "미"),
+    BibleBook(34, "Nah", "나훔", "나"),
+    BibleBook(35, "Hab", "하박국", "합"),
+    BibleBook(36, "Zeph", "스바냐", "습"),
+    BibleBook(37, "Hag", "학개", "학"),
+    BibleBook(38, "Zech", "스가랴", "슥"),
+    BibleBook(39, "Mal", "말라기", "말"),
+    # 신약
+    BibleBook(40, "Matt", "마태복음", "마", ("마태",)),
+    BibleBook(41, "Mark", "마가복음", "막", ("마가",)),
+    BibleBook(42, "Luke", "누가복음", "눅", ("누가",)),
+    BibleBook(43, "John", "요한복음", "요"),
+    BibleBook(44, "Acts", "사도행전", "행"),
+    BibleBook(45, "Rom", "로마서", "롬"),
+    BibleBook(46, "1Cor", "고린도전서", "고전"),
+    BibleBook(47, "2Cor", "고린도후서", "고후"),
+    BibleBook(48, "Gal", "갈라디아서", "갈"),
+    BibleBook(49, "Eph", "에베소서", "엡"),
+    BibleBook(50, "Phil", "빌립보서", "빌"),
+    BibleBook(51, "Col", "골로새서", "골"),
+    BibleBook(52, "1Thess", "데살로니가전서", "살전"),
+    BibleBook(53, "2Thess", "데살로니가후서", "살후"),
+    BibleBook(54, "1Tim", "디모데전서", "딤전"),
+    BibleBook(55, "2Tim", "디모데후서", "딤후"),
+    BibleBook(56, "Titus", "디도서", "딛"),
+    BibleBook(57, "Phlm", "빌레몬서", "몬"),
+    BibleBook(58, "Heb", "히브리서", "히"),
+    BibleBook(59, "Jas", "야고보서", "약"),
+    BibleBook(60, "1Pet", "베드로전서", "벧전"),
+    BibleBook(61, "2Pet", "베드로후서", "벧후"),
+    BibleBook(62, "1John", "요한일서", "요일"),
+    BibleBook(63, "2John", "요한이서", "요이"),
+    BibleBook(64, "3John", "요한삼서", "요삼"),
+    BibleBook(65, "Jude", "유다서", "유"),
+    BibleBook(66, "Rev", "요한계시록", "계", ("계시록",)),
+)
+
+BOOK_BY_ID: Dict[int, BibleBook] = {b.id: b for b in BOOKS}
+
+# 이름/약어/별칭 → 책
+BOOK_BY_NAME: Dict[str, BibleBook] = {}
+for _book in BOOKS:
+    for _name in (_book.name, _book.abbr, *_book.aliases):
+        BOOK_BY_NAME[_name] = _book
+
+
+def lookup_book(name: str) -> Optional[BibleBook]:
+    """책 이름/약어/별칭으로 책 조회 (공백 무시)."""
+    return BOOK_BY_NAME.get((name or "").replace(" ", ""))
+
+
+# ─────────────────────────────────────────────────────────
+# 구절 참조 스캐너
+# ─────────────────────────────────────────────────────────
+
+# 장 전체를 가리킬 때 쓰는 절 범위
+VERSE_MIN = 0
+VERSE_MAX = 999
+
+
+class ScriptureMatch(NamedTuple):
+    book: BibleBook
+    chapter_start: int
+    verse_start: Optional[int]
+    chapter_end: int
+    verse_end: Optional[int]
+    span: Tuple[int, int]
+    text: str
+
+    @property
+    def is_whole_chapter(self) -> bool:
+        return self.verse_start is None
+
+
+# 긴 이름부터 시도해야 "요한복음"이 "요"로, "삼상"이 "삼"으로 잘리지 않는다
+_BOOK_ALTERNATION = "|".join(
+    re.escape(name) for name in sorted(BOOK_BY_NAME, key=len, reverse=True)
+)
+
+# 책 이름 첫 글자 집합: 대부분의 위치를 alternation 시도 전에 걸러낸다
+_BOOK_FIRST_CHARS = "".join(sorted({name[0] for name in BOOK_BY_NAME}))
+
+_SCRIPTURE_RE = re.compile(
+    rf"""
+    (?=[{_BOOK_FIRST_CHARS}])(?<![가-힣])(?P<book>{_BOOK_ALTERNATION})\s*
+    (?P<c1>\d{{1,3}})(?!\d)
+    (?:
+        \s*[:：]\s*(?P<v1a>\d{{1,3}})
+      | \s*(?P<unit>장|편)(?:\s*(?P<v1b>\d{{1,3}})\s*절?)?
+    )?
+    (?:
+        \s*[-~∼–]\s*
+        (?:(?P<c2>\d{{1,3}})\s*(?:[:：]|장)\s*)?
+        (?P<v2>\d{{1,3}})\s*(?P<unit2>절|장|편)?
+    )?
+    """,
+    re.VERBOSE,
+)
+
+
+_HANGUL_RE = re.compile(r"[가-힣]")
+_CHAPTER_UNITS = ("장", "편", "절")
+
+
+def scan_scripture(text: str) -> List[ScriptureMatch]:
+    """
+    텍스트의 성경 구절 참조를 한 번에 스캔.
+
+    예:
+        "마 25 : 31 ~ 46"      → 마태복음 25:31-46
+        "마태복음 5장"          → 마태복음 5장 전체
+        "고린도전서 13장 1-3절" → 고린도전서 13:1-3
+        "수 5 : 13 ~ 6"        → 여호수아 5:13 ~ 6장 끝 (장을 넘는 범위)
+
+    오탐을 줄이기 위해 절 없이 장 번호만 있는 참조는 다음 경우 버린다.
+      - 약어("마", "요", "대상", "고전", "요일" 등): "장/편" 없이 숫자만 오면
+        ("대상 3명에게", "고전 2곡을", "요일 3번 모임")
+      - 책 이름 전체: 숫자 바로 뒤에 장/편/절 이외의 한글이 붙으면 ("요한일서 3번")
+    """
+    matches: List[ScriptureMatch] = []
+    if not text:
+        return matches
+
+    for m in _SCRIPTURE_RE.finditer(text):
+        book = BOOK_BY_NAME[m.group("book")]
+        c1 = int(m.group("c1"))
+        v1_raw = m.group("v1a") or m.group("v1b")
+        v1 = int(v1_raw) if v1_raw else None
+
+        if v1 is None and not m.group("unit"):
+            if m.group("book") == book.abbr:
+                continue
+            following = text[m.end("c1"):m.end("c1") + 1]
+            if following and _HANGUL_RE.match(following) and following not in _CHAPTER_UNITS:
+                continue
+
+        c2, v2 = c1, v1
+        if m.group("v2"):
+            end = int(m.group("v2"))
+            if m.group("c2"):
+                c2, v2 = int(m.group("c2")), end
+            elif v1 is None or m.group("unit2") in ("장", "편"):
+                # "5장~7장": 장 범위
+                c2, v2 = end, None
+            elif end < v1:
+                # "5 : 13 ~ 6": 다음 장으로 넘어가는 범위 (끝 장 전체로 간주)
+                c2, v2 = end, None
+            else:
+                v2 = end
+
+        matches.append(
+            ScriptureMatch(
+                book=book,
+                chapter_start=c1,
+                verse_start=v1,
+                chapter_end=c2,
+                verse_end=v2,
+                span=m.span(),
+                text=m.group(0).strip(),
+            )
+        )
+
+    return matches
+
+
+def passage_bounds(match: ScriptureMatch) -> Tuple[int, int, int]:
+    """
+    구절 참조 → (책 ID, 시작 위치, 끝 위치). 위치 = 장 * 1000 + 절.
+
+    절이 없으면 장 전체(0~999)로 본다.
+    """
+    verse_start = match.verse_start if match.verse_start is not None else VERSE_MIN
+    if match.verse_end is not None:
+        verse_end = match.verse_end
+    elif match.verse_start is not None and match.chapter_end == match.chapter_start:
+        verse_end = match.verse_start
+    else:
+        verse_end = VERSE_MAX
+    lo = match.chapter_start * 1000 + verse_start
+    hi = match.chapter_end * 1000 + verse_end
+    return match.book.id, min(lo, hi), max(lo, hi)
@@ -0,0 +1,155 @@
+# backend/sermon_agent/utils/chunking.py
+# -*- coding: utf-8 -*-
+"""
+chunking.py
+
+설교 본문(content_summary) 청크 분할 (청크 임베딩용).
+
+- 문단 경계를 우선으로 max_chars 이내의 창(window)을 만든다
+- max_chars보다 긴 문단은 문장 단위로 나눠 채운다
+- 긴 문단을 문장으로 나눈 경우, 같은 문단 안에서만 이웃 청크와 끝 문장 overlap_sentences개를
+  겹쳐 경계에 걸친 내용도 검색되게 한다 (문단 단위로 넣은 단위는 겹치지 않음)
+- max_chars보다 긴 문장은 같은 길이로 나눠 짧은 자투리 조각이 생기지 않게 한다
+- 표준 라이브러리(re)만 사용 (backend/embedding/Embedding.py에서도 import)
+"""
+
+from __future__ import annotations
+
+import re
+from typing import List, NamedTuple, Optional
+
+_PARAGRAPH_RE = re.compile(r"\n\s*\n")
+_SENTENCE_RE = re.compile(r"[^.!?。\n]+(?:[.!?。]+|$)")
+
+DEFAULT_CHUNK_CHARS = 500
+DEFAULT_OVERLAP_SENTENCES = 1
+
+
+class Chunk(NamedTuple):
+    index: int
+    text: str
+    char_start: int
+    char_end: int
+
+
+class _Unit(NamedTuple):
+    start: int
+    end: int
+    paragraph: int
+    sentence: bool = False  # 긴 문단을 문장으로 나눈 조각 (겹침 대상)
+
+
+def _sentence_units(text: str, start: int, end: int, paragraph: int) -> List[_Unit]:
+    units = []
+    for m in _SENTENCE_RE.finditer(text, start, end):
+        s, e = m.start(), m.end()
+        while s < e and text[s].isspace():
+            s += 1
+        while e > s and text[e - 1].isspace():
+            e -= 1
+        if s < e:
+            units.append(_Unit(s, e, paragraph, True))
+    return units
+
+
+def _split_units(text: str, max_chars: int) -> List[_Unit]:
+    """문단(길면 문장) 단위 구간 목록 (원문 위치 기준)."""
+    units: List[_Unit] = []
+    pos = 0
+    bounds = [(m.start(), m.end()) for m in _PARAGRAPH_RE.finditer(text)]
+    spans = []
+    for sep_start, sep_end in bounds:
+        spans.append((pos, sep_start))
+        pos = sep_end
+    spans.append((pos, len(text)))
+
+    for n, (s, e) in enumerate(spans):
+        while s < e and text[s].isspace():
+            s += 1
+        while e > s and text[e - 1].isspace():
+            e -= 1
+        if s >= e:
+            continue
+        if e - s <= max_chars:
+            units.append(_Unit(s, e, n))
+            continue
+        for unit in _sentence_units(text, s, e, n):
+            units.extend(_cut_sentence(unit, max_chars))
+    return units
+
+
+def _cut_sentence(unit: _Unit, max_chars: int) -> List[_Unit]:
+    """max_chars보다 긴 문장을 균등한 길이로 자른다 (마지막 조각만 짧게 남지 않도록)."""
+    length = unit.end - unit.start
+    if length <= max_chars:
+        return [unit]
+    pieces = -(-length // max_chars)
+    step = -(-length // pieces)
+    return [
+        _Unit(cut, min(cut + step, unit.end), unit.paragraph, True)
+        for cut in range(unit.start, unit.end, step)
+    ]
+
+
+def chunk_text(
+    text: Optional[str],
+    max_chars: int = DEFAULT_CHUNK_CHARS,
+    overlap_sentences: int = DEFAULT_OVERLAP_SENTENCES,
+) -> List[Chunk]:
+    """
+    문단 인식 청크 분할.
+
+    같은 문단 안의 단위는 공백, 문단이 바뀌면 줄바꿈으로 이어 붙인다.
+    char_start/char_end는 원문 기준 위치 (겹치는 부분 포함).
+    """
+    text = text or ""
+    units = _split_units(text, max_chars)
+    if not units:
+        return []
+
+    def render(group: List[_Unit]) -> str:
+        parts = [text[group[0].start:group[0].end]]
+        for prev, unit in zip(group, group[1:]):
+            parts.append("\n" if unit.paragraph != prev.paragraph else " ")
+            parts.append(text[unit.start:unit.end])
+        return "".join(parts)
+
+    def overlap_carry(group: List[_Unit], unit: _Unit) -> List[_Unit]:
+        # 다음 단위와 같은 문단의 문장 조각만 겹친다 (청크 전체가 겹치면 진행 불가이므로 제외)
+        if not 0 < overlap_sentences < len(group) or group[-1].paragraph != unit.paragraph:
+            return []
+        carry: List[_Unit] = []
+        for u in reversed(group[-overlap_sentences:]):
+            if not u.sentence or u.paragraph != unit.paragraph:
+                break
+            carry.insert(0, u)
+        return carry
+
+    def rendered_size(group: List[_Unit]) -> int:
+        # 단위 길이 + 구분자(공백/줄바꿈) 1글자씩
+        return sum(u.end - u.start for u in group) + max(len(group) - 1, 0)
+
+    chunks: List[Chunk] = []
+    group: List[_Unit] = []
+    carried = 0  # group 앞쪽의 겹침(앞 청크에서 넘어온) 단위 수
+    i = 0
+    while i < len(units):
+        unit = units[i]
+        if group and rendered_size(group + [unit]) > max_chars:
+            if carried == len(group):
+                # 겹침 단위만 있는 그룹은 앞 청크의 꼬리와 같으므로 내보내지 않고 버린다
+                group, carried = [], 0
+                continue
+            chunks.append(Chunk(len(chunks), render(group), group[0].start, group[-1].end))
+            # 다음 청크는 앞 청크 끝 문장 몇 개를 겹쳐서 시작
+            carry = overlap_carry(group, unit)
+            if rendered_size(carry + [unit]) > max_chars:
+                carry = []
+            group, carried = list(carry), len(carry)
+            continue
+        group.append(unit)
+        i += 1
+
+    if group and carried < len(group):
+        chunks.append(Chunk(len(chunks), render(group), group[0].start, group[-1].end))
+    return chunks
@@ -0,0 +1,238 @@
+# backend/sermon_agent/utils/context_packer.py
+# -*- coding: utf-8 -*-
+"""
+context_packer.py
+
+답변 LLM용 설교 컨텍스트 패커 (토큰 예산).
+
+- 토큰 수: tiktoken (답변 모델 인코딩). 인코딩 파일을 받을 수 없는 환경이면
+  보수적 추정(비ASCII 1글자 = 1토큰, ASCII 4글자 = 1토큰)으로 대체
+- 검색 단계가 정한 순서(RRF 융합 / cross-encoder 재순위) 그대로 전체 예산 안에 채우고,
+  설교마다 요약 토큰 상한을 둔다 (여기서 다시 정렬하지 않는다)
+- 요약이 상한을 넘으면 문단(길면 문장) 단위로 나눠 질문과 겹치는 토큰이 많은 부분을 골라
+  원래 순서대로 이어 붙인다 (겹침이 없으면 앞부분 유지)
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from typing import Any, Dict, List, Sequence, Tuple
+
+from backend.sermon_agent.utils.sparse_index import tokenize
+
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - requirements.txt에 포함
+    tiktoken = None
+
+
+_PARAGRAPH_RE = re.compile(r"\n\s*\n")
+_SENTENCE_RE = re.compile(r"(?<=[.!?。])\s+")
+_ELLIPSIS = "…"
+
+
+class TokenCounter:
+    """tiktoken 토큰 카운터 (인코딩을 못 쓰면 추정치)."""
+
+    def __init__(self, model: str):
+        self.model = model
+        self.exact = False
+        self._encoding = None
+        if tiktoken is None:
+            return
+        try:
+            try:
+                self._encoding = tiktoken.encoding_for_model(model)
+            except KeyError:
+                self._encoding = tiktoken.get_encoding("o200k_base")
+            self.exact = True
+        except Exception as e:
+            print(f"  [ContextPacker] tiktoken 인코딩 로드 실패 ({e}) -> 추정치 사용", flush=True)
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        if self._encoding is not None:
+            return len(self._encoding.encode(text, disallowed_special=()))
+        ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+        return (len(text) - ascii_chars) + math.ceil(ascii_chars / 4)
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """앞에서부터 max_tokens 이내로 자르기."""
+        if max_tokens <= 0:
+            return ""
+        if self._encoding is not None:
+            tokens = self._encoding.encode(text, disallowed_special=())
+            if len(tokens) <= max_tokens:
+                return text
+            return self._encoding.decode(tokens[:max_tokens]).rstrip("�")
+
+        # 추정치 모드: 글자 단위로 누적
+        used = 0.0
+        for i, ch in enumerate(text):
+            used += 0.25 if ord(ch) < 128 else 1.0
+            if used > max_tokens:
+                return text[:i]
+        return text
+
+
+# ─────────────────────────────────────────────────────────
+# 요약 발췌
+# ─────────────────────────────────────────────────────────
+
+
+def _split_units(
+    text: str, counter: TokenCounter, max_unit_tokens: int
+) -> List[Tuple[str, int, int]]:
+    """요약 → (단위 텍스트, 토큰 수, 문단 번호) 목록. 긴 문단은 문장으로 나눈다."""
+    units: List[Tuple[str, int, int]] = []
+    paragraphs = [p.strip() for p in _PARAGRAPH_RE.split(text) if p.strip()]
+    for n, paragraph in enumerate(paragraphs):
+        tokens = counter.count(paragraph)
+        if tokens <= max_unit_tokens:
+            units.append((paragraph, tokens, n))
+            continue
+        for sentence in _SENTENCE_RE.split(paragraph):
+            sentence = sentence.strip()
+            if sentence:
+                units.append((sentence, counter.count(sentence), n))
+    return units
+
+
+def extract_relevant(
+    text: str,
+    query_tokens: Sequence[str],
+    max_tokens: int,
+    counter: TokenCounter,
+) -> Tuple[str, bool]:
+    """
+    요약에서 질문과 관련 높은 부분을 max_tokens 이내로 발췌.
+
+    Returns:
+        (발췌 텍스트, 잘렸는지 여부)
+    """
+    text = (text or "").strip()
+    if not text or max_tokens <= 0:
+        return "", bool(text)
+    if counter.count(text) <= max_tokens:
+        return text, False
+
+    units = _split_units(text, counter, max(max_tokens // 2, 1))
+    query_set = set(query_tokens)
+
+    # 점수: 질문 토큰과 겹치는 고유 토큰 수. 동점이면 앞쪽 우선 (첫 문단은 대개 주제 요약)
+    scored = []
+    for i, (unit, _, _) in enumerate(units):
+        overlap = len(query_set.intersection(tokenize(unit))) if query_set else 0
+        scored.append((-overlap, i))
+    scored.sort()
+
+    chosen: List[int] = []
+    used = 0
+    for _, i in scored:
+        unit_tokens = units[i][1] + (1 if chosen else 0)
+        if used + unit_tokens > max_tokens:
+            continue
+        chosen.append(i)
+        used += unit_tokens
+
+    if not chosen:
+        # 가장 관련 높은 단위 하나도 예산을 넘으면 잘라서 사용
+        return counter.truncate(units[scored[0][1]][0], max_tokens), True
+
+    # 원래 순서로 이어 붙이기: 같은 문단의 연속 문장은 공백, 문단이 바뀌면 줄바꿈,
+    # 사이에 빠진 부분이 있으면 생략 부호
+    chosen.sort()
+    out = units[chosen[0]][0]
+    for prev, i in zip(chosen, chosen[1:]):
+        if i != prev + 1:
+            out += f" {_ELLIPSIS}" + ("\n" if units[i][2] != units[prev][2] else " ")
+        else:
+            out += "\n" if units[i][2] != units[prev][2] else " "
+        out += units[i][0]
+    return out, True
+
+
+# ─────────────────────────────────────────────────────────
+# 컨텍스트 패킹
+# ─────────────────────────────────────────────────────────
+
+_HEADER = "[참고 설교 아카이브] 아래 내용만을 바탕으로 답변하세요"
+_FOOTER = "위 설교 내용을 바탕으로 질문에 답변하세요. 반드시 날짜와 제목을 인용하세요."
+
+# 메타데이터만 넣고도 요약을 이만큼은 넣을 수 있어야 설교를 포함한다
+_MIN_SUMMARY_TOKENS = 40
+
+
+def _snippet_header(i: int, s: Dict[str, Any]) -> str:
+    fields = [f"[설교 {i}] {s.get('title') or '제목 없음'}", f"날짜: {s.get('date') or '날짜 미상'}"]
+    if s.get("scripture"):
+        fields.append(f"본문: {s['scripture']}")
+    if s.get("preacher"):
+        fields.append(f"설교자: {s['preacher']}")
+    if s.get("score"):
+        fields.append(f"관련도: {s['score']:.1%}")
+    return " | ".join(fields)
+
+
+def pack_sermon_context(
+    snippets: Sequence[Dict[str, Any]],
+    query: str,
+    counter: TokenCounter,
+    max_tokens: int,
+    snippet_max_tokens: int,
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    검색된 설교를 토큰 예산 안의 컨텍스트 문자열로 구성.
+
+    snippets는 검색 순위 순서라고 보고 앞에서부터 채운다. score는 벡터 유사도라
+    BM25 전용 결과(0.0)나 재순위 결과의 순서를 반영하지 못하므로 정렬 기준으로 쓰지 않는다.
+
+    Returns:
+        (컨텍스트, 통계 {"context_tokens", "included", "included_indices", "dropped",
+                        "truncated", "source_tokens", "exact"})
+        included_indices는 컨텍스트에 들어간 snippets의 위치 ([설교 i]는 i-1번째 항목)
+    """
+    stats: Dict[str, Any] = {
+        "context_tokens": 0,
+        "included": 0,
+        "included_indices": [],
+        "dropped": 0,
+        "truncated": 0,
+        "source_tokens": 0,
+        "exact": counter.exact,
+    }
+    if not snippets:
+        return "", stats
+
+    query_tokens = tokenize(query)
+
+    blocks: List[str] = []
+    remaining = max_tokens - counter.count(_HEADER) - counter.count(_FOOTER) - 4
+
+    for idx, s in enumerate(snippets):
+        summary = (s.get("summary") or "").strip()
+        stats["source_tokens"] += counter.count(summary)
+
+        header = _snippet_header(len(blocks) + 1, s)
+        header_tokens = counter.count(header) + 2
+        budget = min(snippet_max_tokens, remaining - header_tokens)
+        if summary and budget < _MIN_SUMMARY_TOKENS:
+            stats["dropped"] += 1
+            continue
+        if not summary and remaining < header_tokens:
+            stats["dropped"] += 1
+            continue
+
+        excerpt, truncated = extract_relevant(summary, query_tokens, budget, counter)
+        block = f"{header}\n{excerpt}" if excerpt else header
+        remaining -= header_tokens + counter.count(excerpt)
+        stats["truncated"] += int(truncated)
+        blocks.append(block)
+        stats["included_indices"].append(idx)
+
+    stats["included"] = len(blocks)
+    context = "\n\n".join([_HEADER, *blocks, _FOOTER])
+    stats["context_tokens"] = counter.count(context)
+    return context, stats
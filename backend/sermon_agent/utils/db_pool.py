@@ -0,0 +1,184 @@
+# backend/sermon_agent/utils/db_pool.py
+# -*- coding: utf-8 -*-
+"""
+db_pool.py
+
+psycopg 연결 풀 생성 (크기 설정 + 대기/점유 시간 지표).
+
+풀 크기:
+  - DB_POOL_MAX_SIZE를 지정하지 않으면 "동시 실행 수"(예: 그래프 스레드풀 워커 수)와
+    워커 프로세스당 연결 예산(DB_MAX_CONNECTIONS / WEB_CONCURRENCY) 중 작은 값
+  - DB_POOL_MIN_SIZE를 지정하지 않으면 최대의 1/4 (최소 1) → 시작 시 미리 연결
+  - 수명/유휴 제한은 재연결(TLS + 인증) 반복을 줄이도록 길게 (1시간 / 10분)
+
+지표 (utils/metrics.py, /metrics):
+  - db_pool_wait_seconds{pool}: 연결을 얻기까지 기다린 시간
+  - db_pool_checkout_seconds{pool}: 연결을 빌려 쓴 시간
+  - db_pool_timeouts_total{pool}: 풀 대기 시간 초과 횟수
+  - db_pool_connections{pool,state}: size / available / waiting
+
+동기 풀(ConnectionPool)은 스레드에서 실행되는 LangGraph 노드용,
+비동기 풀(AsyncConnectionPool)은 async 핸들러에서 공유하는 용도.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, Optional, Tuple
+
+from psycopg_pool import AsyncConnectionPool, ConnectionPool, PoolTimeout
+
+from backend.sermon_agent.utils import metrics
+
+# 풀 설정 (빈 값이면 자동 계산)
+DB_POOL_MIN_SIZE = os.getenv("DB_POOL_MIN_SIZE", "")
+DB_POOL_MAX_SIZE = os.getenv("DB_POOL_MAX_SIZE", "")
+# 서비스 전체(모든 워커 프로세스 합) DB 연결 예산과 워커 프로세스 수 (uvicorn --workers와 맞춘다)
+DB_MAX_CONNECTIONS = int(os.getenv("DB_MAX_CONNECTIONS", "20"))
+WEB_CONCURRENCY = max(int(os.getenv("WEB_CONCURRENCY", "1")), 1)
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+DB_POOL_MAX_LIFETIME = float(os.getenv("DB_POOL_MAX_LIFETIME", "3600"))
+DB_POOL_MAX_IDLE = float(os.getenv("DB_POOL_MAX_IDLE", "600"))
+# 대기 요청 상한 (0이면 무제한). 넘으면 즉시 TooManyRequests
+DB_POOL_MAX_WAITING = int(os.getenv("DB_POOL_MAX_WAITING", "0"))
+# 서버 측 prepared statement 사용 (PgBouncer transaction 모드 뒤라면 false)
+DB_PREPARE_STATEMENTS = os.getenv("DB_PREPARE_STATEMENTS", "true").lower() in ("1", "true", "yes")
+
+_POOL_WAIT = metrics.histogram("db_pool_wait_seconds", "Time spent waiting for a pooled connection")
+_POOL_CHECKOUT = metrics.histogram("db_pool_checkout_seconds", "Time a pooled connection was held")
+_POOL_TIMEOUTS = metrics.counter("db_pool_timeouts_total", "Pool checkouts that timed out")
+_POOL_CONNECTIONS = metrics.gauge("db_pool_connections", "Pool connections by state")
+
+
+def pool_sizes(concurrency: int) -> Tuple[int, int]:
+    """
+    (min_size, max_size) 계산.
+
+    Args:
+        concurrency: 이 풀을 동시에 쓰는 최대 작업 수 (스레드풀 워커 수 등)
+    """
+    if DB_POOL_MAX_SIZE:
+        max_size = int(DB_POOL_MAX_SIZE)
+    else:
+        per_worker_budget = max(DB_MAX_CONNECTIONS // WEB_CONCURRENCY, 1)
+        max_size = min(max(concurrency, 1), per_worker_budget)
+    max_size = max(max_size, 1)
+
+    min_size = int(DB_POOL_MIN_SIZE) if DB_POOL_MIN_SIZE else max(max_size // 4, 1)
+    return min(min_size, max_size), max_size
+
+
+def _register_gauges(name: str, pool) -> None:
+    def samples():
+        stats = pool.get_stats()
+        return [
+            ({"pool": name, "state": "size"}, stats.get("pool_size", 0)),
+            ({"pool": name, "state": "available"}, stats.get("pool_available", 0)),
+            ({"pool": name, "state": "waiting"}, stats.get("requests_waiting", 0)),
+        ]
+
+    _POOL_CONNECTIONS.add_callback(samples)
+
+
+class InstrumentedConnectionPool(ConnectionPool):
+    """connection() 대기/점유 시간을 히스토그램에 기록하는 ConnectionPool."""
+
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None) -> Iterator[Any]:
+        labels = {"pool": self.name}
+        start = time.perf_counter()
+        acquired: Optional[float] = None
+        try:
+            with super().connection(timeout) as conn:
+                acquired = time.perf_counter()
+                _POOL_WAIT.observe(acquired - start, labels)
+                yield conn
+        except PoolTimeout:
+            if acquired is None:
+                _POOL_WAIT.observe(time.perf_counter() - start, labels)
+                _POOL_TIMEOUTS.inc(labels=labels)
+            raise
+        finally:
+            if acquired is not None:
+                _POOL_CHECKOUT.observe(time.perf_counter() - acquired, labels)
+
+
+class InstrumentedAsyncConnectionPool(AsyncConnectionPool):
+    """connection() 대기/점유 시간을 히스토그램에 기록하는 AsyncConnectionPool."""
+
+    @asynccontextmanager
+    async def connection(self, timeout: Optional[float] = None) -> AsyncIterator[Any]:
+        labels = {"pool": self.name}
+        start = time.perf_counter()
+        acquired: Optional[float] = None
+        try:
+            async with super().connection(timeout) as conn:
+                acquired = time.perf_counter()
+                _POOL_WAIT.observe(acquired - start, labels)
+                yield conn
+        except PoolTimeout:
+            if acquired is None:
+                _POOL_WAIT.observe(time.perf_counter() - start, labels)
+                _POOL_TIMEOUTS.inc(labels=labels)
+            raise
+        finally:
+            if acquired is not None:
+                _POOL_CHECKOUT.observe(time.perf_counter() - acquired, labels)
+
+
+def _pool_kwargs(concurrency: int) -> Dict[str, Any]:
+    min_size, max_size = pool_sizes(concurrency)
+    return {
+        "min_size": min_size,
+        "max_size": max_size,
+        "timeout": DB_POOL_TIMEOUT,
+        "max_waiting": DB_POOL_MAX_WAITING,
+        "max_lifetime": DB_POOL_MAX_LIFETIME,
+        "max_idle": DB_POOL_MAX_IDLE,
+        "reconnect_timeout": 10,
+    }
+
+
+def create_pool(
+    conninfo: str,
+    name: str,
+    concurrency: int,
+    configure: Optional[Callable[[Any], None]] = None,
+) -> InstrumentedConnectionPool:
+    """동기 풀 생성 (min_size개 연결은 백그라운드에서 바로 열기 시작)."""
+    kwargs = _pool_kwargs(concurrency)
+    pool = InstrumentedConnectionPool(
+        conninfo=conninfo, name=name, configure=configure, open=True, **kwargs
+    )
+    _register_gauges(name, pool)
+    print(f"  [DB Pool] {name}: min={kwargs['min_size']}, max={kwargs['max_size']}", flush=True)
+    return pool
+
+
+async def create_async_pool(
+    conninfo: str,
+    name: str,
+    concurrency: int,
+    configure: Optional[Callable[[Any], Any]] = None,
+) -> InstrumentedAsyncConnectionPool:
+    """비동기 풀 생성 + 열기 (실행 중인 이벤트 루프 안에서 호출)."""
+    kwargs = _pool_kwargs(concurrency)
+    pool = InstrumentedAsyncConnectionPool(
+        conninfo=conninfo, name=name, configure=configure, open=False, **kwargs
+    )
+    await pool.open()
+    _register_gauges(name, pool)
+    print(f"  [DB Pool] {name} (async): min={kwargs['min_size']}, max={kwargs['max_size']}", flush=True)
+    return pool
+
+
+def get_pool_metrics(name: str) -> Dict[str, Any]:
+    """풀 대기/점유 시간 요약 (초)."""
+    labels = {"pool": name}
+    return {
+        "wait": _POOL_WAIT.snapshot(labels),
+        "checkout": _POOL_CHECKOUT.snapshot(labels),
+        "timeouts": _POOL_TIMEOUTS.value(labels),
+    }
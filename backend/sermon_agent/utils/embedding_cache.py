@@ -0,0 +1,307 @@
+# backend/sermon_agent/utils/embedding_cache.py
+# -*- coding: utf-8 -*-
+"""
+embedding_cache.py
+
+쿼리 임베딩 2단 캐시.
+
+  - 1단: 프로세스 내 LRU (바이트 예산, float32 배열, O(1) 조회/제거)
+  - 2단: SQLite 디스크 캐시 (uvicorn 워커 간 / 재시작 후에도 공유)
+         행 수/바이트 상한을 넘으면 오래 안 쓴 순(used_at)으로 정리
+
+캐시 키는 "모델명 + 정규화된 텍스트"의 SHA-256 해시.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from typing import Any, Dict, Optional
+
+import numpy as np
+from cachetools import LRUCache
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키용 텍스트 정규화 (NFC, 공백 정리)."""
+    text = unicodedata.normalize("NFC", text or "")
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def make_cache_key(model_name: str, text: str) -> str:
+    """모델명 + 정규화 텍스트 기반 캐시 키."""
+    raw = f"{model_name}\x00{normalize_text(text)}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+# ─────────────────────────────────────────────────────────
+# 1단: 인메모리 LRU
+# ─────────────────────────────────────────────────────────
+
+
+class _CountingLRU(LRUCache):
+    """제거(eviction) 횟수를 세는 바이트 예산 LRU."""
+
+    def __init__(self, max_bytes: int):
+        super().__init__(maxsize=max_bytes, getsizeof=lambda v: v.nbytes)
+        self.evictions = 0
+
+    def popitem(self):
+        item = super().popitem()
+        self.evictions += 1
+        return item
+
+
+# ─────────────────────────────────────────────────────────
+# 2단: SQLite 디스크 캐시
+# ─────────────────────────────────────────────────────────
+
+
+class SQLiteEmbeddingStore:
+    """
+    float32 벡터를 BLOB으로 저장하는 SQLite 캐시.
+
+    WAL 모드를 사용해 여러 워커 프로세스가 동시에 읽고 쓸 수 있다.
+    마지막 사용 시각(used_at)을 저장/디스크 적중 시 갱신하고, 일정 횟수 저장마다
+    행 수(max_entries)·벡터 바이트(max_bytes) 초과분을 오래 안 쓴 순으로 삭제한다 (0이면 무제한).
+    """
+
+    _PRUNE_EVERY = 256
+
+    def __init__(self, path: str, max_entries: int = 0, max_bytes: int = 0):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._writes = 0
+        self.evictions = 0
+        self._conn = sqlite3.connect(path, timeout=5.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS query_embeddings (
+                key TEXT PRIMARY KEY,
+                model_name TEXT NOT NULL,
+                dim INTEGER NOT NULL,
+                vector BLOB NOT NULL,
+                created_at REAL NOT NULL,
+                used_at REAL NOT NULL
+            )
+            """
+        )
+        # used_at 이전에 만든 캐시 파일은 컬럼 추가 (created_at으로 채움)
+        columns = {r[1] for r in self._conn.execute("PRAGMA table_info(query_embeddings)")}
+        if "used_at" not in columns:
+            self._conn.execute("ALTER TABLE query_embeddings ADD COLUMN used_at REAL NOT NULL DEFAULT 0")
+            self._conn.execute("UPDATE query_embeddings SET used_at = created_at")
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS query_embeddings_used_at ON query_embeddings (used_at)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT dim, vector FROM query_embeddings WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                # 디스크 적중은 메모리 LRU를 놓친 경우뿐이라 갱신 쓰기는 드물다
+                self._conn.execute(
+                    "UPDATE query_embeddings SET used_at = ? WHERE key = ?", (time.time(), key)
+                )
+                self._conn.commit()
+        if row is None:
+            return None
+        dim, blob = row
+        vec = np.frombuffer(blob, dtype=np.float32)
+        if vec.shape[0] != dim:
+            return None
+        return vec
+
+    def put(self, key: str, model_name: str, vec: np.ndarray) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO query_embeddings (key, model_name, dim, vector, created_at, used_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (key, model_name, int(vec.shape[0]), vec.tobytes(), now, now),
+            )
+            self._writes += 1
+            if self._writes % self._PRUNE_EVERY == 0:
+                self._prune()
+            self._conn.commit()
+
+    def _prune(self) -> None:
+        keep = self.max_entries if self.max_entries > 0 else -1
+        if self.max_bytes > 0:
+            count, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(vector)), 0) FROM query_embeddings"
+            ).fetchone()
+            if total > self.max_bytes:
+                # 벡터 크기는 모델 차원으로 거의 일정하므로 평균 크기로 남길 행 수를 정한다
+                by_bytes = int(self.max_bytes / (total / count))
+                keep = by_bytes if keep < 0 else min(keep, by_bytes)
+        if keep < 0:
+            return
+        evicted = self._conn.execute(
+            """
+            DELETE FROM query_embeddings WHERE key IN (
+                SELECT key FROM query_embeddings ORDER BY used_at DESC LIMIT -1 OFFSET ?
+            )
+            """,
+            (keep,),
+        ).rowcount
+        self.evictions += max(evicted, 0)
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM query_embeddings").fetchone()[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM query_embeddings")
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# ─────────────────────────────────────────────────────────
+# 2단 캐시
+# ─────────────────────────────────────────────────────────
+
+
+class EmbeddingCache:
+    """
+    인메모리 LRU + 디스크 캐시를 묶은 쿼리 임베딩 캐시.
+
+    Usage:
+        cache = EmbeddingCache("dragonkue/bge-m3-ko", max_bytes=32 * 1024 * 1024,
+                               disk_path="backend/.cache/embedding_cache.sqlite3",
+                               disk_max_entries=50000, disk_max_bytes=256 * 1024 * 1024)
+        vec = cache.get(text)
+        if vec is None:
+            vec = cache.put(text, model.embed_query(text))
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        max_bytes: int,
+        disk_path: Optional[str] = None,
+        disk_max_entries: int = 0,
+        disk_max_bytes: int = 0,
+    ):
+        self.model_name = model_name
+        self._memory = _CountingLRU(max_bytes)
+        self._lock = threading.Lock()
+        self._disk: Optional[SQLiteEmbeddingStore] = None
+
+        self._stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "disk_errors": 0,
+        }
+
+        if disk_path:
+            try:
+                self._disk = SQLiteEmbeddingStore(
+                    disk_path, max_entries=disk_max_entries, max_bytes=disk_max_bytes
+                )
+            except sqlite3.Error as e:
+                print(f"  [EmbeddingCache] 디스크 캐시 비활성화: {e}", flush=True)
+
+    def _remember(self, key: str, vec: np.ndarray) -> None:
+        # 바이트 예산보다 큰 벡터는 LRUCache가 ValueError를 던지므로 건너뜀
+        if vec.nbytes > self._memory.maxsize:
+            return
+        with self._lock:
+            self._memory[key] = vec
+
+    def get(self, text: str) -> Optional[np.ndarray]:
+        """캐시 조회 (메모리 → 디스크 순). 없으면 None."""
+        key = make_cache_key(self.model_name, text)
+
+        with self._lock:
+            vec = self._memory.get(key)
+            if vec is not None:
+                self._stats["memory_hits"] += 1
+                return vec
+
+        if self._disk is not None:
+            try:
+                vec = self._disk.get(key)
+            except sqlite3.Error as e:
+                vec = None
+                with self._lock:
+                    self._stats["disk_errors"] += 1
+                print(f"  [EmbeddingCache] 디스크 조회 오류: {e}", flush=True)
+
+            if vec is not None:
+                self._remember(key, vec)
+                with self._lock:
+                    self._stats["disk_hits"] += 1
+                return vec
+
+        with self._lock:
+            self._stats["misses"] += 1
+        return None
+
+    def put(self, text: str, embedding: Any) -> np.ndarray:
+        """임베딩 저장 후 읽기 전용 float32 배열 반환."""
+        key = make_cache_key(self.model_name, text)
+        vec = np.ascontiguousarray(embedding, dtype=np.float32)
+        vec.setflags(write=False)
+
+        self._remember(key, vec)
+
+        if self._disk is not None:
+            try:
+                self._disk.put(key, self.model_name, vec)
+            except sqlite3.Error as e:
+                with self._lock:
+                    self._stats["disk_errors"] += 1
+                print(f"  [EmbeddingCache] 디스크 저장 오류: {e}", flush=True)
+
+        return vec
+
+    def stats(self) -> Dict[str, Any]:
+        """hit/miss/eviction 카운터 및 메모리 사용량."""
+        with self._lock:
+            lookups = (
+                self._stats["memory_hits"] + self._stats["disk_hits"] + self._stats["misses"]
+            )
+            hits = self._stats["memory_hits"] + self._stats["disk_hits"]
+            return {
+                **self._stats,
+                "evictions": self._memory.evictions,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+                "memory_entries": len(self._memory),
+                "memory_bytes": int(self._memory.currsize),
+                "memory_max_bytes": int(self._memory.maxsize),
+                "disk_enabled": self._disk is not None,
+                "disk_evictions": self._disk.evictions if self._disk is not None else 0,
+            }
+
+    def clear(self, include_disk: bool = False) -> None:
+        """캐시 비우기."""
+        with self._lock:
+            self._memory.clear()
+        if include_disk and self._disk is not None:
+            self._disk.clear()
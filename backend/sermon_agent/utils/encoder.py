@@ -0,0 +1,278 @@
+# backend/sermon_agent/utils/encoder.py
+# -*- coding: utf-8 -*-
+"""
+encoder.py
+
+bge-m3-ko 문장 인코더 백엔드 (CPU).
+
+    torch       HuggingFaceEmbeddings fp32 (기본, 기존 동작)
+    torch-int8  sentence-transformers 모델의 nn.Linear를 동적 int8 양자화
+    onnx        ONNX Runtime fp32 (첫 사용 시 모델을 ONNX로 내보내 캐시)
+    onnx-int8   ONNX Runtime + 동적 int8 양자화 모델
+
+모든 백엔드는 HuggingFaceEmbeddings와 같은 embed_query / embed_documents 인터페이스에
+L2 정규화된 벡터를 반환하므로 sermon_retriever, Embedding.py에서 바꿔 끼울 수 있다.
+
+onnx 계열은 onnxruntime이 필요하다 (pip install onnxruntime, requirements.txt에는 없음).
+내보내기/양자화 결과는 cache_dir/<모델명>/ 에 저장되어 다음 실행부터 재사용된다.
+fp32 대비 코사인 유사도 검증: backend/benchmarks/bench_encoder_backends.py
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+ENCODER_BACKENDS = ("torch", "torch-int8", "onnx", "onnx-int8")
+
+# 인코딩 배치 크기 (embed_documents)
+DEFAULT_BATCH_SIZE = 32
+
+
+def _normalize(mat: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(mat, axis=1, keepdims=True)
+    return (mat / np.maximum(norms, 1e-12)).astype(np.float32)
+
+
+def _set_torch_threads(threads: int) -> None:
+    if threads > 0:
+        import torch
+
+        torch.set_num_threads(threads)
+
+
+# ─────────────────────────────────────────────────────────
+# torch (fp32 / int8)
+# ─────────────────────────────────────────────────────────
+
+
+class TorchInt8Encoder:
+    """sentence-transformers 모델 + torch 동적 int8 양자화 (nn.Linear 가중치)."""
+
+    def __init__(self, model_name: str, batch_size: int = DEFAULT_BATCH_SIZE, threads: int = 0):
+        import torch
+        from sentence_transformers import SentenceTransformer
+
+        _set_torch_threads(threads)
+        self.batch_size = batch_size
+        model = SentenceTransformer(model_name, device="cpu")
+        # 복사본을 만들지 않도록 inplace (fp32 가중치가 두 벌 올라가지 않게)
+        self._model = torch.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+        )
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        vectors = self._model.encode(
+            list(texts),
+            batch_size=self.batch_size,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+        return vectors.astype(np.float32).tolist()
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+
+# ─────────────────────────────────────────────────────────
+# ONNX Runtime
+# ─────────────────────────────────────────────────────────
+
+_FP32_FILE = "model.onnx"
+_INT8_FILE = "model.int8.onnx"
+_META_FILE = "encoder.json"
+
+
+def export_onnx(model_name: str, export_dir: str) -> None:
+    """
+    sentence-transformers 모델 → ONNX (last_hidden_state 출력) + 토크나이저 + 풀링 설정 저장.
+
+    bge-m3는 fp32 가중치가 2GB를 넘어 가중치가 외부 데이터 파일로 함께 저장된다.
+    """
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    os.makedirs(export_dir, exist_ok=True)
+    start = time.time()
+    print(f"  [Encoder] {model_name} → ONNX 내보내는 중 ({export_dir})...", flush=True)
+
+    st_model = SentenceTransformer(model_name, device="cpu")
+    transformer = st_model[0]
+    tokenizer = transformer.tokenizer
+    pooling = st_model[1].get_pooling_mode_str() if len(st_model) > 1 else "cls"
+
+    class _HiddenState(torch.nn.Module):
+        def __init__(self, model):
+            super().__init__()
+            self.model = model
+
+        def forward(self, input_ids, attention_mask):
+            return self.model(input_ids=input_ids, attention_mask=attention_mask).last_hidden_state
+
+    dummy = tokenizer(["예시 문장입니다."], return_tensors="pt")
+    with torch.no_grad():
+        torch.onnx.export(
+            _HiddenState(transformer.auto_model.eval()),
+            (dummy["input_ids"], dummy["attention_mask"]),
+            os.path.join(export_dir, _FP32_FILE),
+            input_names=["input_ids", "attention_mask"],
+            output_names=["last_hidden_state"],
+            dynamic_axes={
+                "input_ids": {0: "batch", 1: "sequence"},
+                "attention_mask": {0: "batch", 1: "sequence"},
+                "last_hidden_state": {0: "batch", 1: "sequence"},
+            },
+            opset_version=17,
+        )
+    tokenizer.save_pretrained(export_dir)
+    with open(os.path.join(export_dir, _META_FILE), "w", encoding="utf-8") as f:
+        json.dump(
+            {"model_name": model_name, "pooling": pooling, "max_seq_length": st_model.max_seq_length},
+            f,
+            ensure_ascii=False,
+            indent=2,
+        )
+    print(f"  [Encoder] ONNX 내보내기 완료 ({time.time() - start:.1f}s)", flush=True)
+
+
+def quantize_onnx(export_dir: str) -> None:
+    """fp32 ONNX → 동적 int8 양자화 (가중치 int8, 활성값은 실행 시 양자화)."""
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    start = time.time()
+    print("  [Encoder] ONNX int8 양자화 중...", flush=True)
+    quantize_dynamic(
+        os.path.join(export_dir, _FP32_FILE),
+        os.path.join(export_dir, _INT8_FILE),
+        weight_type=QuantType.QInt8,
+    )
+    print(f"  [Encoder] 양자화 완료 ({time.time() - start:.1f}s)", flush=True)
+
+
+class OnnxEncoder:
+    """ONNX Runtime CPU 인코더 (fp32 또는 int8)."""
+
+    def __init__(
+        self,
+        model_name: str,
+        cache_dir: str,
+        quantized: bool = False,
+        max_length: Optional[int] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        threads: int = 0,
+    ):
+        try:
+            import onnxruntime as ort
+        except ImportError as e:
+            raise RuntimeError(
+                "onnx 인코더 백엔드에는 onnxruntime이 필요합니다 (pip install onnxruntime)"
+            ) from e
+        from transformers import AutoTokenizer
+
+        self.export_dir = os.path.join(cache_dir, model_name.replace("/", "__"))
+        if not os.path.exists(os.path.join(self.export_dir, _META_FILE)):
+            export_onnx(model_name, self.export_dir)
+        model_path = os.path.join(self.export_dir, _INT8_FILE if quantized else _FP32_FILE)
+        if quantized and not os.path.exists(model_path):
+            quantize_onnx(self.export_dir)
+
+        with open(os.path.join(self.export_dir, _META_FILE), encoding="utf-8") as f:
+            meta = json.load(f)
+        self.pooling = meta.get("pooling", "cls")
+        self.max_length = max_length or meta.get("max_seq_length") or 512
+        self.batch_size = batch_size
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if threads > 0:
+            options.intra_op_num_threads = threads
+        self._session = ort.InferenceSession(
+            model_path, sess_options=options, providers=["CPUExecutionProvider"]
+        )
+        self._tokenizer = AutoTokenizer.from_pretrained(self.export_dir)
+
+    def _encode_batch(self, texts: Sequence[str]) -> np.ndarray:
+        enc = self._tokenizer(
+            list(texts),
+            padding=True,
+            truncation=True,
+            max_length=self.max_length,
+            return_tensors="np",
+        )
+        mask = enc["attention_mask"].astype(np.int64)
+        hidden = self._session.run(
+            None, {"input_ids": enc["input_ids"].astype(np.int64), "attention_mask": mask}
+        )[0]
+        if self.pooling == "cls":
+            pooled = hidden[:, 0]
+        else:
+            weights = mask[:, :, None].astype(np.float32)
+            pooled = (hidden * weights).sum(axis=1) / np.maximum(weights.sum(axis=1), 1e-9)
+        return _normalize(pooled)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+        # 길이순으로 묶어 패딩을 줄이고, 결과는 원래 순서로 되돌린다
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        out = np.empty((len(texts), 0), dtype=np.float32)
+        for pos in range(0, len(order), self.batch_size):
+            idx = order[pos:pos + self.batch_size]
+            vecs = self._encode_batch([texts[i] for i in idx])
+            if out.shape[1] == 0:
+                out = np.empty((len(texts), vecs.shape[1]), dtype=np.float32)
+            out[idx] = vecs
+        return out.tolist()
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._encode_batch([text])[0].tolist()
+
+
+# ─────────────────────────────────────────────────────────
+# 팩토리
+# ─────────────────────────────────────────────────────────
+
+
+def create_encoder(
+    backend: str,
+    model_name: str,
+    cache_dir: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    threads: int = 0,
+):
+    """
+    인코더 백엔드 생성.
+
+    Args:
+        backend: ENCODER_BACKENDS 중 하나
+        model_name: HuggingFace 모델 이름
+        cache_dir: onnx 계열 내보내기/양자화 결과 저장 위치
+        batch_size: embed_documents 배치 크기
+        threads: CPU 스레드 수 (0이면 라이브러리 기본값)
+    """
+    backend = (backend or "torch").lower()
+    if backend == "torch":
+        from langchain_huggingface import HuggingFaceEmbeddings
+
+        _set_torch_threads(threads)
+        return HuggingFaceEmbeddings(
+            model_name=model_name,
+            model_kwargs={"device": "cpu"},
+            encode_kwargs={"normalize_embeddings": True, "batch_size": batch_size},
+        )
+    if backend == "torch-int8":
+        return TorchInt8Encoder(model_name, batch_size=batch_size, threads=threads)
+    if backend in ("onnx", "onnx-int8"):
+        return OnnxEncoder(
+            model_name,
+            cache_dir,
+            quantized=backend == "onnx-int8",
+            batch_size=batch_size,
+            threads=threads,
+        )
+    raise ValueError(f"알 수 없는 인코더 백엔드: {backend} (지원: {', '.join(ENCODER_BACKENDS)})")
@@ -0,0 +1,250 @@
+# backend/sermon_agent/utils/intent_classifier.py
+# -*- coding: utf-8 -*-
+"""
+intent_classifier.py
+
+라우터용 로컬 의도 분류기 (scikit-learn).
+
+- 입력: 검색 쿼리 임베딩 (bge-m3-ko, sermon_retriever와 같은 벡터 → 인코딩 1회 공유)
+- 출력: category (6개 클래스) + use_rag (이진)
+- 학습 데이터: LLM 라우터 결정 로그 (JSONL, RouterDecisionLog)
+
+학습/평가 CLI: backend/sermon_agent/train_router_classifier.py
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import joblib
+import numpy as np
+from sklearn.linear_model import LogisticRegression
+
+
+class RouterDecisionLog:
+    """
+    라우터 결정 JSONL 로그 (분류기 학습 데이터).
+
+    한 줄: {"text", "profile_mode", "category", "use_rag", "path", "latency", "created_at"}
+
+    사용자 질문 원문(상담 내용 포함)이 남으므로 크기와 보관 기간을 제한한다:
+      - 파일이 max_bytes를 넘으면 path.1, path.2 ... 로 회전 (backups개 초과분 삭제)
+      - retention_days가 지난 회전 파일은 삭제하고, 읽을 때도 그보다 오래된 기록은 건너뜀
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 10 * 1024 * 1024,
+        backups: int = 2,
+        retention_days: float = 30.0,
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = max(backups, 0)
+        self.retention_days = retention_days
+        self._lock = threading.Lock()
+        # 현재 파일 첫 기록 시각 (None이면 아직 확인 안 함)
+        self._active_since: Optional[float] = None
+
+    def _backup_path(self, n: int) -> str:
+        return f"{self.path}.{n}"
+
+    def _files(self) -> List[str]:
+        """오래된 순 로그 파일 목록 (회전 파일 → 현재 파일)."""
+        paths = [self._backup_path(n) for n in range(self.backups, 0, -1)] + [self.path]
+        return [p for p in paths if os.path.exists(p)]
+
+    def _cutoff(self) -> Optional[float]:
+        if self.retention_days <= 0:
+            return None
+        return time.time() - self.retention_days * 86400
+
+    def _first_record_time(self) -> float:
+        """현재 파일 첫 줄의 created_at (읽을 수 없으면 지금)."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                first = f.readline()
+            return datetime.fromisoformat(json.loads(first)["created_at"]).timestamp()
+        except (OSError, KeyError, TypeError, ValueError):
+            return time.time()
+
+    def _rotate(self) -> None:
+        self._active_since = None
+        if self.backups == 0:
+            os.remove(self.path)
+            return
+        oldest = self._backup_path(self.backups)
+        if os.path.exists(oldest):
+            os.remove(oldest)
+        for n in range(self.backups - 1, 0, -1):
+            if os.path.exists(self._backup_path(n)):
+                os.replace(self._backup_path(n), self._backup_path(n + 1))
+        os.replace(self.path, self._backup_path(1))
+
+    def _prune_expired(self) -> None:
+        """보관 기간이 지난 회전 파일 삭제 (마지막 수정 시각 기준)."""
+        cutoff = self._cutoff()
+        if cutoff is None:
+            return
+        for n in range(1, self.backups + 1):
+            path = self._backup_path(n)
+            if os.path.exists(path) and os.path.getmtime(path) < cutoff:
+                os.remove(path)
+
+    def append(self, record: Dict[str, Any]) -> None:
+        record = {**record, "created_at": datetime.now(timezone.utc).isoformat()}
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        try:
+            with self._lock:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                if os.path.exists(self.path):
+                    size = os.path.getsize(self.path)
+                    cutoff = self._cutoff()
+                    if self._active_since is None:
+                        self._active_since = self._first_record_time()
+                    # 크기 초과, 또는 현재 파일의 첫 기록이 보관 기간을 넘겼으면 회전
+                    if (self.max_bytes > 0 and size + len(line.encode("utf-8")) > self.max_bytes) or (
+                        cutoff is not None and size > 0 and self._active_since < cutoff
+                    ):
+                        self._rotate()
+                        self._prune_expired()
+                if self._active_since is None:
+                    self._active_since = time.time()
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(line)
+        except OSError as e:
+            print(f"  [RouterLog] 기록 실패: {e}", flush=True)
+
+    def load(self, path_filter: Optional[str] = "llm") -> List[Dict[str, Any]]:
+        """로그 읽기 (기본: LLM이 내린 결정만, 같은 입력은 마지막 결정 사용, 보관 기간 내 기록만)."""
+        cutoff = self._cutoff()
+        latest: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for path in self._files():
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if path_filter and record.get("path") != path_filter:
+                        continue
+                    if not record.get("text") or not record.get("category"):
+                        continue
+                    if cutoff is not None:
+                        try:
+                            created = datetime.fromisoformat(record["created_at"]).timestamp()
+                        except (KeyError, TypeError, ValueError):
+                            continue
+                        if created < cutoff:
+                            continue
+                    latest[(record["text"], record.get("profile_mode", ""))] = record
+        return list(latest.values())
+
+
+class IntentClassifier:
+    """
+    임베딩 기반 의도 분류기.
+
+    Usage:
+        clf = IntentClassifier.fit(X, categories, use_rags)
+        clf.save("backend/.cache/router_classifier.joblib")
+        category, use_rag, confidence = IntentClassifier.load(path).predict(qvec)
+    """
+
+    def __init__(
+        self,
+        category_model: LogisticRegression,
+        use_rag_model: Optional[LogisticRegression],
+        use_rag_default: bool,
+        meta: Dict[str, Any],
+    ):
+        self.category_model = category_model
+        self.use_rag_model = use_rag_model
+        self.use_rag_default = use_rag_default
+        self.meta = meta
+
+    @classmethod
+    def fit(
+        cls,
+        X: np.ndarray,
+        categories: List[str],
+        use_rags: List[bool],
+        C: float = 4.0,
+        meta: Optional[Dict[str, Any]] = None,
+    ) -> "IntentClassifier":
+        if len(set(categories)) < 2:
+            raise ValueError("category 클래스가 2개 이상 필요합니다.")
+
+        category_model = LogisticRegression(C=C, max_iter=2000, class_weight="balanced")
+        category_model.fit(X, categories)
+
+        # use_rag 라벨이 한쪽뿐이면 상수로 예측
+        use_rag_model = None
+        use_rag_default = bool(use_rags[0]) if use_rags else True
+        if len(set(use_rags)) > 1:
+            use_rag_model = LogisticRegression(C=C, max_iter=2000, class_weight="balanced")
+            use_rag_model.fit(X, [bool(v) for v in use_rags])
+
+        info = {
+            "n_samples": len(categories),
+            "classes": list(category_model.classes_),
+            "trained_at": datetime.now(timezone.utc).isoformat(),
+            **(meta or {}),
+        }
+        return cls(category_model, use_rag_model, use_rag_default, info)
+
+    def predict(self, qvec: np.ndarray) -> Tuple[str, bool, float]:
+        """(category, use_rag, 확신도). 확신도 = 두 예측 확률 중 작은 값."""
+        category, use_rag, confidence = self.predict_batch(np.asarray(qvec).reshape(1, -1))[0]
+        return category, use_rag, confidence
+
+    def predict_batch(self, X: np.ndarray) -> List[Tuple[str, bool, float]]:
+        cat_proba = self.category_model.predict_proba(X)
+        cat_idx = cat_proba.argmax(axis=1)
+        cat_conf = cat_proba[np.arange(len(X)), cat_idx]
+
+        if self.use_rag_model is not None:
+            rag_proba = self.use_rag_model.predict_proba(X)
+            rag_idx = rag_proba.argmax(axis=1)
+            rag_conf = rag_proba[np.arange(len(X)), rag_idx]
+            rag_values = [bool(self.use_rag_model.classes_[i]) for i in rag_idx]
+        else:
+            rag_conf = np.ones(len(X))
+            rag_values = [self.use_rag_default] * len(X)
+
+        classes = self.category_model.classes_
+        return [
+            (str(classes[c]), rag_values[i], float(min(cat_conf[i], rag_conf[i])))
+            for i, c in enumerate(cat_idx)
+        ]
+
+    def save(self, path: str) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        joblib.dump(
+            {
+                "category_model": self.category_model,
+                "use_rag_model": self.use_rag_model,
+                "use_rag_default": self.use_rag_default,
+                "meta": self.meta,
+            },
+            path,
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "IntentClassifier":
+        payload = joblib.load(path)
+        return cls(
+            payload["category_model"],
+            payload["use_rag_model"],
+            payload["use_rag_default"],
+            payload.get("meta", {}),
+        )
@@ -0,0 +1,91 @@
+# backend/sermon_agent/utils/intent_rules.py
+# -*- coding: utf-8 -*-
+"""
+intent_rules.py
+
+라우터 규칙 기반 사전 분류기 (LLM 호출 전 fast path).
+
+- SMALL_TALK: 인사/감사/테스트처럼 짧고 정형화된 발화
+- SERMON_SEARCH: "설교 찾아줘"류 검색 표현, 또는 본문만 묻는 질의("마태복음 5장 설교 있나요?")
+- 설교 준비/상담/해석 신호가 섞이면 확신도를 낮춰 LLM에 넘긴다
+
+모든 패턴은 모듈 로드 시 컴파일하며, 판정은 1ms 미만이다.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import NamedTuple, Optional
+
+from backend.sermon_agent.utils.bible_books import scan_scripture
+from backend.sermon_agent.utils.scripture_index import is_pure_passage_query
+
+
+class RuleDecision(NamedTuple):
+    category: str
+    use_rag: bool
+    reason: str
+    confidence: float
+    rule: str
+
+
+# 인사/감사/테스트 (문장 전체가 이 표현들로만 이루어질 때)
+_SMALL_TALK_RE = re.compile(
+    r"^(?:"
+    r"안녕(?:하세요|하십니까|하세여)?|반갑습니다|반가워요|처음 뵙겠습니다|"
+    r"좋은\s*(?:아침|하루|저녁)(?:입니다|이에요|예요)?|"
+    r"감사(?:합니다|해요|드립니다)?|고맙습니다|고마워요?|수고(?:하셨습니다|하세요|많으셨어요)?|"
+    r"잘\s*(?:자요|가요|있어요)|또\s*봐요|"
+    r"테스트(?:입니다|중|요)?|test(?:ing)?|hi|hello|hey|"
+    r"네|넵|예|아멘|좋아요|알겠습니다|ㅎㅎ+|ㅋㅋ+"
+    r")(?:[\s!.~?,^ㅎㅋ]|목사님|님)*$",
+    re.IGNORECASE,
+)
+
+# 설교 검색 의도: 설교/말씀 + 검색 동사
+_SEARCH_RE = re.compile(
+    r"(?:설교|말씀|메시지|강해)\S*\s*(?:\S+\s*){0,2}?"
+    r"(?:찾아|검색|있나요|있어요|있습니까|있었나요|있을까요|있는지|알려|보여|추천|목록|리스트)"
+)
+# 검색 의도 보조 표현: "~에 대한 설교", "~하신 적"
+_SEARCH_HINT_RE = re.compile(r"(?:에\s*대한|관한|관련된?)\s*설교|설교(?:하신|한)\s*적")
+
+# LLM 판단이 필요한 신호 (설교 준비/상담/해석)
+_PREP_RE = re.compile(r"설교\s*준비|개요|아웃라인|적용점|나눔\s*질문|예화|초안|만들어|작성|구성")
+_COUNSELING_RE = re.compile(r"상담|고민|힘들|괴로|우울|불안|어떻게\s*해야|조언|위로")
+_QA_RE = re.compile(r"의미|뜻|해석|설명|왜|무엇인가|배경|신학")
+
+_SMALL_TALK_MAX_LEN = 30
+
+
+def classify_by_rules(text: str) -> Optional[RuleDecision]:
+    """
+    규칙으로 분류 가능한 발화면 RuleDecision, 아니면 None.
+
+    confidence는 규칙 종류와 충돌 신호로 정해지며,
+    호출 측이 임계값과 비교해 LLM 호출 여부를 결정한다.
+    """
+    text = (text or "").strip()
+    if not text:
+        return None
+
+    if len(text) <= _SMALL_TALK_MAX_LEN and _SMALL_TALK_RE.match(text):
+        return RuleDecision("SMALL_TALK", False, "인사/감사/테스트 표현", 0.99, "small_talk")
+
+    conflicts = sum(
+        1 for pattern in (_PREP_RE, _COUNSELING_RE, _QA_RE) if pattern.search(text)
+    )
+
+    matches = scan_scripture(text)
+    if matches and is_pure_passage_query(text, matches):
+        refs = ", ".join(m.text for m in matches)
+        return RuleDecision(
+            "SERMON_SEARCH", True, f"본문 검색: {refs}", round(0.95 - 0.3 * conflicts, 2), "passage"
+        )
+
+    if _SEARCH_RE.search(text) or _SEARCH_HINT_RE.search(text):
+        return RuleDecision(
+            "SERMON_SEARCH", True, "설교 검색 표현", round(0.9 - 0.3 * conflicts, 2), "search_phrase"
+        )
+
+    return None
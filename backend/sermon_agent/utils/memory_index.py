@@ -0,0 +1,354 @@
+# backend/sermon_agent/utils/memory_index.py
+# -*- coding: utf-8 -*-
+"""
+memory_index.py
+
+인메모리 NumPy 벡터 인덱스.
+
+- 모든 설교 임베딩을 연속된 float32 행렬 (N x 1024)로 한 번 로드
+- top-k: 행렬-벡터 곱 1회 + argpartition
+- 선택적으로 .npy 파일 + 매니페스트로 저장해 재시작 시 mmap으로 즉시 로드
+- sermons.updated_at 변경 시 바뀐 행만 증분 갱신
+
+수백~수천 개 규모에서는 Postgres 왕복보다 내적 계산이 훨씬 싸다.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from backend.sermon_agent.utils.archive import fetch_archive_version
+
+# 검색 결과 행 형식 (SEARCH_SQL과 동일한 순서):
+#   (id, title, sermon_date, bible_ref, content_summary, video_url, church_name, preacher, similarity)
+IndexRow = Tuple[Any, ...]
+
+LOAD_SQL = """
+    SELECT
+        s.id,
+        s.title,
+        s.sermon_date,
+        s.bible_ref,
+        s.content_summary,
+        s.video_url,
+        s.church_name,
+        s.preacher,
+        s.updated_at,
+        e.embedding
+    FROM sermon_embeddings e
+    JOIN sermons s ON s.id = e.sermon_id
+    {where}
+    ORDER BY s.id
+"""
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return np.ascontiguousarray(matrix / norms, dtype=np.float32)
+
+
+class InMemorySermonIndex:
+    """
+    설교 임베딩 인메모리 인덱스.
+
+    Usage:
+        index = InMemorySermonIndex(cache_path="backend/.cache/sermon_index")
+        index.maybe_refresh(pool)
+        rows = index.search(qvec, top_k=5)
+    """
+
+    def __init__(self, cache_path: Optional[str] = None, refresh_interval: float = 60.0):
+        self.cache_path = cache_path
+        self.refresh_interval = refresh_interval
+
+        self._lock = threading.Lock()
+        # (행렬, 메타데이터) 스냅샷. 갱신 시 통째로 교체해 검색 중 불일치를 막는다.
+        # 메타데이터: (id, title, date, bible_ref, summary, video_url, church, preacher)
+        self._data: Tuple[np.ndarray, List[Tuple[Any, ...]]] = (
+            np.zeros((0, 0), dtype=np.float32),
+            [],
+        )
+        self._positions: Dict[Any, int] = {}
+        self._version: Optional[str] = None
+        self._last_updated_at = None
+        self._last_check = 0.0
+
+    # ── 조회 ────────────────────────────────────────────
+
+    @property
+    def _matrix(self) -> np.ndarray:
+        return self._data[0]
+
+    @property
+    def _meta(self) -> List[Tuple[Any, ...]]:
+        return self._data[1]
+
+    @property
+    def size(self) -> int:
+        return len(self._meta)
+
+    @property
+    def version(self) -> Optional[str]:
+        return self._version
+
+    def search(self, qvec: np.ndarray, top_k: int) -> List[IndexRow]:
+        """코사인 유사도 top-k (행렬-벡터 곱 1회)."""
+        matrix, meta = self._data
+        n = len(meta)
+        if n == 0 or top_k <= 0:
+            return []
+
+        q = np.asarray(qvec, dtype=np.float32)
+        scores = matrix @ q
+
+        k = min(top_k, n)
+        if k < n:
+            idx = np.argpartition(-scores, k - 1)[:k]
+        else:
+            idx = np.arange(n)
+        idx = idx[np.argsort(-scores[idx])]
+
+        return [meta[i] + (float(scores[i]),) for i in idx]
+
+    def search_batch(self, qmat: np.ndarray, top_k: int) -> List[List[IndexRow]]:
+        """여러 쿼리를 행렬 곱 1회로 검색 (Q x N 점수 행렬)."""
+        matrix, meta = self._data
+        n = len(meta)
+        if n == 0 or top_k <= 0:
+            return [[] for _ in range(len(qmat))]
+
+        scores = np.asarray(qmat, dtype=np.float32) @ matrix.T
+
+        k = min(top_k, n)
+        if k < n:
+            idx = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        else:
+            idx = np.tile(np.arange(n), (scores.shape[0], 1))
+
+        results: List[List[IndexRow]] = []
+        for qi in range(scores.shape[0]):
+            row_idx = idx[qi][np.argsort(-scores[qi, idx[qi]])]
+            results.append([meta[i] + (float(scores[qi, i]),) for i in row_idx])
+        return results
+
+    # ── 로드 / 갱신 ─────────────────────────────────────
+
+    def maybe_refresh(self, pool) -> bool:
+        """refresh_interval마다 아카이브 버전을 확인하고 바뀌었으면 갱신."""
+        now = time.monotonic()
+        if self._version is not None and now - self._last_check < self.refresh_interval:
+            return False
+
+        with self._lock:
+            if self._version is not None and now - self._last_check < self.refresh_interval:
+                return False
+            self._last_check = now
+
+            with pool.connection() as conn:
+                version = fetch_archive_version(conn)
+                if version == self._version:
+                    return False
+
+                if self._version is None and self._load_cache(version):
+                    return True
+
+                if self._version is None:
+                    self._full_load(conn)
+                else:
+                    self._incremental_load(conn)
+                self._version = version
+
+            self._save_cache()
+            return True
+
+    def _full_load(self, conn) -> None:
+        start = time.time()
+        with conn.cursor() as cur:
+            cur.execute(LOAD_SQL.format(where=""))
+            rows = cur.fetchall()
+        self._replace(rows)
+        print(
+            f"  [MemoryIndex] {len(rows)}개 임베딩 로드 ({time.time() - start:.2f}s)",
+            flush=True,
+        )
+
+    def _incremental_load(self, conn) -> None:
+        """updated_at 이후 바뀐 설교만 다시 읽어 행렬에 반영."""
+        with conn.cursor() as cur:
+            cur.execute(
+                LOAD_SQL.format(where="WHERE s.updated_at > %(since)s"),
+                {"since": self._last_updated_at},
+            )
+            changed = cur.fetchall()
+            cur.execute("SELECT COUNT(*) FROM sermon_embeddings")
+            total = cur.fetchone()[0]
+
+        known = sum(1 for r in changed if r[0] in self._positions)
+        expected = len(self._meta) + len(changed) - known
+
+        # 삭제가 있었으면 증분으로 맞출 수 없으므로 전체 재로딩
+        if expected != total:
+            self._full_load(conn)
+            return
+
+        matrix = np.array(self._matrix, dtype=np.float32)  # mmap일 수 있으므로 복사
+        meta = list(self._meta)
+        positions = dict(self._positions)
+        appended = []
+
+        for r in changed:
+            vec = np.asarray(r[9], dtype=np.float32)
+            if r[0] in positions:
+                pos = positions[r[0]]
+                matrix[pos] = vec
+                meta[pos] = tuple(r[:8])
+            else:
+                positions[r[0]] = len(meta)
+                meta.append(tuple(r[:8]))
+                appended.append(vec)
+
+        if appended:
+            matrix = np.vstack([matrix, np.stack(appended)])
+
+        last_updated = max((r[8] for r in changed if r[8] is not None), default=None)
+        self._swap(_normalize_rows(matrix), meta, positions, last_updated)
+        print(f"  [MemoryIndex] 증분 갱신: {len(changed)}개 설교", flush=True)
+
+    def _replace(self, rows: List[Tuple[Any, ...]]) -> None:
+        if rows:
+            matrix = _normalize_rows(np.stack([np.asarray(r[9], dtype=np.float32) for r in rows]))
+        else:
+            matrix = np.zeros((0, 0), dtype=np.float32)
+        meta = [tuple(r[:8]) for r in rows]
+        positions = {m[0]: i for i, m in enumerate(meta)}
+        last_updated = max((r[8] for r in rows if r[8] is not None), default=None)
+        self._last_updated_at = None
+        self._swap(matrix, meta, positions, last_updated)
+
+    def _swap(self, matrix, meta, positions, last_updated) -> None:
+        self._data = (matrix, meta)
+        self._positions = positions
+        if last_updated is not None and (
+            self._last_updated_at is None or last_updated > self._last_updated_at
+        ):
+            self._last_updated_at = last_updated
+
+    # ── 디스크 캐시 (mmap) ──────────────────────────────
+
+    # 파일 구성 (여러 워커가 동시에 저장해도 서로의 파일을 덮어쓰지 않도록):
+    #   {cache_path}.manifest.json          현재 세대: {"version", "matrix", "meta", "rows", "last_updated_at"}
+    #   {cache_path}.{pid}-{ns}.npy / .json  세대별 행렬 / 메타데이터 (프로세스마다 고유한 이름)
+    # 매니페스트를 os.replace로 한 번에 바꾸므로, 읽는 쪽은 항상 짝이 맞는 두 파일을 본다.
+
+    def _manifest_file(self) -> str:
+        return f"{self.cache_path}.manifest.json"
+
+    def _read_manifest(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._manifest_file(), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def _load_cache(self, version: str) -> bool:
+        """버전이 같은 캐시 세대가 있으면 mmap으로 로드 (행렬 행 수와 메타데이터 수가 맞아야 함)."""
+        if not self.cache_path:
+            return False
+
+        try:
+            manifest = self._read_manifest()
+            if manifest is None or manifest.get("version") != version:
+                return False
+            directory = os.path.dirname(os.path.abspath(self._manifest_file()))
+            matrix_file = os.path.join(directory, manifest["matrix"])
+            meta_file = os.path.join(directory, manifest["meta"])
+
+            with open(meta_file, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+
+            meta = []
+            for m in payload["meta"]:
+                m = list(m)
+                if m[2]:
+                    m[2] = date.fromisoformat(m[2])
+                meta.append(tuple(m))
+
+            matrix = np.load(matrix_file, mmap_mode="r")
+            if not (matrix.shape[0] == len(meta) == manifest["rows"]):
+                print(
+                    f"  [MemoryIndex] 캐시 불일치 무시: 행렬 {matrix.shape[0]}행, "
+                    f"메타 {len(meta)}개, 매니페스트 {manifest['rows']}개",
+                    flush=True,
+                )
+                return False
+
+            positions = {m[0]: i for i, m in enumerate(meta)}
+            last_updated = manifest.get("last_updated_at")
+            self._swap(
+                matrix,
+                meta,
+                positions,
+                datetime.fromisoformat(last_updated) if last_updated else None,
+            )
+            self._version = version
+            print(f"  [MemoryIndex] mmap 캐시 로드: {len(meta)}개 ({matrix_file})", flush=True)
+            return True
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"  [MemoryIndex] 캐시 로드 실패: {e}", flush=True)
+            return False
+
+    def _save_cache(self) -> None:
+        if not self.cache_path or not self._meta:
+            return
+        manifest_file = self._manifest_file()
+        directory = os.path.dirname(os.path.abspath(manifest_file))
+        base = os.path.basename(self.cache_path)
+        generation = f"{os.getpid()}-{time.time_ns()}"
+        matrix_name = f"{base}.{generation}.npy"
+        meta_name = f"{base}.{generation}.json"
+        matrix, meta_rows = self._data
+        try:
+            os.makedirs(directory, exist_ok=True)
+            previous = self._read_manifest()
+
+            np.save(os.path.join(directory, matrix_name), np.asarray(matrix))
+            meta = [
+                [m[0], m[1], m[2].isoformat() if hasattr(m[2], "isoformat") else m[2], *m[3:]]
+                for m in meta_rows
+            ]
+            with open(os.path.join(directory, meta_name), "w", encoding="utf-8") as f:
+                json.dump({"meta": meta}, f, ensure_ascii=False)
+
+            manifest = {
+                "version": self._version,
+                "matrix": matrix_name,
+                "meta": meta_name,
+                "rows": len(meta_rows),
+                "last_updated_at": (
+                    self._last_updated_at.isoformat() if self._last_updated_at else None
+                ),
+            }
+            tmp_manifest = f"{manifest_file}.{generation}.tmp"
+            with open(tmp_manifest, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, ensure_ascii=False)
+            os.replace(tmp_manifest, manifest_file)
+        except (OSError, ValueError) as e:
+            print(f"  [MemoryIndex] 캐시 저장 실패: {e}", flush=True)
+            return
+
+        # 이전 세대 파일 정리 (이미 mmap한 프로세스는 계속 읽을 수 있음, 실패해도 무시)
+        if previous:
+            for name in (previous.get("matrix"), previous.get("meta")):
+                if name and name not in (matrix_name, meta_name):
+                    try:
+                        os.remove(os.path.join(directory, name))
+                    except OSError:
+                        pass
@@ -0,0 +1,200 @@
+# backend/sermon_agent/utils/metrics.py
+# -*- coding: utf-8 -*-
+"""
+metrics.py
+
+프로세스 내 지표 (Prometheus 텍스트 포맷으로 /metrics에 노출).
+
+- Histogram: 고정 버킷 누적 카운트 + 합계 (라벨별), 버킷 기반 분위수 추정
+- Counter: 라벨별 누적 값
+- Gauge: 조회 시점에 콜백으로 값을 읽는 게이지 (풀 크기 등)
+
+외부 의존성 없이 표준 라이브러리만 사용한다. uvicorn 워커마다 따로 집계된다.
+"""
+
+from __future__ import annotations
+
+import bisect
+import threading
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# 초 단위 기본 버킷 (1ms ~ 30s)
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Optional[Dict[str, str]]) -> LabelKey:
+    return tuple(sorted((labels or {}).items()))
+
+
+def _format_labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    items = list(key) + ([extra] if extra else [])
+    if not items:
+        return ""
+    inner = ",".join(f'{k}="{v}"' for k, v in items)
+    return "{" + inner + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Histogram:
+    """라벨별 고정 버킷 히스토그램."""
+
+    def __init__(self, name: str, help_text: str, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        # 라벨 → (버킷별 카운트(비누적, 마지막은 +Inf), 합계, 개수)
+        self._series: Dict[LabelKey, List] = {}
+
+    def observe(self, value: float, labels: Optional[Dict[str, str]] = None) -> None:
+        key = _label_key(labels)
+        idx = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = [[0] * (len(self.buckets) + 1), 0.0, 0]
+                self._series[key] = series
+            series[0][idx] += 1
+            series[1] += value
+            series[2] += 1
+
+    def quantile(self, q: float, labels: Optional[Dict[str, str]] = None) -> Optional[float]:
+        """버킷 경계 기준 분위수 추정 (관측값이 없으면 None)."""
+        with self._lock:
+            series = self._series.get(_label_key(labels))
+            if not series or series[2] == 0:
+                return None
+            counts, total = list(series[0]), series[2]
+        target = q * total
+        seen = 0
+        for i, count in enumerate(counts):
+            seen += count
+            if seen >= target:
+                return self.buckets[i] if i < len(self.buckets) else float("inf")
+        return float("inf")
+
+    def snapshot(self, labels: Optional[Dict[str, str]] = None) -> Dict[str, float]:
+        """개수/평균/p50/p99 요약 (JSON 통계용)."""
+        with self._lock:
+            series = self._series.get(_label_key(labels))
+            count, total = (series[2], series[1]) if series else (0, 0.0)
+        return {
+            "count": count,
+            "avg": round(total / count, 6) if count else 0.0,
+            "p50": self.quantile(0.5, labels),
+            "p99": self.quantile(0.99, labels),
+        }
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = [(k, list(s[0]), s[1], s[2]) for k, s in self._series.items()]
+        for key, counts, total, count in items:
+            cumulative = 0
+            for bound, c in zip(list(self.buckets) + [float("inf")], counts):
+                cumulative += c
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(key, ('le', _format_value(bound)))} {cumulative}"
+                )
+            lines.append(f"{self.name}_sum{_format_labels(key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(key)} {count}")
+        return lines
+
+
+class Counter:
+    """라벨별 누적 카운터."""
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help = help_text
+        self._lock = threading.Lock()
+        self._values: Dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, labels: Optional[Dict[str, str]] = None) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, labels: Optional[Dict[str, str]] = None) -> float:
+        with self._lock:
+            return self._values.get(_label_key(labels), 0.0)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            lines.append(f"{self.name}{_format_labels(key)} {_format_value(value)}")
+        return lines
+
+
+class Gauge:
+    """조회 시점 콜백 게이지 (콜백은 [(라벨 dict, 값), ...] 반환)."""
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help = help_text
+        self._callbacks: List[Callable[[], List[Tuple[Dict[str, str], float]]]] = []
+
+    def add_callback(self, fn: Callable[[], List[Tuple[Dict[str, str], float]]]) -> None:
+        self._callbacks.append(fn)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} gauge"]
+        for fn in list(self._callbacks):
+            try:
+                samples = fn()
+            except Exception:
+                continue
+            for labels, value in samples:
+                lines.append(f"{self.name}{_format_labels(_label_key(labels))} {_format_value(value)}")
+        return lines
+
+
+# ─────────────────────────────────────────────────────────
+# 레지스트리
+# ─────────────────────────────────────────────────────────
+
+_registry: Dict[str, object] = {}
+_registry_lock = threading.Lock()
+
+
+def _get_or_create(name: str, factory: Callable[[], object]):
+    with _registry_lock:
+        metric = _registry.get(name)
+        if metric is None:
+            metric = factory()
+            _registry[name] = metric
+        return metric
+
+
+def histogram(name: str, help_text: str, buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+    """이름으로 히스토그램 조회/생성 (모듈 재임포트에도 하나만 유지)."""
+    return _get_or_create(name, lambda: Histogram(name, help_text, buckets))
+
+
+def counter(name: str, help_text: str) -> Counter:
+    return _get_or_create(name, lambda: Counter(name, help_text))
+
+
+def gauge(name: str, help_text: str) -> Gauge:
+    return _get_or_create(name, lambda: Gauge(name, help_text))
+
+
+def render_prometheus() -> str:
+    """등록된 모든 지표를 Prometheus 텍스트 포맷(0.0.4)으로."""
+    with _registry_lock:
+        metrics = list(_registry.values())
+    lines: List[str] = []
+    for metric in metrics:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
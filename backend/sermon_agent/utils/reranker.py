@@ -0,0 +1,181 @@
+# backend/sermon_agent/utils/reranker.py
+# -*- coding: utf-8 -*-
+"""
+reranker.py
+
+검색 2단계: 로컬 CPU cross-encoder 재순위 (sentence-transformers CrossEncoder).
+
+- (질문, 후보 설교) 쌍 전체를 한 번의 배치 forward로 점수화
+- 지연 예산(budget_ms):
+    1) 예측: 최근 쌍당 지연(EMA) × 후보 수가 예산을 넘으면 실행하지 않음
+    2) 강제: 전용 스레드에서 실행하고 예산 안에 끝나지 않으면 기다리지 않음
+    3) 이전 재순위가 아직 실행 중이면 (강제 중단 후 남은 계산) 바로 건너뜀
+       (비차단 세마포어로 동시에 한 작업만 제출, 작업이 끝나면 작업 스레드가 해제)
+  어느 경우든 None을 반환하고, 호출 측은 벡터 검색 순서를 그대로 쓴다.
+- 쌍당 지연(EMA)은 작업 스레드에서 실제 계산 시간만 측정 (대기 시간 제외)
+- 모델 로딩 시간은 예산에서 제외 (warm_up으로 미리 로드 가능)
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# 쌍당 지연 EMA 가중치
+_EMA_ALPHA = 0.3
+
+
+class CrossEncoderReranker:
+    """
+    시간 예산이 있는 cross-encoder 재순위기.
+
+    Usage:
+        reranker = CrossEncoderReranker("dragonkue/bge-reranker-v2-m3-ko", max_length=256, budget_ms=500)
+        scores = reranker.score(query, passages)
+        if scores is None:
+            ...  # 벡터 검색 순서 유지
+    """
+
+    def __init__(self, model_name: str, max_length: int = 256, budget_ms: float = 500.0):
+        self.model_name = model_name
+        self.max_length = max_length
+        self.budget_ms = budget_ms
+
+        self._model = None
+        self._load_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="reranker")
+        # 실행 중인 작업 1개 (score()에서 비차단 획득, 작업 종료 시 해제)
+        self._busy = threading.BoundedSemaphore(1)
+        self._ms_per_pair: Optional[float] = None
+
+        self._stats_lock = threading.Lock()
+        self._stats: Dict[str, float] = {
+            "calls": 0,
+            "reranked": 0,
+            "skipped_predicted": 0,
+            "skipped_busy": 0,
+            "timeouts": 0,
+            "errors": 0,
+            "total_ms": 0.0,
+            "max_ms": 0.0,
+        }
+
+    def _get_model(self):
+        if self._model is None:
+            with self._load_lock:
+                if self._model is None:
+                    from sentence_transformers import CrossEncoder
+
+                    start = time.time()
+                    print(f"  [Reranker] {self.model_name} 모델 로딩 중...", flush=True)
+                    self._model = CrossEncoder(
+                        self.model_name, max_length=self.max_length, device="cpu"
+                    )
+                    print(f"  [Reranker] 로딩 완료 ({time.time() - start:.1f}s)", flush=True)
+        return self._model
+
+    def warm_up(self) -> None:
+        """모델 로드 + 더미 쌍 1회 실행 (쌍당 지연 EMA 초기화)."""
+        model = self._get_model()
+        start = time.perf_counter()
+        model.predict([("워밍업", "워밍업 문장")], batch_size=1, show_progress_bar=False)
+        self._ms_per_pair = (time.perf_counter() - start) * 1000
+
+    def _bump(self, name: str, elapsed_ms: Optional[float] = None) -> None:
+        with self._stats_lock:
+            self._stats[name] += 1
+            if elapsed_ms is not None:
+                self._stats["total_ms"] += elapsed_ms
+                self._stats["max_ms"] = max(self._stats["max_ms"], elapsed_ms)
+
+    def _predict(self, pairs: List[Tuple[str, str]]) -> List[float]:
+        model = self._get_model()
+        scores = model.predict(pairs, batch_size=len(pairs), show_progress_bar=False)
+        return [float(s) for s in scores]
+
+    def _run_job(self, pairs: List[Tuple[str, str]]) -> List[float]:
+        """작업 스레드: 계산 시간만 재서 EMA에 반영하고, 끝나면 (시간 초과여도) busy 해제."""
+        try:
+            start = time.perf_counter()
+            scores = self._predict(pairs)
+            self._observe((time.perf_counter() - start) * 1000, len(pairs))
+            return scores
+        finally:
+            self._busy.release()
+
+    def score(self, query: str, passages: Sequence[str]) -> Optional[List[float]]:
+        """
+        (query, passage) 쌍 점수. 예산 초과/실행 중/오류면 None.
+        """
+        if not passages:
+            return []
+        with self._stats_lock:
+            self._stats["calls"] += 1
+
+        if not self._busy.acquire(blocking=False):
+            self._bump("skipped_busy")
+            return None
+
+        submitted = False
+        try:
+            with self._stats_lock:
+                predicted_ms = (self._ms_per_pair or 0.0) * len(passages)
+                if predicted_ms > self.budget_ms:
+                    # 예측만으로 계속 건너뛰면 EMA가 갱신되지 않으므로 조금씩 낮춰 재시도 기회를 준다
+                    self._ms_per_pair *= 1 - _EMA_ALPHA / 3
+            if predicted_ms > self.budget_ms:
+                self._bump("skipped_predicted")
+                return None
+
+            try:
+                self._get_model()  # 로딩 시간은 예산에서 제외
+            except Exception as e:
+                self._bump("errors")
+                print(f"  [Reranker] 모델 로딩 실패: {e}", flush=True)
+                return None
+
+            pairs = [(query, p) for p in passages]
+            start = time.perf_counter()
+            future: Future = self._executor.submit(self._run_job, pairs)
+            submitted = True
+        finally:
+            if not submitted:
+                self._busy.release()
+
+        try:
+            scores = future.result(timeout=self.budget_ms / 1000)
+        except FutureTimeoutError:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self._bump("timeouts", elapsed_ms)
+            # 작업은 계속 실행되고, 끝나면 실제 계산 시간이 EMA에 반영된다
+            # (다음 요청은 그동안 busy, 이후에는 예측 단계에서 건너뜀)
+            print(f"  [Reranker] {elapsed_ms:.0f}ms > 예산 {self.budget_ms:.0f}ms → 벡터 순서 사용", flush=True)
+            return None
+        except Exception as e:
+            self._bump("errors")
+            print(f"  [Reranker] 오류: {e}", flush=True)
+            return None
+
+        self._bump("reranked", (time.perf_counter() - start) * 1000)
+        return scores
+
+    def _observe(self, compute_ms: float, n_pairs: int) -> None:
+        """쌍당 계산 시간 반영 (예산을 넘긴 실행은 평균 대신 최댓값으로 바로 반영)."""
+        per_pair = compute_ms / max(n_pairs, 1)
+        with self._stats_lock:
+            if self._ms_per_pair is None or compute_ms > self.budget_ms:
+                self._ms_per_pair = max(per_pair, self._ms_per_pair or 0.0)
+            else:
+                self._ms_per_pair = (1 - _EMA_ALPHA) * self._ms_per_pair + _EMA_ALPHA * per_pair
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            stats = dict(self._stats)
+        done = stats["reranked"] + stats["timeouts"]
+        stats["avg_ms"] = round(stats["total_ms"] / done, 2) if done else 0.0
+        stats["ms_per_pair"] = round(self._ms_per_pair, 2) if self._ms_per_pair is not None else None
+        stats["model"] = self.model_name
+        stats["budget_ms"] = self.budget_ms
+        return stats
@@ -0,0 +1,201 @@
+# backend/sermon_agent/utils/router_cache.py
+# -*- coding: utf-8 -*-
+"""
+router_cache.py
+
+라우터 LLM 결정 캐시 (정확 일치, TTL + 개수 제한).
+
+같은 질문이 재시도/새로고침/프론트엔드 재전송으로 반복될 때 LLM 호출 없이 결정을 돌려준다.
+
+- 키: 라우터 모델 + 프롬프트 지문 + profile_mode + 정규화 텍스트(NFC, 공백 정리, 소문자)의 SHA-256
+- 값: RouterDecisionSchema 필드 dict (JSON 문자열로 저장)
+- 백엔드 (get/set/clear/count, Redis 클라이언트와 같은 모양):
+    - MemoryRouterCacheBackend: 프로세스 내 TTL LRU (기본)
+    - SQLiteRouterCacheBackend: 여러 uvicorn 워커가 공유하는 WAL SQLite 파일
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from cachetools import TTLCache
+
+from backend.sermon_agent.utils.embedding_cache import normalize_text
+
+
+def make_router_cache_key(namespace: str, profile_mode: str, text: str) -> str:
+    """namespace(모델/프롬프트 지문) + 모드 + 정규화 텍스트 기반 키."""
+    raw = f"{namespace}\x00{profile_mode}\x00{normalize_text(text).lower()}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+# ─────────────────────────────────────────────────────────
+# 백엔드
+# ─────────────────────────────────────────────────────────
+
+
+class MemoryRouterCacheBackend:
+    """프로세스 내 TTL LRU (워커마다 따로 유지)."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self._cache: TTLCache = TTLCache(maxsize=max_entries, ttl=ttl_seconds)
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            return self._cache.get(key)
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._cache[key] = value
+
+    def count(self) -> int:
+        with self._lock:
+            self._cache.expire()
+            return len(self._cache)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+class SQLiteRouterCacheBackend:
+    """
+    워커 간 공유 SQLite 캐시 (WAL).
+
+    만료 시각을 행에 저장해 조회 시 걸러내고, 일정 횟수 저장마다
+    만료 항목 삭제 + 개수 초과분(오래된 순) 정리.
+    """
+
+    _PRUNE_EVERY = 256
+
+    def __init__(self, path: str, max_entries: int, ttl_seconds: float):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._conn = sqlite3.connect(path, timeout=5.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS router_decisions (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM router_decisions WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO router_decisions (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, time.time() + self.ttl_seconds),
+            )
+            self._writes += 1
+            if self._writes % self._PRUNE_EVERY == 0:
+                self._prune()
+            self._conn.commit()
+
+    def _prune(self) -> None:
+        self._conn.execute("DELETE FROM router_decisions WHERE expires_at <= ?", (time.time(),))
+        self._conn.execute(
+            """
+            DELETE FROM router_decisions WHERE key IN (
+                SELECT key FROM router_decisions ORDER BY expires_at DESC LIMIT -1 OFFSET ?
+            )
+            """,
+            (self.max_entries,),
+        )
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM router_decisions WHERE expires_at > ?", (time.time(),)
+            ).fetchone()[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM router_decisions")
+            self._conn.commit()
+
+
+# ─────────────────────────────────────────────────────────
+# 결정 캐시
+# ─────────────────────────────────────────────────────────
+
+
+class RouterDecisionCache:
+    """
+    (텍스트, profile_mode) → 라우터 결정 dict.
+
+    Usage:
+        cache = RouterDecisionCache(MemoryRouterCacheBackend(4096, 3600), namespace="gpt-4o-mini:ab12")
+        decision = cache.get(text, profile_mode)
+        if decision is None:
+            decision = call_llm(...).model_dump()
+            cache.put(text, profile_mode, decision)
+
+    백엔드 오류는 miss로 처리한다 (캐시 때문에 라우팅이 실패하지 않도록).
+    """
+
+    def __init__(self, backend, namespace: str = ""):
+        self.backend = backend
+        self.namespace = namespace
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "errors": 0}
+
+    def _bump(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def get(self, text: str, profile_mode: str) -> Optional[Dict[str, Any]]:
+        key = make_router_cache_key(self.namespace, profile_mode, text)
+        try:
+            raw = self.backend.get(key)
+        except Exception as e:
+            self._bump("errors")
+            print(f"  [RouterCache] 조회 오류: {e}", flush=True)
+            return None
+
+        if raw is None:
+            self._bump("misses")
+            return None
+        self._bump("hits")
+        return json.loads(raw)
+
+    def put(self, text: str, profile_mode: str, decision: Dict[str, Any]) -> None:
+        key = make_router_cache_key(self.namespace, profile_mode, text)
+        try:
+            self.backend.set(key, json.dumps(decision, ensure_ascii=False))
+            self._bump("stores")
+        except Exception as e:
+            self._bump("errors")
+            print(f"  [RouterCache] 저장 오류: {e}", flush=True)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        stats["backend"] = type(self.backend).__name__
+        return stats
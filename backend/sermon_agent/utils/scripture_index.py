@@ -0,0 +1,179 @@
+# backend/sermon_agent/utils/scripture_index.py
+# -*- coding: utf-8 -*-
+"""
+scripture_index.py
+
+설교 본문(sermons.bible_ref) 구간 인덱스.
+
+- bible_ref("마 25 : 31 ~ 46")를 (책 ID, 시작 위치, 끝 위치)로 정규화 (위치 = 장 * 1000 + 절)
+- 책별로 시작 위치 정렬 배열을 두고, 질의 구간과 겹치는 설교를 bisect로 찾는다
+- "마태복음 5장으로 설교한 적 있나요?" 같은 순수 본문 질의는 임베딩 없이 바로 응답
+"""
+
+from __future__ import annotations
+
+import bisect
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.sermon_agent.utils.archive import SERMON_META_SQL, fetch_archive_version
+from backend.sermon_agent.utils.bible_books import ScriptureMatch, passage_bounds, scan_scripture
+
+# 검색 결과 행 형식 (SEARCH_SQL과 동일한 순서, 마지막 값은 구간 일치 점수 0~1):
+#   (id, title, sermon_date, bible_ref, content_summary, video_url, church_name, preacher, score)
+IndexRow = Tuple[Any, ...]
+
+# 본문 참조를 빼고 남았을 때 "본문만 묻는 질의"로 볼 단어들
+_FILLER_PREFIXES = (
+    "설교", "말씀", "본문", "구절", "관련", "관한", "대한", "대해", "있", "없",
+    "알려", "찾아", "보여", "했", "하신", "하셨", "해주", "혹시", "어떤", "무슨", "목사",
+)
+_FILLER_WORDS = {"적", "것", "거", "좀", "한", "들", "중", "뭐", "전체"}
+_PARTICLE_RE = re.compile(r"^(?:으로|로|을|를|은|는|이|가|의|에서|에|과|와|도|만|부터|까지)+")
+_WORD_RE = re.compile(r"[가-힣A-Za-z0-9]+")
+
+
+def is_pure_passage_query(text: str, matches: Optional[List[ScriptureMatch]] = None) -> bool:
+    """구절 참조와 조사/요청 표현만으로 이루어진 질의인지 판별."""
+    if matches is None:
+        matches = scan_scripture(text)
+    if not matches:
+        return False
+
+    rest = []
+    last = 0
+    for m in matches:
+        rest.append(text[last:m.span[0]])
+        last = m.span[1]
+    rest.append(text[last:])
+
+    for word in _WORD_RE.findall(" ".join(rest)):
+        word = _PARTICLE_RE.sub("", word)
+        if not word or word.isdigit() or word in _FILLER_WORDS or word.startswith(_FILLER_PREFIXES):
+            continue
+        return False
+    return True
+
+
+class ScriptureIndex:
+    """
+    설교 본문 구간 인덱스.
+
+    Usage:
+        index = ScriptureIndex()
+        index.maybe_refresh(pool)
+        rows = index.search("마태복음 5장", top_k=5)
+    """
+
+    def __init__(self, refresh_interval: float = 60.0):
+        self.refresh_interval = refresh_interval
+
+        self._lock = threading.Lock()
+        # 책 ID → (시작 위치 정렬 배열, [(시작, 끝, 메타데이터)])
+        self._books: Dict[int, Tuple[List[int], List[Tuple[int, int, Tuple[Any, ...]]]]] = {}
+        self._size = 0
+        self._skipped = 0
+        self._version: Optional[str] = None
+        self._last_check = 0.0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def version(self) -> Optional[str]:
+        return self._version
+
+    # ── 조회 ────────────────────────────────────────────
+
+    def lookup(self, book_id: int, lo: int, hi: int) -> List[IndexRow]:
+        """
+        [lo, hi] 구간과 겹치는 설교.
+
+        점수: 한쪽이 다른 쪽을 포함하면 1.0, 아니면 겹친 길이 / 설교 본문 길이.
+        """
+        entry = self._books.get(book_id)
+        if entry is None:
+            return []
+        starts, intervals = entry
+
+        rows = []
+        for start, end, meta in intervals[:bisect.bisect_right(starts, hi)]:
+            if end < lo:
+                continue
+            if (lo <= start and end <= hi) or (start <= lo and hi <= end):
+                score = 1.0
+            else:
+                score = (min(end, hi) - max(start, lo) + 1) / (end - start + 1)
+            rows.append(meta + (round(score, 4),))
+        return rows
+
+    def search(self, text: str, top_k: int, matches: Optional[List[ScriptureMatch]] = None) -> List[IndexRow]:
+        """질의의 모든 구절 참조와 겹치는 설교 (점수 → 본문 순서)."""
+        if matches is None:
+            matches = scan_scripture(text)
+
+        best: Dict[Any, IndexRow] = {}
+        for m in matches:
+            for row in self.lookup(*passage_bounds(m)):
+                prev = best.get(row[0])
+                if prev is None or row[-1] > prev[-1]:
+                    best[row[0]] = row
+
+        ranked = sorted(best.values(), key=lambda r: -r[-1])
+        return ranked[:top_k]
+
+    # ── 로드 / 갱신 ─────────────────────────────────────
+
+    def maybe_refresh(self, pool) -> bool:
+        """refresh_interval마다 아카이브 버전을 확인하고 바뀌었으면 재구축."""
+        now = time.monotonic()
+        if self._version is not None and now - self._last_check < self.refresh_interval:
+            return False
+
+        with self._lock:
+            if self._version is not None and now - self._last_check < self.refresh_interval:
+                return False
+            self._last_check = now
+
+            with pool.connection() as conn:
+                version = fetch_archive_version(conn)
+                if version == self._version:
+                    return False
+                with conn.cursor() as cur:
+                    cur.execute(SERMON_META_SQL)
+                    rows = cur.fetchall()
+
+            self.build(rows)
+            self._version = version
+            return True
+
+    def build(self, rows: List[Tuple[Any, ...]]) -> None:
+        """(id, title, date, bible_ref, summary, video_url, church, preacher) 행으로 인덱스 구축."""
+        collected: Dict[int, List[Tuple[int, int, Tuple[Any, ...]]]] = {}
+        size = skipped = 0
+        for r in rows:
+            meta = tuple(r[:8])
+            matches = scan_scripture(meta[3] or "")
+            if not matches:
+                skipped += 1
+                continue
+            for m in matches:
+                book_id, lo, hi = passage_bounds(m)
+                collected.setdefault(book_id, []).append((lo, hi, meta))
+                size += 1
+
+        books = {}
+        for book_id, intervals in collected.items():
+            intervals.sort(key=lambda x: x[0])
+            books[book_id] = ([x[0] for x in intervals], intervals)
+
+        self._books = books
+        self._size = size
+        self._skipped = skipped
+        print(
+            f"  [ScriptureIndex] {size}개 본문 구간 ({len(books)}권, 파싱 실패 {skipped}개)",
+            flush=True,
+        )
@@ -4,10 +4,34 @@
 scripture_parser.py
 
 성경 구절 파싱 유틸리티.
+
+책 이름 정규화와 스캔은 bible_books.scan_scripture (미리 컴파일된 정규식 1회 스캔)를 사용한다.
 """
 
-import re
-from typing import List, Optional, Dict, Any
+from typing import List, Dict, Any
+
+# 크롤러(run.py)는 backend/를 sys.path에 넣고 sermon_agent.로 import한다
+try:
+    from backend.sermon_agent.utils.bible_books import ScriptureMatch, scan_scripture
+except ImportError:
+    from sermon_agent.utils.bible_books import ScriptureMatch, scan_scripture
+
+
+def _match_to_dict(match: ScriptureMatch) -> Dict[str, Any]:
+    verse_end = match.verse_end
+    if verse_end is None and match.chapter_end == match.chapter_start:
+        verse_end = match.verse_start
+
+    return {
+        "book": match.book.name,
+        "book_id": match.book.id,
+        "chapter": match.chapter_start,
+        "verse_start": match.verse_start,
+        "verse_end": verse_end,
+        "chapter_end": match.chapter_end,
+        "original": match.text,
+        "span": match.span,
+    }
 
 
 def parse_scripture_reference(text: str) -> List[Dict[str, Any]]:
@@ -19,62 +43,12 @@ def parse_scripture_reference(text: str) -> List[Dict[str, Any]]:
         - "요한복음 3:16"
         - "고린도전서 13장 1-3절"
         - "시편 23편"
+        - "마 25 : 31 ~ 46" (아카이브 약어 형식)
 
     Returns:
-        List[Dict]: 파싱된 성경 구절 정보
+        List[Dict]: 파싱된 성경 구절 정보 (book은 정규화된 책 이름, 등장 순서)
     """
-    references = []
-
-    # 패턴 1: "책명 장장 절절" 형식
-    pattern1 = r'([가-힣]+(?:복음|서)?)\s*(\d+)장\s*(\d+)(?:-(\d+))?절?'
-    matches1 = re.finditer(pattern1, text)
-    for match in matches1:
-        book = match.group(1)
-        chapter = int(match.group(2))
-        verse_start = int(match.group(3))
-        verse_end = int(match.group(4)) if match.group(4) else verse_start
-        
-        references.append({
-            "book": book,
-            "chapter": chapter,
-            "verse_start": verse_start,
-            "verse_end": verse_end,
-            "original": match.group(0),
-        })
-
-    # 패턴 2: "책명 장:절" 형식
-    pattern2 = r'([가-힣]+(?:복음|서)?)\s*(\d+):(\d+)(?:-(\d+))?'
-    matches2 = re.finditer(pattern2, text)
-    for match in matches2:
-        book = match.group(1)
-        chapter = int(match.group(2))
-        verse_start = int(match.group(3))
-        verse_end = int(match.group(4)) if match.group(4) else verse_start
-        
-        references.append({
-            "book": book,
-            "chapter": chapter,
-            "verse_start": verse_start,
-            "verse_end": verse_end,
-            "original": match.group(0),
-        })
-
-    # 패턴 3: "시편 23편" 같은 형식
-    pattern3 = r'(시편)\s*(\d+)편'
-    matches3 = re.finditer(pattern3, text)
-    for match in matches3:
-        book = match.group(1)
-        chapter = int(match.group(2))
-        
-        references.append({
-            "book": book,
-            "chapter": chapter,
-            "verse_start": None,
-            "verse_end": None,
-            "original": match.group(0),
-        })
-
-    return references
+    return [_match_to_dict(m) for m in scan_scripture(text)]
 
 
 def format_scripture_reference(ref: Dict[str, Any]) -> str:
@@ -89,14 +63,29 @@ def format_scripture_reference(ref: Dict[str, Any]) -> str:
     """
     book = ref.get("book", "")
     chapter = ref.get("chapter")
+    chapter_end = ref.get("chapter_end") or chapter
     verse_start = ref.get("verse_start")
     verse_end = ref.get("verse_end")
+    unit = "편" if book == "시편" else "장"
 
     if verse_start is None:
-        return f"{book} {chapter}장"
-    
+        if chapter_end != chapter:
+            return f"{book} {chapter}-{chapter_end}{unit}"
+        return f"{book} {chapter}{unit}"
+
+    if chapter_end != chapter:
+        end = f"{chapter_end}{unit} {verse_end}절" if verse_end is not None else f"{chapter_end}{unit}"
+        return f"{book} {chapter}{unit} {verse_start}절-{end}"
+
     if verse_start == verse_end:
-        return f"{book} {chapter}장 {verse_start}절"
+        return f"{book} {chapter}{unit} {verse_start}절"
     else:
-        return f"{book} {chapter}장 {verse_start}-{verse_end}절"
+        return f"{book} {chapter}{unit} {verse_start}-{verse_end}절"
+
 
+def extract_scripture_references(text: str) -> List[str]:
+    """텍스트의 성경 구절을 표준 형식 문자열로 추출 (등장 순서, 중복 제거)."""
+    seen: Dict[str, None] = {}
+    for m in scan_scripture(text):
+        seen.setdefault(format_scripture_reference(_match_to_dict(m)), None)
+    return list(seen)
@@ -0,0 +1,421 @@
+# backend/sermon_agent/utils/session_store.py
+# -*- coding: utf-8 -*-
+"""
+session_store.py
+
+멀티턴 대화 세션(ConversationSession) 저장소.
+
+요청마다 load → (그래프 실행) → 턴 기록 → save 순서로 사용한다.
+세션은 JSON으로 직렬화해 저장하므로 같은 세션을 동시에 처리하는 요청끼리 객체를 공유하지 않는다
+(마지막 save가 이긴다).
+
+- 메모리 절약: last_rag_snippets는 요약을 SESSION_SNIPPET_CHARS로 잘라 보관 (설교 본문 전체 X)
+- 백엔드 (get/set/delete/count/clear, router_cache와 같은 모양):
+    - MemorySessionBackend: 프로세스 내 LRU + 유휴 TTL + 총 바이트 상한 (기본)
+    - SQLiteSessionBackend: 재시작 후에도 유지, 여러 uvicorn 워커가 공유하는 WAL SQLite 파일
+- 지표 (/metrics): session_store_requests_total{result}, session_store_evictions_total{reason},
+                  session_store{state="entries"|"bytes"}
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.sermon_agent.utils import metrics
+
+_BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+# 저장소: "memory" (기본) | "sqlite"
+SESSION_STORE_BACKEND = os.getenv("SESSION_STORE_BACKEND", "memory").lower()
+SESSION_STORE_PATH = os.getenv(
+    "SESSION_STORE_PATH",
+    os.path.join(_BACKEND_DIR, ".cache", "sessions.sqlite3"),
+)
+SESSION_MAX_ENTRIES = int(os.getenv("SESSION_MAX_ENTRIES", "1000"))
+# 메모리 백엔드의 직렬화 크기 합 상한 (바이트)
+SESSION_MAX_BYTES = int(os.getenv("SESSION_MAX_BYTES", str(64 * 1024 * 1024)))
+# 마지막 사용 후 이 시간이 지나면 만료 (초)
+SESSION_IDLE_TTL_SECONDS = float(os.getenv("SESSION_IDLE_TTL_SECONDS", "7200"))
+# 세션에 보관하는 검색 결과 요약 길이 (자)
+SESSION_SNIPPET_CHARS = int(os.getenv("SESSION_SNIPPET_CHARS", "500"))
+# 보관할 대화 턴 수
+SESSION_MAX_HISTORY = int(os.getenv("SESSION_MAX_HISTORY", "10"))
+
+_REQUESTS = metrics.counter("session_store_requests_total", "Session loads by result (hit/miss/error)")
+_EVICTIONS = metrics.counter("session_store_evictions_total", "Sessions evicted by reason")
+_GAUGE = metrics.gauge("session_store", "Session store size (entries / bytes)")
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+# ─────────────────────────────────────────────────────────
+# 세션
+# ─────────────────────────────────────────────────────────
+
+
+class ConversationSession:
+    """멀티턴 대화 세션 관리."""
+
+    def __init__(self, session_id: str = "default", max_history: int = SESSION_MAX_HISTORY):
+        self.session_id = session_id
+        self.max_history = max_history
+        self.history: List[Dict[str, str]] = []  # [{"role": "user/assistant", "content": "..."}]
+        self.turn_count = 0
+        self.created_at = _now_iso()
+        self.last_rag_snippets: List[Dict] = []  # 최근 검색 결과 저장 (요약은 잘라서)
+
+    def add_user_message(self, content: str):
+        """사용자 메시지 추가."""
+        self.history.append({"role": "user", "content": content})
+        self.turn_count += 1
+        self._trim_history()
+
+    def add_assistant_message(self, content: str):
+        """어시스턴트 응답 추가."""
+        self.history.append({"role": "assistant", "content": content})
+        self._trim_history()
+
+    def set_rag_snippets(self, snippets: List[Dict]):
+        """후속 질문 참조용 검색 결과 저장 (요약은 SESSION_SNIPPET_CHARS로 자름)."""
+        compact = []
+        for snippet in snippets:
+            item = dict(snippet)
+            summary = item.get("summary")
+            if isinstance(summary, str) and len(summary) > SESSION_SNIPPET_CHARS:
+                item["summary"] = summary[:SESSION_SNIPPET_CHARS]
+            compact.append(item)
+        self.last_rag_snippets = compact
+
+    def _trim_history(self):
+        """히스토리 크기 제한."""
+        if len(self.history) > self.max_history * 2:
+            self.history = self.history[-self.max_history * 2:]
+
+    def get_context_summary(self) -> str:
+        """대화 컨텍스트 요약 생성."""
+        if not self.history:
+            return ""
+
+        lines = ["[이전 대화 내용]"]
+        for msg in self.history[-6:]:  # 최근 3턴만
+            role = "사용자" if msg["role"] == "user" else "AI"
+            content = msg["content"][:200] + "..." if len(msg["content"]) > 200 else msg["content"]
+            lines.append(f"{role}: {content}")
+        lines.append("")
+
+        return "\n".join(lines)
+
+    def clear(self):
+        """대화 내역 초기화."""
+        self.history = []
+        self.turn_count = 0
+        self.last_rag_snippets = []
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "session_id": self.session_id,
+                "max_history": self.max_history,
+                "history": self.history,
+                "turn_count": self.turn_count,
+                "created_at": self.created_at,
+                "last_rag_snippets": self.last_rag_snippets,
+            },
+            ensure_ascii=False,
+        )
+
+    @classmethod
+    def from_json(cls, raw: str) -> "ConversationSession":
+        data = json.loads(raw)
+        session = cls(data["session_id"], data.get("max_history", SESSION_MAX_HISTORY))
+        session.history = data.get("history", [])
+        session.turn_count = data.get("turn_count", 0)
+        session.created_at = data.get("created_at", session.created_at)
+        session.last_rag_snippets = data.get("last_rag_snippets", [])
+        return session
+
+
+# ─────────────────────────────────────────────────────────
+# 백엔드
+# ─────────────────────────────────────────────────────────
+
+
+class MemorySessionBackend:
+    """
+    프로세스 내 LRU (워커마다 따로 유지).
+
+    개수 상한, 직렬화 크기 합 상한, 유휴 TTL 중 하나라도 넘으면 오래 안 쓴 세션부터 제거한다.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, idle_ttl_seconds: float):
+        self.max_entries = max(max_entries, 1)
+        self.max_bytes = max_bytes
+        self.idle_ttl_seconds = idle_ttl_seconds
+        # key → (값, 마지막 사용 시각, UTF-8 바이트 수), 앞쪽이 오래된 항목
+        self._items: "OrderedDict[str, Tuple[str, float, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def _remove(self, key: str, reason: Optional[str] = None) -> None:
+        _, _, size = self._items.pop(key)
+        self._bytes -= size
+        if reason:
+            _EVICTIONS.inc(labels={"reason": reason})
+
+    def _expire(self, now: float) -> None:
+        if self.idle_ttl_seconds <= 0:
+            return
+        cutoff = now - self.idle_ttl_seconds
+        while self._items:
+            key, (_, used_at, _) = next(iter(self._items.items()))
+            if used_at > cutoff:
+                break
+            self._remove(key, "idle")
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            self._expire(now)
+            item = self._items.get(key)
+            if item is None:
+                return None
+            self._items[key] = (item[0], now, item[2])
+            self._items.move_to_end(key)
+            return item[0]
+
+    def set(self, key: str, value: str) -> None:
+        now = time.time()
+        with self._lock:
+            if key in self._items:
+                self._remove(key)
+            size = len(value.encode("utf-8"))
+            self._items[key] = (value, now, size)
+            self._bytes += size
+            self._expire(now)
+            while len(self._items) > self.max_entries:
+                self._remove(next(iter(self._items)), "lru")
+            while self.max_bytes > 0 and self._bytes > self.max_bytes and len(self._items) > 1:
+                self._remove(next(iter(self._items)), "bytes")
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if key in self._items:
+                self._remove(key)
+
+    def count(self) -> int:
+        with self._lock:
+            self._expire(time.time())
+            return len(self._items)
+
+    def size_bytes(self) -> int:
+        with self._lock:
+            return self._bytes
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self._bytes = 0
+
+
+class SQLiteSessionBackend:
+    """
+    워커 간 공유 + 재시작 후 유지되는 SQLite 세션 저장소 (WAL).
+
+    마지막 사용 시각을 행에 저장해 조회 시 유휴 만료를 걸러내고, 일정 횟수 저장마다
+    만료 항목 삭제 + 개수 초과분(오래 안 쓴 순) 정리.
+    """
+
+    _PRUNE_EVERY = 64
+
+    def __init__(self, path: str, max_entries: int, idle_ttl_seconds: float):
+        self.path = path
+        self.max_entries = max(max_entries, 1)
+        self.idle_ttl_seconds = idle_ttl_seconds
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._conn = sqlite3.connect(path, timeout=5.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS sessions (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                used_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS sessions_used_at ON sessions (used_at)")
+        self._conn.commit()
+
+    def _cutoff(self) -> float:
+        return time.time() - self.idle_ttl_seconds if self.idle_ttl_seconds > 0 else float("-inf")
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM sessions WHERE key = ? AND used_at > ?",
+                (key, self._cutoff()),
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sessions (key, value, used_at) VALUES (?, ?, ?)",
+                (key, value, time.time()),
+            )
+            self._writes += 1
+            if self._writes % self._PRUNE_EVERY == 0:
+                self._prune()
+            self._conn.commit()
+
+    def _prune(self) -> None:
+        expired = self._conn.execute("DELETE FROM sessions WHERE used_at <= ?", (self._cutoff(),)).rowcount
+        evicted = self._conn.execute(
+            """
+            DELETE FROM sessions WHERE key IN (
+                SELECT key FROM sessions ORDER BY used_at DESC LIMIT -1 OFFSET ?
+            )
+            """,
+            (self.max_entries,),
+        ).rowcount
+        if expired > 0:
+            _EVICTIONS.inc(expired, {"reason": "idle"})
+        if evicted > 0:
+            _EVICTIONS.inc(evicted, {"reason": "lru"})
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM sessions WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM sessions WHERE used_at > ?", (self._cutoff(),)
+            ).fetchone()[0]
+
+    def size_bytes(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COALESCE(SUM(LENGTH(CAST(value AS BLOB))), 0) FROM sessions WHERE used_at > ?",
+                (self._cutoff(),),
+            ).fetchone()[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM sessions")
+            self._conn.commit()
+
+
+# ─────────────────────────────────────────────────────────
+# 세션 저장소
+# ─────────────────────────────────────────────────────────
+
+
+class SessionStore:
+    """
+    session_id → ConversationSession.
+
+    Usage:
+        store = SessionStore(MemorySessionBackend(1000, 64 << 20, 7200))
+        session = store.load("user-1:abc")
+        session.add_user_message(question)
+        ...
+        store.save(session)
+
+    백엔드 오류는 빈 세션으로 처리한다 (세션 저장소 때문에 답변이 실패하지 않도록).
+    """
+
+    def __init__(self, backend, max_history: int = SESSION_MAX_HISTORY):
+        self.backend = backend
+        self.max_history = max_history
+
+    def load(self, session_id: str) -> ConversationSession:
+        """저장된 세션 (없거나 만료/오류면 새 세션)."""
+        try:
+            raw = self.backend.get(session_id)
+        except Exception as e:
+            _REQUESTS.inc(labels={"result": "error"})
+            print(f"  [SessionStore] 조회 오류: {e}", flush=True)
+            raw = None
+        else:
+            _REQUESTS.inc(labels={"result": "hit" if raw is not None else "miss"})
+
+        if raw is None:
+            return ConversationSession(session_id, self.max_history)
+        return ConversationSession.from_json(raw)
+
+    def save(self, session: ConversationSession) -> None:
+        try:
+            self.backend.set(session.session_id, session.to_json())
+        except Exception as e:
+            print(f"  [SessionStore] 저장 오류: {e}", flush=True)
+
+    def delete(self, session_id: str) -> None:
+        try:
+            self.backend.delete(session_id)
+        except Exception as e:
+            print(f"  [SessionStore] 삭제 오류: {e}", flush=True)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": type(self.backend).__name__,
+            "entries": self.backend.count(),
+            "bytes": self.backend.size_bytes(),
+            "hits": int(_REQUESTS.value({"result": "hit"})),
+            "misses": int(_REQUESTS.value({"result": "miss"})),
+            "evictions": {
+                reason: int(_EVICTIONS.value({"reason": reason})) for reason in ("idle", "lru", "bytes")
+            },
+        }
+
+
+_store: Optional[SessionStore] = None
+_store_lock = threading.Lock()
+
+
+def get_session_store() -> SessionStore:
+    """설정(SESSION_STORE_BACKEND)에 따른 세션 저장소 (싱글톤)."""
+    global _store
+    if _store is not None:
+        return _store
+
+    with _store_lock:
+        if _store is not None:
+            return _store
+
+        backend = None
+        if SESSION_STORE_BACKEND == "sqlite":
+            try:
+                backend = SQLiteSessionBackend(
+                    SESSION_STORE_PATH, SESSION_MAX_ENTRIES, SESSION_IDLE_TTL_SECONDS
+                )
+            except Exception as e:
+                print(f"  [SessionStore] SQLite 저장소 비활성화 ({e}) -> 메모리 저장소 사용", flush=True)
+        if backend is None:
+            backend = MemorySessionBackend(
+                SESSION_MAX_ENTRIES, SESSION_MAX_BYTES, SESSION_IDLE_TTL_SECONDS
+            )
+
+        store = SessionStore(backend)
+        _GAUGE.add_callback(
+            lambda: [
+                ({"state": "entries"}, store.backend.count()),
+                ({"state": "bytes"}, store.backend.size_bytes()),
+            ]
+        )
+        _store = store
+        return _store
@@ -0,0 +1,271 @@
+# backend/sermon_agent/warmup.py
+# -*- coding: utf-8 -*-
+"""
+warmup.py
+
+서버 시작 시 지연 초기화 대상들을 미리 준비한다 (FastAPI lifespan에서 호출).
+
+구성 요소 (서로 독립인 그룹은 병렬 실행):
+  - 검색 DB: 연결 풀 열기 → SELECT 1 → BM25/본문 구간/(numpy) 벡터 인덱스 구축
+  - 인코더: bge-m3-ko 로드 → 더미 문장 인코딩 1회 (캐시 우회) → (설정 시) reranker 로드
+  - 라우터: 로컬 분류기, 결정 캐시
+  - OpenAI: router/answer 클라이언트 생성 + models.retrieve 1회로 TLS 연결을 풀에 확보,
+            답변 토큰 카운터(tiktoken) 로드
+
+구성 요소별 소요 시간/오류를 기록한다. 상태:
+  - ready: 모두 성공
+  - degraded: 필수 구성 요소(db_pool, indexes, encoder, router)는 성공, 부가 요소
+              (reranker, token_counter, openai) 일부 실패 → /ready는 200 (각 getter가 요청 시 재시도)
+  - failed: 필수 구성 요소 실패 → /ready 503
+실패한 구성 요소는 백그라운드 스레드에서 지수 백오프(WARMUP_RETRY_INITIAL_SECONDS부터
+WARMUP_RETRY_MAX_SECONDS까지)로 다시 실행하므로, 일시적 오류 뒤에도 ready로 돌아온다.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from backend.sermon_agent.nodes import answer_creator, query_router, sermon_retriever as retriever
+
+# 워밍업 인코딩 문장 (임베딩 캐시를 거치지 않고 모델을 직접 호출)
+_WARMUP_TEXT = "설교 아카이브 검색 준비"
+
+# 실패하면 not ready인 구성 요소 (나머지는 실패해도 degraded)
+CRITICAL_COMPONENTS = ("db_pool", "indexes", "encoder", "router")
+
+# 실패한 구성 요소 재시도 간격 (초, 실패할 때마다 2배)
+WARMUP_RETRY_INITIAL_SECONDS = float(os.getenv("WARMUP_RETRY_INITIAL_SECONDS", "5"))
+WARMUP_RETRY_MAX_SECONDS = float(os.getenv("WARMUP_RETRY_MAX_SECONDS", "300"))
+
+_lock = threading.Lock()
+_retry_stop = threading.Event()
+_retry_thread: Optional[threading.Thread] = None
+_state: Dict[str, Any] = {
+    "status": "pending",  # pending | running | ready | degraded | failed | skipped
+    "started_at": None,
+    "finished_at": None,
+    "total_seconds": None,
+    "components": {},
+    "retry": None,  # {"attempt", "next_in_seconds"} (재시도 중일 때)
+}
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _record(name: str, status: str, seconds: float, error: Optional[str] = None) -> None:
+    entry: Dict[str, Any] = {
+        "status": status,
+        "seconds": round(seconds, 3),
+        "critical": name in CRITICAL_COMPONENTS,
+    }
+    if error:
+        entry["error"] = error
+    with _lock:
+        previous = _state["components"].get(name)
+        entry["attempts"] = (previous or {}).get("attempts", 0) + (status != "skipped")
+        _state["components"][name] = entry
+
+
+def _component_ok(name: str) -> bool:
+    with _lock:
+        return (_state["components"].get(name) or {}).get("status") == "ok"
+
+
+def _run_steps(steps: List[Tuple[str, Callable[[], Any]]]) -> None:
+    """한 그룹의 단계를 순서대로 실행 (이미 성공한 단계는 건너뜀, 앞 단계가 실패하면 나머지는 skipped)."""
+    failed = None
+    for name, fn in steps:
+        if _component_ok(name):
+            continue
+        if failed:
+            _record(name, "skipped", 0.0, f"{failed} 실패")
+            continue
+        start = time.perf_counter()
+        try:
+            fn()
+            _record(name, "ok", time.perf_counter() - start)
+        except Exception as e:
+            _record(name, "error", time.perf_counter() - start, str(e))
+            print(f"  [Warmup] {name} 실패: {e}", flush=True)
+            failed = name
+
+
+# ─────────────────────────────────────────────────────────
+# 구성 요소별 단계
+# ─────────────────────────────────────────────────────────
+
+
+def _open_pool() -> None:
+    pool = retriever._get_connection_pool()
+    pool.wait(timeout=30)
+    with pool.connection() as conn:
+        conn.execute("SELECT 1").fetchone()
+
+
+def _build_indexes() -> None:
+    if retriever.SPARSE_WEIGHT > 0:
+        retriever._get_sparse_index()
+    retriever._get_scripture_index()
+    if retriever.RETRIEVER_BACKEND == "numpy":
+        retriever._get_memory_index()
+    if retriever.RETRIEVAL_GRANULARITY == "chunk":
+        retriever._chunk_search_available()
+
+
+def _warm_encoder() -> None:
+    model = retriever._get_embeddings_model()
+    model.embed_query(_WARMUP_TEXT)
+
+
+def _warm_reranker() -> None:
+    if retriever.RERANKER_ENABLED:
+        retriever._get_reranker().warm_up()
+
+
+def _warm_router() -> None:
+    query_router._get_classifier()
+    query_router._get_router_cache()
+
+
+def _warm_openai() -> None:
+    # 같은 클라이언트(httpx 연결 풀)를 요청에서 재사용하므로 여기서 연결을 미리 맺어 둔다
+    query_router._get_client().models.retrieve(query_router.ROUTER_MODEL)
+    answer_creator._get_client().models.retrieve(answer_creator.ANSWER_MODEL)
+
+
+def _warm_token_counter() -> None:
+    answer_creator._get_token_counter()
+
+
+def _groups(include_openai: bool) -> List[List[Tuple[str, Callable[[], Any]]]]:
+    groups = [
+        [("db_pool", _open_pool), ("indexes", _build_indexes)],
+        [("encoder", _warm_encoder), ("reranker", _warm_reranker)],
+        [("router", _warm_router), ("token_counter", _warm_token_counter)],
+    ]
+    if include_openai:
+        groups.append([("openai", _warm_openai)])
+    return groups
+
+
+# ─────────────────────────────────────────────────────────
+# 실행 / 상태
+# ─────────────────────────────────────────────────────────
+
+
+def _pending_groups(
+    groups: List[List[Tuple[str, Callable[[], Any]]]],
+) -> List[List[Tuple[str, Callable[[], Any]]]]:
+    return [g for g in groups if not all(_component_ok(name) for name, _ in g)]
+
+
+def _run_groups(groups: List[List[Tuple[str, Callable[[], Any]]]]) -> None:
+    with ThreadPoolExecutor(max_workers=len(groups), thread_name_prefix="warmup") as executor:
+        list(executor.map(_run_steps, groups))
+
+
+def _finalize(total: Optional[float] = None) -> str:
+    """구성 요소 결과로 상태 결정 (ready / degraded / failed)."""
+    with _lock:
+        components = _state["components"]
+        critical_ok = all(
+            components.get(name, {}).get("status") == "ok"
+            for name in CRITICAL_COMPONENTS
+            if name in components
+        )
+        all_ok = all(c["status"] == "ok" for c in components.values())
+        status = "ready" if all_ok else ("degraded" if critical_ok else "failed")
+        _state.update(status=status, finished_at=_now_iso())
+        if total is not None:
+            _state["total_seconds"] = round(total, 3)
+        return status
+
+
+def _retry_loop(groups: List[List[Tuple[str, Callable[[], Any]]]]) -> None:
+    """실패한 구성 요소를 백오프 간격으로 다시 실행 (모두 성공하거나 종료 요청까지)."""
+    delay = WARMUP_RETRY_INITIAL_SECONDS
+    attempt = 0
+    while True:
+        attempt += 1
+        with _lock:
+            _state["retry"] = {"attempt": attempt, "next_in_seconds": round(delay, 1)}
+        if _retry_stop.wait(delay):
+            return
+        pending = _pending_groups(groups)
+        if pending:
+            _run_groups(pending)
+        status = _finalize()
+        failed = [k for k, v in get_warmup_status()["components"].items() if v["status"] != "ok"]
+        print(f"[Warmup] 재시도 {attempt}: {status}" + (f" (실패: {', '.join(failed)})" if failed else ""), flush=True)
+        if status == "ready":
+            with _lock:
+                _state["retry"] = None
+            return
+        delay = min(delay * 2, WARMUP_RETRY_MAX_SECONDS)
+
+
+def run_warmup(include_openai: bool = True) -> Dict[str, Any]:
+    """
+    워밍업 실행 (블로킹). 그룹별 스레드에서 병렬 실행 후 결과 상태를 반환.
+    실패한 구성 요소가 있으면 백그라운드 재시도 스레드를 시작한다.
+
+    Args:
+        include_openai: OpenAI 연결 워밍업 여부 (오프라인 개발 환경에서는 False)
+    """
+    global _retry_thread
+    with _lock:
+        if _state["status"] == "running":
+            return get_warmup_status()
+        _state.update(status="running", started_at=_now_iso(), finished_at=None, components={}, retry=None)
+
+    start = time.perf_counter()
+    print("[Warmup] 시작", flush=True)
+    groups = _groups(include_openai)
+    _run_groups(groups)
+    total = time.perf_counter() - start
+    status = _finalize(total)
+
+    with _lock:
+        breakdown = ", ".join(f"{k}={v['seconds']:.2f}s" for k, v in _state["components"].items())
+    print(f"[Warmup] {status} ({total:.2f}s: {breakdown})", flush=True)
+
+    if status != "ready" and WARMUP_RETRY_INITIAL_SECONDS > 0:
+        _retry_stop.clear()
+        _retry_thread = threading.Thread(
+            target=_retry_loop, args=(groups,), name="warmup-retry", daemon=True
+        )
+        _retry_thread.start()
+    return get_warmup_status()
+
+
+def stop_warmup_retries() -> None:
+    """재시도 스레드 종료 (서버 종료 시)."""
+    _retry_stop.set()
+
+
+def skip_warmup() -> None:
+    """워밍업을 하지 않는 설정 (지연 초기화 그대로, /ready는 즉시 성공)."""
+    with _lock:
+        _state.update(status="skipped", started_at=_now_iso(), finished_at=_now_iso(), total_seconds=0.0)
+
+
+def is_ready() -> bool:
+    """필수 구성 요소가 준비됐는지 (부가 요소만 실패한 degraded도 ready로 본다)."""
+    with _lock:
+        return _state["status"] in ("ready", "degraded", "skipped")
+
+
+def get_warmup_status() -> Dict[str, Any]:
+    """워밍업 상태 + 구성 요소별 소요 시간 (/ready 응답)."""
+    with _lock:
+        status = dict(_state)
+        status["components"] = {k: dict(v) for k, v in _state["components"].items()}
+        status["retry"] = dict(_state["retry"]) if _state["retry"] else None
+    return status